@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Full-stack throughput benchmark: a whole game played by scripted input.
+
+The real GameApp/TestGameApp loop runs headless (SDL dummy drivers) on a
+fixed-timestep clock: pygame.time.get_ticks/set_timer/delay and the frame
+clock of the scene loop are replaced by a virtual clock that advances by
+--step-ms on every presented frame (pygame.display.update/flip), so the
+game runs at full speed and the same seed and input give the same game. Input is posted as real pygame events
+(MOUSEBUTTONDOWN/UP, KEYDOWN, QUIT) at frame boundaries, either by a bot
+that plays by the rules or from a script/replay file:
+
+    {"seed": 1, "app": "game", "board": 10, "step_ms": 16.667,
+     "events": [{"frame": 40, "type": "down", "pos": [420, 390]},
+                {"frame": 40, "type": "up", "pos": [420, 390]},
+                {"frame": 9000, "type": "quit"}]}
+
+Event types: down/up (left button at pos), key (pygame key name), quit.
+--record saves the bot's input in this format; replaying it reproduces the
+game (same final score). Score submission goes to a local dev_server.
+
+Run:
+    python benchmarks/autoplay.py --seed 7 --time-limit 60
+    python benchmarks/autoplay.py --test --record /tmp/test_game.json
+    python benchmarks/autoplay.py --replay /tmp/test_game.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # stdout is the JSON report
+_HOME = tempfile.mkdtemp(prefix="game_digits_autoplay_")
+os.environ['HOME'] = os.environ['USERPROFILE'] = _HOME
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_digits.dev_server import DevServer  # noqa: E402
+
+# Scores go to a local stand-in, never to the real API (read at import time)
+_server = DevServer().start()
+os.environ['GAME_DIGITS_API_URL'] = _server.url
+
+import pygame  # noqa: E402
+
+from game_digits import io_executor, scale, settings  # noqa: E402
+
+DIRECTIONS = ('up', 'down', 'left', 'right')
+
+
+def _percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+class VirtualClock:
+    """pygame.time stand-in that moves only when advance() is called."""
+
+    def __init__(self, step_ms):
+        self.step_ms = step_ms
+        self.now = 0.0
+        self._timers = {}  # event type -> [event, interval, due, loops left]
+
+    def get_ticks(self):
+        return int(self.now)
+
+    def set_timer(self, event, millis, loops=0):
+        if not isinstance(event, pygame.event.EventType):
+            event = pygame.event.Event(event)
+        if millis <= 0:
+            self._timers.pop(event.type, None)
+        else:
+            self._timers[event.type] = [event, millis, self.now + millis, loops]
+
+    def wait(self, millis=0):
+        return 0  # Time only moves with frames
+
+    def tick(self, framerate=0):
+        return int(self.step_ms)  # SceneManager.clock: no sleeping between frames
+
+    def advance(self):
+        """Next frame: move time on and post the timer events that came due."""
+        self.now += self.step_ms
+        for event_type, timer in list(self._timers.items()):
+            event, interval, due, loops = timer
+            while due <= self.now:
+                pygame.event.post(pygame.event.Event(event.type, event.dict))
+                due += interval
+                if loops:
+                    loops -= 1
+                    if not loops:
+                        del self._timers[event_type]
+                        break
+            timer[2], timer[3] = due, loops
+
+
+class Bot:
+    """Plays by the rules: removes a matching pair in line if there is one,
+    otherwise slides a random tile. Acts every THINK_MS of game time."""
+
+    THINK_MS = 150
+
+    def __init__(self, app, seed, result_ms):
+        self.app = app
+        self.rng = random.Random(seed)
+        self.result_ms = result_ms
+        self.next_action = 0
+        self.plan = []  # Pending clicks: ('tile', tile) or ('arrow', direction)
+        self.result_since = None
+
+    def events(self, frame, now, phase):
+        if phase == 'result':
+            if self.result_since is None:
+                self.result_since = now
+            if now - self.result_since >= self.result_ms:
+                return [{'type': 'quit'}]
+            return []
+        if now < self.next_action:
+            return []
+        if phase == 'menu':
+            menu = self.app.start_menu
+            if menu.state != 'idle':
+                return []
+            self.next_action = now + 1000
+            return self._click(menu.button_rect.center)
+        return self._play(now)
+
+    def _click(self, pos):
+        pos = [int(pos[0]), int(pos[1])]
+        return [{'type': 'down', 'pos': pos}, {'type': 'up', 'pos': pos}]
+
+    def _play(self, now):
+        app = self.app
+        if app.game.is_initializing or app.is_paused:
+            return []
+        if not self.plan:
+            self.plan = self._find_pair() or self._find_slide()
+            if not self.plan:
+                return []  # Nothing to do until a tile spawns or time runs out
+        kind, target = self.plan.pop(0)
+        if kind == 'tile':
+            if not target.alive() or target.is_moving:
+                self.plan = []
+                return []
+            x, y = target.rect.center
+        else:
+            arrow = next((a for a in app.arrows if a.direction == target), None)
+            if arrow is None:
+                self.plan = []
+                return []
+            x, y = arrow.rect.center
+        self.next_action = now + self.THINK_MS
+        return self._click((x + app.offset[0], y + app.offset[1]))
+
+    def _find_pair(self):
+        board = self.app.game.board
+        size = len(board)
+        for row in board:
+            for tile in row:
+                if tile is None or tile.is_moving:
+                    continue
+                r, c = tile.position
+                for dr, dc in ((0, 1), (1, 0)):
+                    rr, cc = r + dr, c + dc
+                    while rr < size and cc < size and board[rr][cc] is None:
+                        rr, cc = rr + dr, cc + dc
+                    if rr >= size or cc >= size:
+                        continue
+                    other = board[rr][cc]
+                    if not other.is_moving and (
+                            tile.number == other.number or tile.number + other.number == 10):
+                        return [('tile', tile), ('tile', other)]
+        return None
+
+    def _find_slide(self):
+        game = self.app.game
+        moves = [(tile, direction)
+                 for row in game.board for tile in row
+                 if tile is not None and not tile.is_moving
+                 for direction in DIRECTIONS if game.can_move(tile, direction)]
+        if not moves:
+            return None
+        tile, direction = self.rng.choice(moves)
+        return [('tile', tile), ('arrow', direction)]
+
+
+class Replay:
+    """Events from a script/replay file, posted at their frames."""
+
+    def __init__(self, events):
+        self.by_frame = {}
+        for event in events:
+            self.by_frame.setdefault(event['frame'], []).append(
+                {k: v for k, v in event.items() if k != 'frame'})
+
+    def events(self, frame, now, phase):
+        return self.by_frame.get(frame, [])
+
+
+def _to_pygame(event):
+    kind = event['type']
+    if kind == 'down':
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=tuple(event['pos']), button=1)
+    if kind == 'up':
+        return pygame.event.Event(pygame.MOUSEBUTTONUP, pos=tuple(event['pos']), button=1)
+    if kind == 'key':
+        return pygame.event.Event(pygame.KEYDOWN, key=pygame.key.key_code(event['key']), mod=0)
+    if kind == 'quit':
+        return pygame.event.Event(pygame.QUIT)
+    raise ValueError(f"Unknown event type: {kind}")
+
+
+class Driver:
+    """Hooks pygame's clock and display, posts input and times every frame."""
+
+    def __init__(self, app, clock, source, max_frames):
+        self.app = app
+        self.clock = clock
+        self.source = source
+        self.max_frames = max_frames
+        self.frame = 0
+        self.result = None
+        self.recorded = []
+        self.frame_times = {'menu': [], 'game': [], 'result': []}
+        self._last_present = None
+        self._saved = []
+
+    def phase(self):
+        # Scene on top: menu/settings, game/pause or result
+        name = self.app.scenes.top.name if len(self.app.scenes) else 'menu'
+        return {'settings': 'menu', 'pause': 'game'}.get(name, name)
+
+    def install(self):
+        present_update, present_flip = pygame.display.update, pygame.display.flip
+
+        def update(*args):
+            present_update(*args)
+            self._on_frame()
+
+        def flip():
+            present_flip()
+            self._on_frame()
+
+        patches = [
+            (pygame.time, 'get_ticks', self.clock.get_ticks),
+            (pygame.time, 'set_timer', self.clock.set_timer),
+            (pygame.time, 'delay', self.clock.wait),
+            (pygame.time, 'wait', self.clock.wait),
+            (pygame.display, 'update', update),
+            (pygame.display, 'flip', flip),
+            (self.app.scenes, 'clock', self.clock),
+        ]
+        for module, name, replacement in patches:
+            self._saved.append((module, name, getattr(module, name)))
+            setattr(module, name, replacement)
+
+        show_result_window = self.app.show_result_window
+
+        def show_result():
+            game = self.app.game
+            self.result = dict(game.get_stats(), score=game.score, remaining_time=game.current_time,
+                               frame=self.frame, game_ms=self.clock.get_ticks())
+            show_result_window()
+        self.app.show_result_window = show_result
+
+    def uninstall(self):
+        for module, name, original in reversed(self._saved):
+            setattr(module, name, original)
+        self._saved = []
+
+    def _on_frame(self):
+        now = time.perf_counter()
+        phase = self.phase()
+        if self._last_present is not None:
+            self.frame_times[phase].append((now - self._last_present) * 1000)
+        self._last_present = now
+
+        self.frame += 1
+        self.clock.advance()
+        events = list(self.source.events(self.frame, self.clock.now, phase))
+        if self.frame >= self.max_frames:
+            events.append({'type': 'quit'})
+        for event in events:
+            pygame.event.post(_to_pygame(event))
+            self.recorded.append(dict(frame=self.frame, **event))
+
+
+def _stats(values):
+    if not values:
+        return {"frames": 0}
+    return {
+        "frames": len(values),
+        "mean_ms": round(statistics.fmean(values), 4),
+        "min_ms": round(min(values), 4),
+        "p50_ms": round(_percentile(values, 50), 4),
+        "p95_ms": round(_percentile(values, 95), 4),
+        "p99_ms": round(_percentile(values, 99), 4),
+        "max_ms": round(max(values), 4),
+    }
+
+
+def play(app_kind, board, seed, step_ms, source_factory, time_limit=None, max_frames=200000):
+    """Run one game from the start menu to the result window.
+
+    Returns:
+        (report dict, recorded events)
+    """
+    settings.set_board_size(board)
+    scale.rescale()
+    random.seed(seed)  # Game seeds its own generator from random
+    clock = VirtualClock(step_ms)
+    # The clock must be in place before the app reads get_ticks()
+    saved_ticks = pygame.time.get_ticks
+    pygame.time.get_ticks = clock.get_ticks
+    try:
+        if app_kind == 'test':
+            from game_digits.test_app import TestGameApp
+            app = TestGameApp()
+        else:
+            from game_digits.app import GameApp
+            app = GameApp()
+    finally:
+        pygame.time.get_ticks = saved_ticks
+    if time_limit:
+        app.game.time_limit = app.game.current_time = time_limit
+
+    driver = Driver(app, clock, source_factory(app), max_frames)
+    driver.install()
+    wall_start = time.perf_counter()
+    try:
+        # The game's own prints (warnings) must not mix with the JSON report
+        with contextlib.redirect_stdout(sys.stderr):
+            app.run()
+    finally:
+        wall = time.perf_counter() - wall_start
+        driver.uninstall()
+        io_executor.shutdown(timeout=2.0)
+
+    all_frames = [t for times in driver.frame_times.values() for t in times]
+    report = {
+        "meta": {
+            "app": app_kind,
+            "board": board,
+            "seed": seed,
+            "step_ms": step_ms,
+            "scale": settings.get_scale(),
+            "python": sys.version.split()[0],
+            "pygame": pygame.version.ver,
+        },
+        "frames": driver.frame,
+        "wall_s": round(wall, 3),
+        "fps": round(driver.frame / wall, 1) if wall else 0.0,
+        "game_ms": clock.get_ticks(),
+        "frame_time": _stats(all_frames),
+        "phases": {phase: _stats(times) for phase, times in driver.frame_times.items()},
+        "result": driver.result,
+    }
+    return report, driver.recorded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play a whole game headless with scripted input")
+    parser.add_argument('--test', action='store_true', help="TestGameApp (6 tiles) instead of GameApp")
+    parser.add_argument('--board', type=int, default=settings.DEFAULT_BOARD_SIZE,
+                        choices=settings.get_all_board_sizes())
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--step-ms', type=float, default=1000 / 60, help="game time per frame")
+    parser.add_argument('--time-limit', type=int, default=None, help="game length in seconds")
+    parser.add_argument('--result-ms', type=int, default=6000,
+                        help="game time the bot stays in the result window")
+    parser.add_argument('--max-frames', type=int, default=200000, help="quit after this many frames")
+    parser.add_argument('--replay', default=None, help="script/replay file to play instead of the bot")
+    parser.add_argument('--record', default=None, help="save the posted input as a replay file")
+    parser.add_argument('--output', default=None, help="write the JSON report to a file")
+    args = parser.parse_args()
+
+    app_kind = 'test' if args.test else 'game'
+    board, seed, step_ms, time_limit = args.board, args.seed, args.step_ms, args.time_limit
+    if args.replay:
+        with open(args.replay, encoding='utf-8') as f:
+            script = json.load(f)
+        # The file fixes everything the game depends on
+        app_kind = script.get('app', app_kind)
+        board = script.get('board', board)
+        seed = script.get('seed', seed)
+        step_ms = script.get('step_ms', step_ms)
+        time_limit = script.get('time_limit', time_limit)
+        replay = Replay(script['events'])
+        source_factory = lambda app: replay  # noqa: E731
+    else:
+        source_factory = lambda app: Bot(app, seed, args.result_ms)  # noqa: E731
+
+    try:
+        report, recorded = play(app_kind, board, seed, step_ms, source_factory,
+                                time_limit, args.max_frames)
+    finally:
+        _server.stop()
+        shutil.rmtree(_HOME, ignore_errors=True)
+
+    if args.record:
+        script = {"app": app_kind, "board": board, "seed": seed, "step_ms": step_ms,
+                  "time_limit": time_limit, "events": recorded}
+        Path(args.record).write_text(json.dumps(script, indent=1) + "\n", encoding='utf-8')
+
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding='utf-8')
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Headless rendering/logic benchmarks (SDL dummy video and audio drivers).
+
+Every case is timed `number` calls per sample, `repeat` samples; the JSON
+report lists min/median/mean/stddev per call in milliseconds. The random
+module is seeded and ~/.game_digits is redirected to a temporary directory,
+so runs are repeatable and never touch real records. Generated surfaces are
+cached in memory only (no asset bundle on disk); the cold cases empty that
+cache before every sample.
+
+Cases:
+    tiles_full_board     Tile() for every cell of the board
+    background_surface   create_background_surface() for the tile field, not cached
+    game_frame_moving    GameApp.update_moving_tiles() + update_display() + present
+                         with --moving tiles sliding
+    rank_badges_cold     draw_rank_badge() for all ranks, empty badge caches
+    rank_badges_warm     the same with cached badges (legendary shine redrawn)
+    result_window        ResultWindow._draw_window() in its final state (over the
+                         game frame kept by the window)
+    confetti_peak        ConfettiSystem update + draw at peak particle count
+    records_load         load_records() re-reading the file
+    records_save         RecordsRepository.save() + flush to disk
+    patterns             every appearance pattern generated from scratch
+
+Run:
+    python benchmarks/bench.py --output baseline.json
+    python benchmarks/bench.py --baseline baseline.json --threshold 10
+    python benchmarks/bench.py --only rank_badges_cold,confetti_peak --repeat 30
+"""
+import argparse
+import atexit
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # stdout is the JSON report
+# Records and settings go to a throwaway home (paths are read at import time)
+_HOME = tempfile.mkdtemp(prefix="game_digits_bench_")
+os.environ['HOME'] = os.environ['USERPROFILE'] = _HOME
+atexit.register(shutil.rmtree, _HOME, ignore_errors=True)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pygame  # noqa: E402
+
+from game_digits import asset_cache, patterns, ranks, records, scale, settings, storage  # noqa: E402
+from game_digits.app import GameApp  # noqa: E402
+from game_digits.constants import COLORS, create_background_surface  # noqa: E402
+from game_digits.game import Game  # noqa: E402
+from game_digits.sprites import Arrow, ConfettiSystem, Tile  # noqa: E402
+from game_digits.windows.result_window import ResultWindow  # noqa: E402
+
+SEED = 12345
+CONFETTI_PEAK = 300  # start() burst + spawning at its busiest
+
+
+def measure(fn, setup=None, repeat=20, number=5):
+    """Time fn() `number` times per sample; returns per-call stats in ms."""
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number * 1000)
+    return {
+        "min_ms": round(min(samples), 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "stddev_ms": round(statistics.stdev(samples), 4) if len(samples) > 1 else 0.0,
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+# -- cases ------------------------------------------------------------------
+# Each case takes (app, args) and returns (fn, setup, number).
+
+def case_tiles_full_board(app, args):
+    size = app.board_size
+    cells = [((row, col), random.randint(1, 9)) for row in range(size) for col in range(size)]
+
+    def run():
+        for position, number in cells:
+            Tile(number, position, COLORS[number])
+    return run, None, 1
+
+
+def case_background_surface(app, args):
+    size = app.tile_surface.get_width()
+    return (lambda: create_background_surface(size, size)), asset_cache.clear_memory, 1
+
+
+def _place_sliding_tiles(app, count):
+    """Fresh board with `count` tiles in the left column(s), all sliding right."""
+    app.arrows.empty()
+    app.tiles.empty()
+    app.score_popups.empty()
+    app.motion.clear()
+    app.game = Game(app.tiles, board_size=app.board_size, seed=SEED)
+    app.game.is_initializing = False
+    size = app.board_size
+    placed = []
+    for i in range(count):
+        row, col = i % size, i // size
+        number = app.game.rng.randint(1, 9)
+        tile = Tile(number, (row, col), COLORS[number])
+        app.game.board[row][col] = tile
+        app.tiles.add(tile)
+        placed.append(tile)
+    # Rightmost tile of each row first, so every one of them has room to slide
+    for tile in reversed(placed):
+        arrow = Arrow('right', app.get_arrow_position(tile.rect.topleft, 'right'), app.game, tile)
+        app.arrows.add(arrow)
+        app.handle_mouse_click(arrow.rect.center)
+
+
+def case_game_frame_moving(app, args):
+    count = min(args.moving, app.board_size * (app.board_size - 1))
+
+    def run():
+        app.update_moving_tiles()
+        app.update_display()
+        pygame.display.update()
+    return run, (lambda: _place_sliding_tiles(app, count)), 10
+
+
+def case_rank_badges_cold(app, args):
+    surface = pygame.Surface((scale.scaled(400), scale.scaled(60)), pygame.SRCALPHA)
+    rect = (surface.get_width() // 2, surface.get_height() // 2, scale.scaled(220), scale.scaled(30))
+
+    def run():
+        for _, name, fg, bg in ranks.RANKS:
+            ranks.draw_rank_badge(surface, rect, name, fg, bg, time_ms=1000)
+
+    def setup():
+        ranks.clear_badge_cache()
+        asset_cache.clear_memory()
+    return run, setup, 1
+
+
+def case_rank_badges_warm(app, args):
+    run, _, _ = case_rank_badges_cold(app, args)
+    run()  # Fill the cache
+    return run, None, 5
+
+
+def case_result_window(app, args):
+    app.draw_background()
+    window = ResultWindow(app.screen, app.screen.get_size(), 1500, 120,
+                          app.screen.copy(), test_mode=True)
+    return (lambda: window._draw_window(rows_to_show=3, current_total=window.total_score)), None, 5
+
+
+def case_confetti_peak(app, args):
+    width, height = app.screen.get_size()
+    confetti = ConfettiSystem(width, height)
+    surface = app.screen
+
+    def setup():
+        random.seed(SEED)
+        confetti.particles.clear()
+        confetti.start()
+        confetti._spawn_burst(CONFETTI_PEAK - 100)
+
+    def run():
+        confetti.update()
+        confetti.draw(surface)
+    return run, setup, 5
+
+
+def _sample_records():
+    return [{'score': 2000 - i * 150, 'bonus': 300 + i, 'total': 2300 - i * 149,
+             'date': '01.01.2026', 'rank': ranks.get_rank_name(2300 - i * 149)}
+            for i in range(records.MAX_RECORDS)]
+
+
+def case_records_load(app, args):
+    repo = records.get_repository(test_mode=True)
+    repo.replace(_sample_records())
+    storage.flush()
+
+    def setup():
+        repo._loaded = False  # Force a re-read of the file
+    return (lambda: records.load_records(test_mode=True)), setup, 1
+
+
+def case_records_save(app, args):
+    repo = records.get_repository(test_mode=True)
+    repo.replace(_sample_records())
+    storage.flush()
+
+    def run():
+        repo.save()
+        storage.flush()
+    return run, None, 1
+
+
+def case_patterns(app, args):
+    size = app.board_size
+
+    def run():
+        for _, pattern_func in patterns.ALL_PATTERNS:
+            tuple(pattern_func(size))
+    return run, None, 1
+
+
+CASES = {
+    'tiles_full_board': case_tiles_full_board,
+    'background_surface': case_background_surface,
+    'game_frame_moving': case_game_frame_moving,
+    'rank_badges_cold': case_rank_badges_cold,
+    'rank_badges_warm': case_rank_badges_warm,
+    'result_window': case_result_window,
+    'confetti_peak': case_confetti_peak,
+    'records_load': case_records_load,
+    'records_save': case_records_save,
+    'patterns': case_patterns,
+}
+
+
+def run_suite(args):
+    settings.set_board_size(args.board)
+    scale.rescale()
+    asset_cache.set_persistent(False)
+    random.seed(SEED)
+    app = GameApp(board_size=args.board)
+
+    names = args.only.split(',') if args.only else list(CASES)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        raise SystemExit(f"Unknown case(s): {', '.join(unknown)}; known: {', '.join(CASES)}")
+
+    results = {}
+    for name in names:
+        random.seed(SEED)
+        fn, setup, number = CASES[name](app, args)
+        fn()  # Warm-up: imports, font cache, first-call allocations
+        results[name] = measure(fn, setup, repeat=args.repeat, number=number)
+        print(f"{name:<20} median {results[name]['median_ms']:9.4f} ms", file=sys.stderr)
+    storage.flush()
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "sdl": ".".join(map(str, pygame.get_sdl_version())),
+            "platform": platform.platform(),
+            "board": args.board,
+            "moving": args.moving,
+            "scale": settings.get_scale(),
+            "window": list(app.screen.get_size()),
+            "seed": SEED,
+        },
+        "cases": results,
+    }
+
+
+def compare(result, baseline, threshold):
+    """Per-case median change against a baseline report. Returns the regressions."""
+    comparison = {}
+    regressions = []
+    for name, stats in result["cases"].items():
+        base = baseline.get("cases", {}).get(name)
+        if base is None or not base.get("median_ms"):
+            comparison[name] = {"status": "new"}
+            continue
+        change = (stats["median_ms"] - base["median_ms"]) / base["median_ms"] * 100
+        # Within the noise of either run: not a regression, whatever the percentage
+        noise = max(stats["stddev_ms"], base.get("stddev_ms", 0.0))
+        slower = change > threshold and stats["median_ms"] - base["median_ms"] > noise
+        faster = change < -threshold and base["median_ms"] - stats["median_ms"] > noise
+        status = "slower" if slower else "faster" if faster else "same"
+        comparison[name] = {
+            "baseline_median_ms": base["median_ms"],
+            "median_ms": stats["median_ms"],
+            "change_pct": round(change, 1),
+            "status": status,
+        }
+        if slower:
+            regressions.append(name)
+    return comparison, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless benchmarks for Game-digits")
+    parser.add_argument('--repeat', type=int, default=20, help="samples per case")
+    parser.add_argument('--board', type=int, default=settings.DEFAULT_BOARD_SIZE,
+                        choices=settings.get_all_board_sizes())
+    parser.add_argument('--moving', type=int, default=10, help="sliding tiles in game_frame_moving")
+    parser.add_argument('--only', default=None, help="comma-separated case names")
+    parser.add_argument('--output', default=None, help="write the JSON report to a file")
+    parser.add_argument('--baseline', default=None, help="compare medians with a saved report")
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help="median slowdown in %% counted as a regression")
+    args = parser.parse_args()
+    if args.repeat < 2:
+        parser.error("--repeat must be at least 2")
+
+    result = run_suite(args)
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        result["comparison"], regressions = compare(result, baseline, args.threshold)
+        if regressions:
+            print(f"Regressions over {args.threshold}%: {', '.join(regressions)}", file=sys.stderr)
+            exit_code = 1
+
+    text = json.dumps(result, indent=2, sort_keys=True)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding='utf-8')
+    print(text)
+    pygame.quit()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
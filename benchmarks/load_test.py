@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Load test for score submission against the local stand-in server.
+
+Modes:
+    direct  - many simulated clients upsert concurrently through
+              SupabaseClient (keep-alive per worker, or --no-keepalive)
+    outbox  - scores go through ScoreOutbox + ScoreUploader, the same
+              queue/retry path the game uses
+
+Run:
+    python benchmarks/load_test.py --clients 5000 --concurrency 64
+    python benchmarks/load_test.py --error-rate 0.1 --drop-rate 0.02 --latency 0.01
+    python benchmarks/load_test.py --mode outbox --clients 200 --error-rate 0.2
+    python benchmarks/load_test.py --url http://127.0.0.1:8787   # external server
+"""
+import argparse
+import atexit
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Player id, outbox and log go to a throwaway home (paths are read at import time)
+_HOME = tempfile.mkdtemp(prefix="game_digits_load_")
+os.environ['HOME'] = os.environ['USERPROFILE'] = _HOME
+atexit.register(shutil.rmtree, _HOME, ignore_errors=True)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_digits import api_client  # noqa: E402
+from game_digits import io_executor  # noqa: E402
+from game_digits.dev_server import DevServer  # noqa: E402
+
+
+def _percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+def _payload(i):
+    score = random.randint(300, 3000)
+    return {"player_id": f"load-{i}", "name": f"Bot {i}", "score": score,
+            "game_score": score - 300, "time_bonus": 300, "remaining_time": 0}
+
+
+def run_direct(url, args):
+    """Every simulated client submits one score, retrying like the game does."""
+    local = threading.local()
+    clients = []
+    clients_lock = threading.Lock()
+    latencies = []
+    retries = [0]
+    failures = [0]
+    stats_lock = threading.Lock()
+
+    def get_client():
+        if args.no_keepalive or not hasattr(local, 'client'):
+            client = api_client.SupabaseClient(url, args.api_key or api_client.SUPABASE_KEY, timeout=10)
+            with clients_lock:
+                clients.append(client)
+            if args.no_keepalive:
+                return client
+            local.client = client
+        return local.client
+
+    def submit(i):
+        payload = _payload(i)
+        attempt = 0
+        start = time.perf_counter()
+        while True:
+            client = get_client()
+            try:
+                client.upsert_score(payload)
+                break
+            except Exception as e:
+                if not api_client._is_retryable(e) or attempt >= args.max_retries:
+                    with stats_lock:
+                        failures[0] += 1
+                    return
+                attempt += 1
+                with stats_lock:
+                    retries[0] += 1
+                time.sleep(random.uniform(0, min(args.backoff_max, args.backoff_base * 2 ** attempt)))
+            finally:
+                if args.no_keepalive:
+                    client.close()
+        with stats_lock:
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(submit, range(args.clients)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": "direct",
+        "clients": args.clients,
+        "concurrency": args.concurrency,
+        "keepalive": not args.no_keepalive,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0,
+        "ok": len(latencies),
+        "failed": failures[0],
+        "retries": retries[0],
+        "connections": sum(c.connects for c in clients),
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 50) * 1000, 2),
+            "p95": round(_percentile(latencies, 95) * 1000, 2),
+            "p99": round(_percentile(latencies, 99) * 1000, 2),
+            "mean": round(statistics.fmean(latencies) * 1000, 2) if latencies else 0,
+        },
+    }
+
+
+def run_outbox(url, args):
+    """Queue scores in a temporary outbox and time how long the uploader takes to drain it."""
+    api_client.BACKOFF_BASE = args.backoff_base
+    api_client.BACKOFF_MAX = args.backoff_max
+    with tempfile.TemporaryDirectory() as tmp:
+        outbox = api_client.ScoreOutbox(Path(tmp) / "outbox.jsonl")
+        client = api_client.SupabaseClient(url, args.api_key or api_client.SUPABASE_KEY, timeout=10)
+        uploader = api_client.ScoreUploader(outbox, client)
+
+        start = time.perf_counter()
+        for i in range(args.clients):
+            # Distinct player ids: each entry is a separate upsert
+            uploader._enqueue(_payload(i), None)
+        deadline = start + args.timeout
+        while len(outbox) and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        elapsed = time.perf_counter() - start
+        left = len(outbox)
+    io_executor.shutdown(timeout=1.0)
+    return {
+        "mode": "outbox",
+        "entries": args.clients,
+        "elapsed_s": round(elapsed, 3),
+        "delivered": args.clients - left,
+        "left_in_outbox": left,
+        "connections": client.connects,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score submission load test")
+    parser.add_argument('--mode', choices=['direct', 'outbox'], default='direct')
+    parser.add_argument('--url', default=None, help="server URL (default: start a local DevServer)")
+    parser.add_argument('--api-key', default=None)
+    parser.add_argument('--clients', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--no-keepalive', action='store_true', help="new connection per request")
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--drop-rate', type=float, default=0.0)
+    parser.add_argument('--max-retries', type=int, default=8)
+    parser.add_argument('--backoff-base', type=float, default=0.01)
+    parser.add_argument('--backoff-max', type=float, default=0.5)
+    parser.add_argument('--timeout', type=float, default=120.0, help="outbox mode: max drain time")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    server = None
+    url = args.url
+    if url is None:
+        server = DevServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                           drop_rate=args.drop_rate, seed=args.seed).start()
+        url = server.url
+
+    try:
+        result = run_outbox(url, args) if args.mode == 'outbox' else run_direct(url, args)
+    finally:
+        if server is not None:
+            result_server = {"stats": server.stats, "rows": len(server.store)}
+            server.stop()
+    if server is not None:
+        result["server"] = result_server
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 import sys
 from pathlib import Path
 
+# Версия игры (входит в отпечаток кэша сгенерированных поверхностей, см. asset_cache)
+__version__ = "1.0.0"
+
 
 def _get_base_path():
     """Возвращает базовый путь - для PyInstaller или обычного запуска."""
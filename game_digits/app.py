@@ -1,67 +1,69 @@
 import pygame
 
-from game_digits import get_image_path, get_font_path, get_sound_path
+from game_digits import get_image_path
+from game_digits import audio
+from game_digits import fonts
+from game_digits import instrument
+from game_digits import perf_hud
+from game_digits import resize
+from game_digits import scenes
 from game_digits import settings
+from game_digits import startup
 from game_digits import scale
 from game_digits import constants
 from game_digits.constants import (
-    COLORS, BOARD_SIZE,
+    COLORS,
     grid_to_pixel, pixel_to_grid, pixel_to_grid_round, create_background_surface
 )
 from game_digits.game import Game
+from game_digits.motion import MotionScheduler, speed_per_ms, GRID_VECTORS, ARRIVAL, COLLISION
 from game_digits.sprites import Arrow, ScorePopup
 from game_digits import ui_components as ui
-from game_digits.windows import ResultWindow, StartMenu, PauseOverlay
+from game_digits.windows import StartMenu, PauseOverlay
 
+# Доля экрана, которую может занять окно (остальное - заголовок окна и панель задач)
+DESKTOP_FILL = 0.9
 
-class GameApp:
-    def __init__(self):
-        self.frame = scale.FRAME_WIDTH
-        self.tile_size, self.gap = scale.TILE_SIZE, scale.GAP
-        # Вычисляем размеры окна из размера плиток
-        tile_area = BOARD_SIZE * scale.TILE_SIZE + (BOARD_SIZE + 1) * scale.GAP
-        self.HEIGHT = tile_area + 4 * self.frame
-        self.panel_width = scale.PANEL_WIDTH
-        self.WIDTH = self.HEIGHT + self.panel_width
-        self.window = self.HEIGHT - 2 * self.frame
-        self.panel_height = self.HEIGHT
+
+class GameApp(scenes.Scene):
+    """Окно игры и сцена партии.
+
+    run() запускает единственный главный цикл (scenes.SceneManager): меню,
+    партия, пауза и окна результата и настроек - сцены его стека.
+    """
+
+    # Режим (TestGameApp подменяет): заголовок окна и test_mode меню и окна
+    # результата - у тестового режима свои рекорды и история
+    CAPTION = "Игра цифры"
+    TEST_MODE = False
+
+    name = 'game'
+
+    def __init__(self, board_size=None):
+        self.board_size = board_size or settings.get_board_size()
         self.offset = (23, 23)
         self.COLORS = COLORS
-        pygame.mixer.pre_init(frequency=44100, size=-16, channels=1, buffer=256)
+        audio.pre_init()
         pygame.init()
-        # Загрузка звуков
-        self.sounds = {}
-        self._load_sounds()
-        # Жирные шрифты для UI панели
-        bold_cyrillic = get_font_path("2204.ttf")
-        self.font_bold_large = pygame.font.Font(bold_cyrillic, scale.FONT_PANEL_LABEL)   # "Время", "Очки"
-        self.font_bold_medium = pygame.font.Font(bold_cyrillic, scale.FONT_PANEL_PAUSE)  # "пауза"
-        self.font_bold_value = pygame.font.Font(bold_cyrillic, scale.FONT_PANEL_VALUE)   # цифры
+        # Звуки нужны только в игре: грузятся в фоне после первого кадра меню
+        self.audio = audio.get_audio()
+        startup.defer(self.audio.preload)
         # Состояние UI
         self.is_paused = False
         self.pause_button_rect = None
-        self.sound_enabled = True
         self.sound_button_rect = None
         # Для сохранения времени паузы
         self.pause_start_time = 0
         self.total_pause_time = 0
         self.paused_progress = 1.0  # Сохранённый прогресс при паузе
-        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
-        pygame.display.set_caption("Игра цифры")
-        self.icon = pygame.image.load(get_image_path("icon.png"))
-        pygame.display.set_icon(self.icon)
-        # Параметры для клеточного фона (как в школьной тетради)
-        self.grid_cell_size = scale.GRID_CELL_SIZE
+        self.screen = None
         self.grid_line_color = (218, 236, 241)  # Светло-голубые линии
         self.arrows = pygame.sprite.Group()
         self.tiles = pygame.sprite.Group()
         self.score_popups = pygame.sprite.Group()  # Анимация очков
-        self.game = Game(self.tiles)
-        tile_surface_size = self.HEIGHT - 4 * self.frame
-        self.tile_surface = pygame.Surface((tile_surface_size, tile_surface_size))
-        # Создаём фоновую текстуру с диагональной штриховкой
-        self.background_texture = create_background_surface(tile_surface_size, tile_surface_size)
-        self.tile_surface.blit(self.background_texture, (0, 0))
+        self.game = self.new_game()
+        # Планировщик движения плиток (аналитические столкновения)
+        self.motion = MotionScheduler()
         self.ADD_TILE_EVENT = pygame.USEREVENT + 1
         # Двухфазный таймер: опустошение + заполнение
         self.bar_empty_duration = 9800   # 9.8 секунд - бар пустеет
@@ -70,10 +72,17 @@ class GameApp:
         self.bar_phase_start = 0         # Время начала текущей фазы
         self.timer_running = False
         self.COUNTDOWN_EVENT = self.game.COUNTDOWN_EVENT
-        self.TILE_APPEAR_EVENT = self.game.TILE_APPEAR_EVENT
 
         # Game state: 'menu' or 'playing'
         self.state = 'menu'
+        # Стек сцен и главный цикл
+        self.scenes = scenes.SceneManager(on_resize=self._on_window_resized)
+        self.start_menu = None      # Меню и оверлей паузы создаёт _init_layout()
+        self.pause_overlay = None
+        # Конец партии и спавн по таймеру (проверяются в update() каждый кадр)
+        self.pending_tile_spawn = False      # Бар опустел, плитка ждёт спавна
+        self.prepare_to_show_result = False  # Все плитки убраны, ждём кадр
+        self.show_result = False             # Показать результат, когда анимации закончатся
 
         # Panel animation state
         self.panel_animation_start = 0
@@ -82,16 +91,114 @@ class GameApp:
         self.PANEL_ANIM_DURATION = 400  # ms for each element to slide in
         self.PANEL_ANIM_DELAY = 150     # ms delay between elements
 
-        # Create start menu
-        self.start_menu = StartMenu(
-            screen=self.screen,
-            screen_size=(self.WIDTH, self.HEIGHT),
-            redraw_background=self.draw_background_for_menu
-        )
+        # Окно, шрифты, фон, меню и оверлей паузы - всё, что зависит от масштаба
+        if self._fit_preset_to_desktop():
+            scale.rescale()
+        self._init_layout()
+        pygame.display.set_caption(self.CAPTION)
+        self.icon = pygame.image.load(get_image_path("icon.png"))
+        pygame.display.set_icon(self.icon)
 
-        # Create pause overlay
+    def _init_layout(self):
+        """Размеры окна и всё, что зависит от scale (вызывается и при смене масштаба)."""
+        self.frame = scale.FRAME_WIDTH
+        self.tile_size, self.gap = scale.TILE_SIZE, scale.GAP
+        # Вычисляем размеры окна из размера плиток
+        tile_area = self.board_size * scale.TILE_SIZE + (self.board_size + 1) * scale.GAP
+        self.HEIGHT = tile_area + 4 * self.frame
+        self.panel_width = scale.PANEL_WIDTH
+        self.WIDTH = self.HEIGHT + self.panel_width
+        self.window = self.HEIGHT - 2 * self.frame
+        self.panel_height = self.HEIGHT
+        # Жирные шрифты для UI панели
+        self.font_bold_large = fonts.get_font(fonts.BOLD_FONT, scale.FONT_PANEL_LABEL)   # "Время", "Очки"
+        self.font_bold_medium = fonts.get_font(fonts.BOLD_FONT, scale.FONT_PANEL_PAUSE)  # "пауза"
+        self.font_bold_value = fonts.get_font(fonts.BOLD_FONT, scale.FONT_PANEL_VALUE)   # цифры
+        # Повторный set_mode меняет размер существующего окна, а не создаёт новое
+        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.RESIZABLE)
+        resize.set_current((self.WIDTH, self.HEIGHT))
+        # Параметры для клеточного фона (как в школьной тетради)
+        self.grid_cell_size = scale.GRID_CELL_SIZE
         tile_surface_size = self.HEIGHT - 4 * self.frame
-        self.pause_overlay = PauseOverlay(tile_surface_size, tile_surface_size)
+        self.tile_surface = pygame.Surface((tile_surface_size, tile_surface_size))
+        # Создаём фоновую текстуру с диагональной штриховкой
+        self.background_texture = create_background_surface(tile_surface_size, tile_surface_size)
+        self.tile_surface.blit(self.background_texture, (0, 0))
+
+        # Меню и оверлей паузы перестраиваются на месте: они могут лежать в стеке сцен
+        if self.start_menu is None:
+            self.start_menu = StartMenu(
+                screen=self.screen,
+                screen_size=(self.WIDTH, self.HEIGHT),
+                redraw_background=self.draw_background_for_menu,
+                test_mode=self.TEST_MODE
+            )
+        else:
+            self.start_menu.set_layout(self.screen, (self.WIDTH, self.HEIGHT))
+
+        # Create pause overlay (над полем)
+        if self.pause_overlay is None:
+            self.pause_overlay = PauseOverlay(tile_surface_size, tile_surface_size,
+                                              offset=(2 * self.frame, 2 * self.frame))
+        else:
+            self.pause_overlay.set_layout(tile_surface_size, tile_surface_size,
+                                          offset=(2 * self.frame, 2 * self.frame))
+
+    def _fit_preset_to_desktop(self):
+        """Масштаб пресета, уменьшенный, если окно с этим полем не помещается на экран.
+
+        Нужно полям "марафона": 32 клетки при масштабе 1.0 - больше 2000 пикселей.
+
+        Returns:
+            bool: True если масштаб пришлось уменьшить
+        """
+        settings.clear_custom_scale()
+        desktops = pygame.display.get_desktop_sizes()
+        if not desktops:
+            return False
+        width, height = desktops[0]
+        fit = scale.fit_scale(width * DESKTOP_FILL, height * DESKTOP_FILL, self.board_size)
+        if fit >= settings.get_scale():
+            return False
+        settings.set_custom_scale(fit)
+        return True
+
+    def apply_scale(self, window_size=None):
+        """Применить новый масштаб без перезапуска pygame.
+
+        Пересчитывает scale (подписчики сбрасывают кэши шрифтов, стрелок,
+        значков), перестраивает раскладку в том же окне и перерисовывает
+        плитки. Звук и окно не пересоздаются.
+
+        Args:
+            window_size: Размер окна, растянутого пользователем - масштаб
+                подбирается под него. None - масштаб пресета из настроек
+                (уменьшенный, если поле не помещается на экран).
+        """
+        if window_size is None:
+            self._fit_preset_to_desktop()
+        else:
+            settings.set_custom_scale(scale.fit_scale(*window_size, self.board_size))
+        scale.rescale()
+        self._init_layout()
+        for tile in self.tiles:
+            tile.rescale()
+        self.arrows.empty()
+        self.score_popups.empty()
+        self._refresh_selected_tile_arrows()
+
+    def _on_window_resized(self):
+        """Окно растянуто мышью и размер устоялся (SceneManager, под любой сценой).
+
+        Returns:
+            bool: True если масштаб применён - сцены стека перестроит SceneManager
+        """
+        # Траектории посчитаны в пикселях: пока плитка едет, масштаб не меняем.
+        # Уезжающее меню доигрывает анимацию в старой раскладке
+        if len(self.motion) or (self.state == 'menu' and self.start_menu.state == 'exiting'):
+            return False
+        self.apply_scale(resize.poll())
+        return True
 
     def _draw_frame(self):
         """Draw common background elements: grid, frame, blue panel, game field."""
@@ -138,18 +245,10 @@ class GameApp:
     def draw_background(self):
         """Draw full game background with UI elements."""
         self._draw_frame()
-
-        # Draw pause overlay if game is paused
-        if self.is_paused:
-            self._draw_pause_overlay()
+        perf_hud.mark('update_display')
 
         self.draw_score_and_timer_window()
-
-    def _draw_pause_overlay(self):
-        """Draw animated overlay over game field when paused."""
-        field_x = 2 * self.frame
-        field_y = 2 * self.frame
-        self.pause_overlay.draw(self.screen, field_x, field_y)
+        perf_hud.mark('draw_score_and_timer_window')
 
     def draw_background_for_menu(self):
         """Draw background for menu (without UI panel elements)."""
@@ -227,7 +326,7 @@ class GameApp:
                 self.screen,
                 (sound_icon_x, sound_icon_y),
                 scale.SOUND_ICON_SIZE,
-                sound_enabled=self.sound_enabled
+                sound_enabled=self.audio.enabled
             )
             # Сохраняем rect для обработки кликов
             self.sound_button_rect = pygame.Rect(
@@ -322,49 +421,33 @@ class GameApp:
             ui.draw_sun_icon(self.screen, (icon_x + scale.ICON_SIZE // 2, score_icon_y + scale.ICON_SIZE // 2), scale.ICON_SIZE)
 
     def show_result_window(self):
-        """Display the game result window with final score.
+        """Push the game result window with final score over the game."""
+        from game_digits.windows import ResultWindow  # Loaded on first use (or preloaded)
 
-        Returns:
-            str: 'new_game', 'menu', or None
-        """
-        def redraw_background():
-            """Callback to redraw game scene before result window."""
-            self.tile_surface.blit(self.background_texture, (0, 0))
-            for popup in self.score_popups:
-                popup.draw(self.tile_surface)
-            self.draw_background()
+        # Под окном - поле без плиток: окно держит снимок сцены игры (и снимает
+        # новый, когда окно растянули), а плитки партии больше не нужны
+        game_stats = self.game.get_stats()
+        self.tiles.empty()
+        self.arrows.empty()
 
         result_window = ResultWindow(
             screen=self.screen,
             screen_size=(self.WIDTH, self.HEIGHT),
             game_score=self.game.score,
             current_time=self.game.current_time,
-            redraw_callback=redraw_background,
-            play_sound_callback=self.play_sound
+            play_sound_callback=self.play_sound,
+            game_stats=game_stats,
+            test_mode=self.TEST_MODE
         )
-        return result_window.show()
-
-    def _load_sounds(self):
-        """Загрузка звуковых эффектов."""
-        sound_files = {
-            'remove': 'remove.wav',
-            'spawn': 'spawn.wav',
-            'celebration': 'celebration.wav',
-        }
-        for name, filename in sound_files.items():
-            try:
-                path = get_sound_path(filename)
-                self.sounds[name] = pygame.mixer.Sound(path)
-            except (pygame.error, FileNotFoundError):
-                self.sounds[name] = None  # Звук не найден - игра работает без него
+        self.scenes.push(result_window, on_finish=self._on_result_finished)
+
+    def new_game(self):
+        """Новая партия: расстановка и лимит времени режима (TestGameApp - 6 плиток)."""
+        return Game(self.tiles, board_size=self.board_size)
 
     def play_sound(self, name):
         """Воспроизвести звук по имени."""
-        if not self.sound_enabled:
-            return
-        sound = self.sounds.get(name)
-        if sound:
-            sound.play()
+        self.audio.play(name)
 
     def reset_game(self):
         """Reset the game state to start a new game."""
@@ -372,9 +455,10 @@ class GameApp:
         self.arrows.empty()
         self.tiles.empty()
         self.score_popups.empty()
+        self.motion.clear()
 
         # Reset game state
-        self.game = Game(self.tiles)
+        self.game = self.new_game()
 
         # Reset timer state
         self.timer_running = False
@@ -384,26 +468,23 @@ class GameApp:
         self.pause_start_time = 0
         self.total_pause_time = 0
         self.paused_progress = 1.0
+        self.pending_tile_spawn = False
+        self.prepare_to_show_result = False
+        self.show_result = False
 
-        # Recreate background texture
-        tile_surface_size = self.HEIGHT - 4 * self.frame
-        self.background_texture = create_background_surface(tile_surface_size, tile_surface_size)
+        # Фон поля между партиями не меняется - текстура из раскладки окна
         self.tile_surface.blit(self.background_texture, (0, 0))
 
         # Start tile appearance animation
         self.game.start_tile_appearance()
 
     def handle_event(self, event):
-        if event.type == pygame.QUIT:
-            return False
-
-        # Обработка движения мыши для hover-эффекта кнопки "В меню"
-        elif event.type == pygame.MOUSEMOTION:
-            if self.is_paused:
-                self.pause_overlay.handle_mouse_move(event.pos)
+        """События партии (на паузе - клики по панели, мимо оверлея)."""
+        if event.type == self.COUNTDOWN_EVENT:
+            self.game.handle_countdown()
 
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            pos = pygame.mouse.get_pos()
+            pos = event.pos  # Позиция на момент клика (и у событий, посланных скриптом)
 
             # Проверяем нажатие на кнопку паузы
             if self.pause_button_rect and self.pause_button_rect.collidepoint(pos):
@@ -412,30 +493,30 @@ class GameApp:
 
             # Проверяем нажатие на иконку звука
             if self.sound_button_rect and self.sound_button_rect.collidepoint(pos):
-                self.sound_enabled = not self.sound_enabled
+                self.audio.toggle()
+                if self.is_paused:
+                    # Иконка звука изменилась: новый снимок панели под оверлеем
+                    self.pause_overlay.background = self.scenes.snapshot(self)
                 return True
 
-            # Обработка клика на паузе
+            # На паузе поле закрыто оверлеем
             if self.is_paused:
-                # Проверяем нажатие на кнопку "В меню"
-                self.pause_overlay.handle_mouse_down(pos)
                 return True
 
             # Block interaction during tile appearance animation
             if self.game.is_initializing:
                 return True
 
+            # Время вышло: ждём остановки плиток и показываем результат,
+            # новые ходы отодвигали бы его бесконечно
+            if self.show_result:
+                return True
+
             pos = (pos[0] - self.offset[0], pos[1] - self.offset[1])
             self.handle_mouse_click(pos)
 
-        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            if self.is_paused:
-                pos = pygame.mouse.get_pos()
-                # Проверяем клик на кнопку "В меню"
-                if self.pause_overlay.handle_mouse_up(pos):
-                    # Возврат в главное меню
-                    return 'menu'
-
+        else:
+            return False
         return True
 
     def toggle_pause(self):
@@ -445,20 +526,15 @@ class GameApp:
         if self.is_paused:
             # Остановка игры
             self.pause_start_time = pygame.time.get_ticks()
-            # Запускаем анимацию паузы
-            self.pause_overlay.start()
             # Сохраняем текущий прогресс
-            if self.timer_running:
-                elapsed = pygame.time.get_ticks() - self.bar_phase_start
-                if self.bar_phase == 'emptying':
-                    self.paused_progress = max(0, 1 - elapsed / self.bar_empty_duration)
-                elif self.bar_phase == 'waiting_spawn':
-                    self.paused_progress = 0
-                else:  # filling
-                    self.paused_progress = min(1, elapsed / self.bar_fill_duration)
+            self._save_bar_progress()
             # Останавливаем таймер обратного отсчёта
             pygame.time.set_timer(self.COUNTDOWN_EVENT, 0)
+            # Оверлей паузы - сцена поверх игры: партия не обновляется
+            self._show_pause()
         else:
+            if self.scenes.top is self.pause_overlay:
+                self.scenes.pop()
             # Возобновление игры
             pause_duration = pygame.time.get_ticks() - self.pause_start_time
             self.total_pause_time += pause_duration
@@ -467,6 +543,13 @@ class GameApp:
             if self.timer_running:
                 self.bar_phase_start += pause_duration
 
+            # Сдвигаем движение плиток, появление плиток и выезд панели на время паузы
+            self.motion.shift(pause_duration)
+            if self.game.appear_start_time is not None:
+                self.game.appear_start_time += pause_duration
+            if self.panel_animation_active:
+                self.panel_animation_start += pause_duration
+
             # Возобновляем таймер обратного отсчёта
             pygame.time.set_timer(self.COUNTDOWN_EVENT, 1000)
 
@@ -486,10 +569,14 @@ class GameApp:
                 tile.cells_left_count = 0
                 tile.total_cells_to_move = total_cells
                 tile.move_animation_group = pygame.sprite.Group()
-                tile.target_rect = target_rect  # Сохраняем цель при старте!
                 # Начинаем движение
                 tile.is_moving = True
                 tile.current_direction = direction
+                self.game.moves += 1
+                self.motion.start(
+                    tile, direction, (new_row, new_col),
+                    speed_per_ms(settings.get_speed()), pygame.time.get_ticks()
+                )
                 self.arrows.empty()
                 return
         for tile in self.tiles:
@@ -506,14 +593,13 @@ class GameApp:
                 return
             positions = self.game.remove_tiles(self.game.selected_tile, tile)
             if positions:
+                # Убранная плитка могла быть препятствием на пути движущихся
+                self.motion.invalidate()
                 self.play_sound('remove')
                 self.arrows.empty()  # Очищаем стрелки после удаления плиток
                 self.spawn_score_animation(positions)  # Создаём анимацию очков
-                self.update_display()
                 self.game.selected_tile = None
-                if not self.timer_running and any(
-                    self.game.board[i][j] is None for i in range(BOARD_SIZE) for j in range(BOARD_SIZE)
-                ):
+                if not self.timer_running and self.game.has_empty_cells():
                     self.timer_running = True
                     self.bar_phase = 'emptying'
                     self.bar_phase_start = pygame.time.get_ticks()
@@ -547,8 +633,8 @@ class GameApp:
                 top_row = (t.rect.y - scale.GAP) // cell_size
                 right_col = (t.rect.x + scale.TILE_SIZE - 1 - scale.GAP) // cell_size
                 bottom_row = (t.rect.y + scale.TILE_SIZE - 1 - scale.GAP) // cell_size
-                for row in range(max(0, top_row), min(BOARD_SIZE, bottom_row + 1)):
-                    for col in range(max(0, left_col), min(BOARD_SIZE, right_col + 1)):
+                for row in range(max(0, top_row), min(self.board_size, bottom_row + 1)):
+                    for col in range(max(0, left_col), min(self.board_size, right_col + 1)):
                         # Исключаем стартовую позицию - плитка оттуда уезжает
                         if (row, col) != t.position:
                             occupied_by_moving.add((row, col))
@@ -599,15 +685,15 @@ class GameApp:
                 top_row = (tile.rect.y - scale.GAP) // cell_size
                 right_col = (tile.rect.x + scale.TILE_SIZE - 1 - scale.GAP) // cell_size
                 bottom_row = (tile.rect.y + scale.TILE_SIZE - 1 - scale.GAP) // cell_size
-                for row in range(max(0, top_row), min(BOARD_SIZE, bottom_row + 1)):
-                    for col in range(max(0, left_col), min(BOARD_SIZE, right_col + 1)):
+                for row in range(max(0, top_row), min(self.board_size, bottom_row + 1)):
+                    for col in range(max(0, left_col), min(self.board_size, right_col + 1)):
                         # Исключаем стартовую позицию - плитка оттуда уезжает
                         if (row, col) != tile.position:
                             occupied_by_moving.add((row, col))
         for arrow in list(self.arrows):
             # Вычисляем grid позицию стрелки
             arrow_row, arrow_col = pixel_to_grid(arrow.rect.x, arrow.rect.y)
-            if 0 <= arrow_row < BOARD_SIZE and 0 <= arrow_col < BOARD_SIZE:
+            if 0 <= arrow_row < self.board_size and 0 <= arrow_col < self.board_size:
                 cell = self.game.board[arrow_row][arrow_col]
                 # Удаляем стрелку если:
                 # 1. Ячейка занята статичной плиткой (не движущейся)
@@ -627,115 +713,69 @@ class GameApp:
         elif direction == "right":
             return (x + self.tile_size + self.gap, y)
 
-    def check_static_collision(self, tile):
-        """Проверяет столкновение со статичными плитками."""
-        for other in self.tiles:
-            if other != tile and not other.is_moving:
-                if tile.rect.colliderect(other.rect):
-                    return other
-        return None
-
-    def check_collision(self, tile):
-        """Проверяет столкновение с другими движущимися плитками."""
-        for other in self.tiles:
-            if other != tile and other.is_moving:
-                if tile.rect.colliderect(other.rect):
-                    dir1 = tile.current_direction
-                    dir2 = other.current_direction
-
-                    # Порог для определения "одной линии" - половина размера ячейки
-                    threshold = (scale.TILE_SIZE + scale.GAP) // 2
-
-                    # Проверяем противоположные направления
-                    horizontal_opposite = (dir1, dir2) in [("left", "right"), ("right", "left")]
-                    vertical_opposite = (dir1, dir2) in [("up", "down"), ("down", "up")]
-
-                    if horizontal_opposite:
-                        # Проверяем по Y: на одной строке или параллельно?
-                        if abs(tile.rect.y - other.rect.y) <= threshold:
-                            return other  # Лоб в лоб
-                        continue  # Параллельные пути
-
-                    if vertical_opposite:
-                        # Проверяем по X: на одном столбце или параллельно?
-                        if abs(tile.rect.x - other.rect.x) <= threshold:
-                            return other  # Лоб в лоб
-                        continue  # Параллельные пути
-
-                    # Одинаковое направление - проверяем догоняет ли одна другую
-                    if dir1 == dir2:
-                        # Если rect'ы пересекаются при одинаковом направлении - коллизия
-                        # (одна плитка догнала другую)
-                        return other
-
-                    # Перпендикулярные направления - пересечение путей
-                    # Если rect'ы пересекаются - это реальная коллизия
-                    return other
-        return None
-
-    def move_tile(self, tile, direction):
-        # Используем сохранённую цель, а не пересчитываем каждый кадр
-        target_rect = tile.target_rect
-        dx = target_rect.topleft[0] - tile.rect.topleft[0]
-        dy = target_rect.topleft[1] - tile.rect.topleft[1]
-        speed = settings.get_speed()
-        if dx == 0 and dy != 0:
-            # Ограничиваем шаг чтобы не перескочить цель
-            step_y = min(speed, abs(dy)) * (1 if dy > 0 else -1)
-            tile.rect.y += step_y
-        elif dy == 0 and dx != 0:
-            # Ограничиваем шаг чтобы не перескочить цель
-            step_x = min(speed, abs(dx)) * (1 if dx > 0 else -1)
-            tile.rect.x += step_x
-
-        # Проверяем, покинула ли плитка ячейку (для анимации -N)
-        if hasattr(tile, 'last_grid_pos'):
-            current_row, current_col = pixel_to_grid(tile.rect.centerx, tile.rect.centery)
-            current_pos = (current_row, current_col)
-            if current_pos != tile.last_grid_pos:
-                # Плитка покинула ячейку - показываем popup там
-                tile.cells_left_count += 1
-                left_pos = tile.last_grid_pos
-                popup = ScorePopup(
-                    tile.cells_left_count, left_pos, 0, tile.total_cells_to_move,
-                    group=tile.move_animation_group,
-                    board=self.game.board,
-                    negative=True
-                )
-                tile.move_animation_group.add(popup)
-                self.score_popups.add(popup)
-                tile.last_grid_pos = current_pos
-
-        # Проверяем коллизию с другими движущимися плитками
-        collided = self.check_collision(tile)
-        if collided:
-            self.resolve_collision(tile, collided)
-            return  # Плитка уже остановлена
-
-        # Проверяем коллизию со статичными плитками (которые уже остановились)
-        static_collided = self.check_static_collision(tile)
-        if static_collided:
-            self.snap_to_grid(tile)
-            return  # Плитка остановлена
+    @instrument.timed('app.update_moving_tiles')
+    def update_moving_tiles(self):
+        """Продвигает движущиеся плитки до текущего момента.
 
+        Прибытия и столкновения заранее вычислены планировщиком и
+        обрабатываются в момент события, в кадре только интерполируются позиции.
+        """
+        if not self.motion:
+            return
+        now = pygame.time.get_ticks()
+        for event in self.motion.due_events(now, self.game.board):
+            self._emit_cell_leave_popups(event.tile)
+            if event.kind == ARRIVAL:
+                self.finalize_move(event.tile)
+            elif event.kind == COLLISION:
+                # Лоб в лоб, догон или пересечение путей
+                self._emit_cell_leave_popups(event.other)
+                self.resolve_collision(event.tile, event.other)
+            else:
+                # Столкновение со статичной плиткой (остановилась или появилась на пути)
+                self.snap_to_grid(event.tile)
+        perf_hud.mark('collisions')
+        self.motion.interpolate(now)
+        for tile in self.motion.slides:
+            self._emit_cell_leave_popups(tile)
         # Удаляем стрелки на ячейках где сейчас находится движущаяся плитка
         self.remove_arrows_on_occupied_cells()
+        perf_hud.mark('move_tile')
 
-        self.update_display()
+    def _emit_cell_leave_popups(self, tile):
+        """Показывает -N в каждой ячейке, которую покинула плитка (для анимации -N)."""
+        if not hasattr(tile, 'last_grid_pos'):
+            return
+        current_pos = pixel_to_grid(tile.rect.centerx, tile.rect.centery)
+        d_row, d_col = GRID_VECTORS[tile.current_direction]
+        # При медленном кадре плитка могла пройти несколько ячеек сразу
+        while current_pos != tile.last_grid_pos and tile.cells_left_count < tile.total_cells_to_move:
+            tile.cells_left_count += 1
+            left_pos = tile.last_grid_pos
+            popup = ScorePopup(
+                tile.cells_left_count, left_pos, 0, tile.total_cells_to_move,
+                group=tile.move_animation_group,
+                board=self.game.board,
+                negative=True
+            )
+            tile.move_animation_group.add(popup)
+            self.score_popups.add(popup)
+            tile.last_grid_pos = (left_pos[0] + d_row, left_pos[1] + d_col)
 
     def resolve_collision(self, tile1, tile2):
         """Останавливает обе плитки при столкновении."""
         self.snap_to_grid(tile1)
         self.snap_to_grid(tile2)
 
+    @instrument.timed('app.snap_to_grid')
     def snap_to_grid(self, tile):
         """Привязывает плитку к ближайшей ячейке сетки."""
         # Вычисляем ближайшую позицию на сетке
         grid_row, grid_col = pixel_to_grid_round(tile.rect.topleft[0], tile.rect.topleft[1])
 
         # Ограничиваем в пределах поля
-        grid_col = max(0, min(BOARD_SIZE - 1, grid_col))
-        grid_row = max(0, min(BOARD_SIZE - 1, grid_row))
+        grid_col = max(0, min(self.board_size - 1, grid_col))
+        grid_row = max(0, min(self.board_size - 1, grid_row))
 
         # Если ячейка занята, ищем ближайшую свободную в обратном направлении
         if self.game.board[grid_row][grid_col] is not None and self.game.board[grid_row][grid_col] != tile:
@@ -788,14 +828,17 @@ class GameApp:
             del tile.cells_left_count
             del tile.total_cells_to_move
             del tile.move_animation_group
-            del tile.target_rect
 
         # Сначала обновляем позицию и доску, ПОТОМ сбрасываем is_moving
         # Это предотвращает окно несогласованности состояния
         old_x, old_y = tile.position
-        new_x, new_y = pixel_to_grid(tile.rect.topleft[0], tile.rect.topleft[1])
-        tile.position = (new_x, new_y)
-        self.game.update_board((old_x, old_y), (new_x, new_y), tile)
+        new_x, new_y = new_position = pixel_to_grid(tile.rect.topleft[0], tile.rect.topleft[1])
+        if self.game.update_board(tile.position, new_position, tile):
+            tile.position = new_position
+        else:
+            # Доска не изменилась - плитка остаётся в своей ячейке
+            tile.rect.topleft = grid_to_pixel(*tile.position)
+            new_x, new_y = old_x, old_y
 
         # Теперь безопасно сбросить флаги движения
         tile.is_moving = False
@@ -817,17 +860,18 @@ class GameApp:
         cells_moved = delta_x + delta_y
         if cells_moved > 0:
             self.game.deduct_score(cells_moved)
-        self.update_display()
-        pygame.display.flip()
 
     def update_display(self):
+        """Кадр игры на экране (показывает его главный цикл)."""
+        # Очищаем и перерисовываем tile_surface каждый кадр
         self.tile_surface.blit(self.background_texture, (0, 0))
         # Рисуем сначала статичные плитки
         for tile in self.tiles:
             if not tile.is_moving:
                 self.tile_surface.blit(tile.image, tile.rect)
-        # Обновляем и рисуем анимацию очков
-        self.score_popups.update()
+        # Обновляем и рисуем анимацию очков (только если не пауза)
+        if not self.is_paused:
+            self.score_popups.update()
         for popup in self.score_popups:
             popup.draw(self.tile_surface)
         # Стрелки
@@ -837,186 +881,142 @@ class GameApp:
             if tile.is_moving:
                 self.tile_surface.blit(tile.image, tile.rect)
         self.draw_background()
-        pygame.display.update()
 
     def run(self):
-        running = True
-        show_result = False
-        prepare_to_show_result = False
-        # Флаг для добавления плитки (когда бар становится пустым)
-        pending_tile_spawn = False
-
-        while running:
-            # === MENU STATE ===
-            if self.state == 'menu':
-                # Show start menu
-                result = self.start_menu.show()
-                if result == 'settings_changed':
-                    # Settings were changed, need to restart app
-                    return 'restart'
-                elif result:
-                    self.state = 'playing'
-                    # Start panel animation
-                    self.panel_animation_active = True
-                    self.panel_animation_start = pygame.time.get_ticks()
-                    # Start the game
-                    self.game.start_tile_appearance()
-                else:
-                    running = False
-                continue
-            # Обработка двухфазного таймера
-            if self.timer_running and not self.is_paused:
-                elapsed = pygame.time.get_ticks() - self.bar_phase_start
-                if self.bar_phase == 'emptying':
-                    # Проверяем: бар опустел?
-                    if elapsed >= self.bar_empty_duration:
-                        pending_tile_spawn = True
-                        # Ждём спавна - бар остаётся на 0
-                        self.bar_phase = 'waiting_spawn'
-                elif self.bar_phase == 'waiting_spawn':
-                    # Бар ждёт на 0 пока спавн не произойдёт
-                    pass
-                elif self.bar_phase == 'filling':
-                    # Проверяем: бар заполнился?
-                    if elapsed >= self.bar_fill_duration:
-                        # Переходим к фазе опустошения
-                        self.bar_phase = 'emptying'
-                        self.bar_phase_start = pygame.time.get_ticks()
-
-            # Очищаем и перерисовываем tile_surface каждый кадр
-            self.tile_surface.blit(self.background_texture, (0, 0))
-            # Рисуем сначала статичные плитки
-            for tile in self.tiles:
-                if not tile.is_moving:
-                    self.tile_surface.blit(tile.image, tile.rect)
-            # Обновляем и рисуем анимацию очков в каждом кадре (только если не пауза)
-            if not self.is_paused:
-                self.score_popups.update()
-            for popup in self.score_popups:
-                popup.draw(self.tile_surface)
-            # Рисуем стрелки
-            self.arrows.draw(self.tile_surface)
-            # Рисуем движущиеся плитки поверх стрелок
-            for tile in self.tiles:
-                if tile.is_moving:
-                    self.tile_surface.blit(tile.image, tile.rect)
-            self.draw_background()
-            # Движение плиток только если не пауза
-            if not self.is_paused:
-                for tile in self.tiles:
-                    if tile.is_moving:
-                        direction = tile.current_direction
-                        if direction:
-                            self.move_tile(tile, direction)
-                            # После move_tile плитка могла остановиться из-за коллизии
-                            if not tile.is_moving:
-                                continue
-                            # Используем сохранённую цель
-                            target_rect = tile.target_rect
-                            # Проверяем достижение цели с допуском (для float координат)
-                            dx = abs(tile.rect.x - target_rect.x)
-                            dy = abs(tile.rect.y - target_rect.y)
-                            if dx < 1 and dy < 1:
-                                tile.rect.topleft = target_rect.topleft
-                                self.finalize_move(tile)
-            pygame.display.update()
-
-            # Добавляем плитку когда бар опустел
-            if pending_tile_spawn:
-                spawn_result = self.game.add_new_tile()
-                if spawn_result == 'pending':
-                    # Движущиеся плитки блокируют спавн - ждём
-                    pass  # pending_tile_spawn остаётся True, бар на 0
-                else:
-                    pending_tile_spawn = False
-                    if spawn_result:  # True = плитка появилась
-                        self.play_sound('spawn')
-                    # Спавн произошёл - запускаем фазу заполнения бара
-                    self.bar_phase = 'filling'
-                    self.bar_phase_start = pygame.time.get_ticks()
-                    # Обновляем стрелки - новая плитка могла заблокировать направление
-                    self._refresh_selected_tile_arrows()
-                    empty = any(
-                        self.game.board[i][j] is None
-                        for i in range(BOARD_SIZE)
-                        for j in range(BOARD_SIZE)
-                    )
-                    if not empty:
-                        self.timer_running = False
-
-            for event in pygame.event.get():
-                if event.type == self.TILE_APPEAR_EVENT:
-                    # Spawn next tile in appearance animation
-                    self.game.spawn_next_tile()
-                    self.update_display()
-                elif event.type == self.COUNTDOWN_EVENT:
-                    self.game.handle_countdown()
-                else:
-                    result = self.handle_event(event)
-                    if result == 'menu':
-                        # Возврат в меню из паузы
-                        self.is_paused = False
-                        self.reset_game()
-                        self.state = 'menu'
-                        show_result = False
-                        prepare_to_show_result = False
-                        pending_tile_spawn = False
-                    elif result == False:
-                        running = False
-            # Проверяем успешное завершение (все плитки убраны)
-            if self.game.prepare_to_end:
-                self.game.prepare_to_end = False
-                prepare_to_show_result = True
-                # Сохраняем текущий прогресс перед остановкой
-                if self.timer_running:
-                    elapsed = pygame.time.get_ticks() - self.bar_phase_start
-                    if self.bar_phase == 'emptying':
-                        self.paused_progress = max(0, 1 - elapsed / self.bar_empty_duration)
-                    elif self.bar_phase == 'waiting_spawn':
-                        self.paused_progress = 0
-                    else:  # filling
-                        self.paused_progress = min(1, elapsed / self.bar_fill_duration)
-                self.timer_running = False  # Останавливаем прогресс-бар
-            elif prepare_to_show_result:
-                prepare_to_show_result = False
-                show_result = True
-
-            # Проверяем завершение по таймеру (время истекло)
-            if self.game.game_over_flag:
-                self.game.game_over_flag = False
-                show_result = True
-                # Сохраняем текущий прогресс перед остановкой
-                if self.timer_running:
-                    elapsed = pygame.time.get_ticks() - self.bar_phase_start
-                    if self.bar_phase == 'emptying':
-                        self.paused_progress = max(0, 1 - elapsed / self.bar_empty_duration)
-                    elif self.bar_phase == 'waiting_spawn':
-                        self.paused_progress = 0
-                    else:  # filling
-                        self.paused_progress = min(1, elapsed / self.bar_fill_duration)
-                self.timer_running = False
-
-            if show_result and not any(tile.is_moving for tile in self.tiles) and len(self.score_popups) == 0:
-                # Анимации очков закончились - показываем результат
-                self.update_display()
-                pygame.display.flip()
-                result = self.show_result_window()
-                if result == 'new_game':
-                    # Reset game and continue playing
-                    self.reset_game()
-                    # Start panel animation
-                    self.panel_animation_active = True
-                    self.panel_animation_start = pygame.time.get_ticks()
-                    self.game.start_tile_appearance()
-                    show_result = False
-                    prepare_to_show_result = False
-                    pending_tile_spawn = False
-                elif result == 'menu':
-                    # Return to menu
-                    self.reset_game()
-                    self.state = 'menu'
-                    show_result = False
-                    prepare_to_show_result = False
-                    pending_tile_spawn = False
-                else:
-                    running = False
+        """Главный цикл игры: стартовое меню, затем сцены до выхода."""
+        self.show_menu(animate_entry=True)
+        self.scenes.run()
+
+    def show_menu(self, animate_entry=True):
+        """Стартовое меню вместо партии (или первой сценой).
+
+        Args:
+            animate_entry: Анимация появления - при первом показе и после игры,
+                но не после смены масштаба
+        """
+        self.state = 'menu'
+        self.start_menu.start(animate_entry)
+        if self.scenes.top is self:
+            self.scenes.replace(self.start_menu, on_finish=self._on_menu_finished)
+        else:
+            self.scenes.push(self.start_menu, on_finish=self._on_menu_finished)
+
+    def _on_menu_finished(self, result):
+        if result == 'settings_changed':
+            # Новый масштаб: перестраиваем окно на месте и снова показываем меню
+            self.apply_scale()
+            self.show_menu(animate_entry=False)
+        else:
+            self.state = 'playing'
+            self._start_round()
+            self.scenes.push(self)
+
+    def _start_round(self):
+        """Выезд панели и появление плиток новой партии."""
+        self.panel_animation_active = True
+        self.panel_animation_start = pygame.time.get_ticks()
+        self.game.start_tile_appearance()
+
+    def _show_pause(self):
+        """Оверлей паузы поверх снимка игры."""
+        self.pause_overlay.start()
+        self.scenes.push(self.pause_overlay, on_finish=self._on_pause_finished)
+
+    def _on_pause_finished(self, result):
+        if result == 'menu':
+            # Возврат в меню из паузы
+            self.reset_game()
+            self.show_menu()
+
+    def _on_result_finished(self, result):
+        self.reset_game()
+        if result == 'new_game':
+            self._start_round()
+        else:
+            self.show_menu()
+
+    def _save_bar_progress(self):
+        """Запомнить заполнение бара перед его остановкой."""
+        if self.timer_running:
+            elapsed = pygame.time.get_ticks() - self.bar_phase_start
+            if self.bar_phase == 'emptying':
+                self.paused_progress = max(0, 1 - elapsed / self.bar_empty_duration)
+            elif self.bar_phase == 'waiting_spawn':
+                self.paused_progress = 0
+            else:  # filling
+                self.paused_progress = min(1, elapsed / self.bar_fill_duration)
+
+    def update(self, now):
+        """Кадр партии: таймер бара, появление и спавн плиток, движение, конец игры."""
+        # Обработка двухфазного таймера
+        if self.timer_running:
+            elapsed = now - self.bar_phase_start
+            if self.bar_phase == 'emptying':
+                # Проверяем: бар опустел?
+                if elapsed >= self.bar_empty_duration:
+                    self.pending_tile_spawn = True
+                    # Ждём спавна - бар остаётся на 0
+                    self.bar_phase = 'waiting_spawn'
+            elif self.bar_phase == 'waiting_spawn':
+                # Бар ждёт на 0 пока спавн не произойдёт
+                pass
+            elif self.bar_phase == 'filling':
+                # Проверяем: бар заполнился?
+                if elapsed >= self.bar_fill_duration:
+                    # Переходим к фазе опустошения
+                    self.bar_phase = 'emptying'
+                    self.bar_phase_start = now
+
+        # Анимация появления: все плитки, чьё время пришло (может быть несколько за кадр)
+        if self.game.is_initializing:
+            self.game.spawn_due_tiles(now)
+        perf_hud.mark('logic')
+
+        self.update_moving_tiles()
+
+        # Добавляем плитку когда бар опустел
+        if self.pending_tile_spawn:
+            spawn_result = self.game.add_new_tile()
+            if spawn_result == 'pending':
+                # Движущиеся плитки блокируют спавн - ждём
+                pass  # pending_tile_spawn остаётся True, бар на 0
+            else:
+                self.pending_tile_spawn = False
+                if spawn_result:  # True = плитка появилась
+                    self.play_sound('spawn')
+                    # Новая плитка могла появиться на пути движущихся
+                    self.motion.invalidate()
+                # Спавн произошёл - запускаем фазу заполнения бара
+                self.bar_phase = 'filling'
+                self.bar_phase_start = pygame.time.get_ticks()
+                # Обновляем стрелки - новая плитка могла заблокировать направление
+                self._refresh_selected_tile_arrows()
+                if not self.game.has_empty_cells():
+                    self.timer_running = False
+
+        # Проверяем успешное завершение (все плитки убраны)
+        if self.game.prepare_to_end:
+            self.game.prepare_to_end = False
+            self.prepare_to_show_result = True
+            # Сохраняем текущий прогресс перед остановкой
+            self._save_bar_progress()
+            self.timer_running = False  # Останавливаем прогресс-бар
+        elif self.prepare_to_show_result:
+            self.prepare_to_show_result = False
+            self.show_result = True
+
+        # Проверяем завершение по таймеру (время истекло)
+        if self.game.game_over_flag:
+            self.game.game_over_flag = False
+            self.show_result = True
+            # Сохраняем текущий прогресс перед остановкой
+            self._save_bar_progress()
+            self.timer_running = False
+
+        if self.show_result and not any(tile.is_moving for tile in self.tiles) and len(self.score_popups) == 0:
+            # Анимации очков закончились - показываем результат
+            self.show_result = False
+            self.show_result_window()
+
+    def draw(self, screen):
+        self.update_display()
@@ -0,0 +1,325 @@
+"""
+Cache of procedurally generated surfaces, in memory and on disk.
+
+Tiles, arrows, rank badges, gradients and the striped background are drawn
+by code on every launch. get_surface() returns them from memory, then from
+the bundle file of the current size preset, and only then calls the
+generator:
+
+    image = asset_cache.get_surface('tile', (number, color, size), lambda: draw(...))
+
+Returned surfaces are shared: blit or copy them, never draw on them.
+
+One bundle per size preset lives in ~/.game_digits/cache/surfaces-<scale>.bin:
+
+    header  MAGIC, format version (u16), index length (u32)
+    index   JSON: fingerprint and {key: [offset, width, height, format, meta]}
+    data    raw pixels (RGB for opaque surfaces, RGBA otherwise)
+
+Params need not include the scale: the memory layer is dropped on rescale
+and every preset has its own bundle. Keys are hashes of (kind, params); the
+fingerprint covers the bundle format, the game version, the pygame version
+and the code of the drawing modules (GENERATOR_MODULES), so a bundle from
+another build or from before an edit of the drawing code is ignored and
+rewritten. Surfaces generated on a miss are added to the bundle
+by a background write. A custom scale (window resized by mouse) is cached in
+memory only: its sizes are unlikely to repeat.
+
+`python -m game_digits.asset_cache` bakes the bundles of all presets ahead
+of the first launch.
+"""
+
+import hashlib
+import importlib.util
+import json
+import marshal
+import os
+import struct
+from pathlib import Path
+
+import pygame
+
+from game_digits import __version__
+from game_digits import io_executor
+from game_digits import log
+from game_digits import scale
+from game_digits import settings
+
+CACHE_DIR = Path.home() / ".game_digits" / "cache"
+MAGIC = b'GDSC'
+FORMAT_VERSION = 1
+MAX_BUNDLE_BYTES = 64 * 1024 * 1024  # Beyond this misses stay in memory only
+
+# Модули, чей код рисует кэшируемые поверхности: их правка меняет отпечаток
+GENERATOR_MODULES = (
+    'game_digits.constants',
+    'game_digits.fonts',
+    'game_digits.ranks',
+    'game_digits.ui_components',
+    'game_digits.sprites.arrow',
+    'game_digits.sprites.tile',
+    'game_digits.windows.pause_overlay',
+    'game_digits.windows.start_menu',
+)
+
+_HEADER = struct.Struct('<4sHI')
+
+_logger = log.get_logger('asset_cache')
+
+_persistent = True
+_memory = {}      # (kind, params) -> (surface, meta)
+_bundle = None    # _Bundle of the current preset, loaded on first use
+_added = {}       # key -> (width, height, format, meta, pixels) not yet in the file
+_write = None     # Future of the last queued bundle write
+_code_hash = None  # Хэш кода GENERATOR_MODULES, считается один раз
+
+
+def _module_code(name):
+    """Source of the module, or its bytecode in a build without sources."""
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        return b''
+    try:
+        source = spec.loader.get_source(name)
+        if source is not None:
+            return source.encode('utf-8')
+        return marshal.dumps(spec.loader.get_code(name))
+    except (AttributeError, ImportError, OSError):
+        return b''
+
+
+def _generators_hash():
+    global _code_hash
+    if _code_hash is None:
+        digest = hashlib.sha1()
+        for name in GENERATOR_MODULES:
+            digest.update(_module_code(name))
+        _code_hash = digest.hexdigest()[:16]
+    return _code_hash
+
+
+def _fingerprint():
+    return f"{FORMAT_VERSION}|{__version__}|{pygame.version.ver}|{_generators_hash()}"
+
+
+def _key(kind, params):
+    return hashlib.sha1(repr((kind, params)).encode('utf-8')).hexdigest()[:24]
+
+
+def set_persistent(enabled):
+    """Turn the disk layer on or off (benchmarks measure generation in memory only)."""
+    global _persistent
+    _persistent = enabled
+    clear_memory()
+
+
+def bundle_path():
+    """Bundle file of the current preset, or None (custom scale, disk layer off)."""
+    if not _persistent or settings.has_custom_scale():
+        return None
+    return CACHE_DIR / f"surfaces-{settings.get_scale():g}.bin"
+
+
+class _Bundle:
+    """Index and pixel data of one bundle file (empty if missing or stale)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.index = {}
+        self.data = b''
+        if path is None:
+            return
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            return
+        try:
+            magic, version, index_len = _HEADER.unpack_from(raw)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                return
+            start = _HEADER.size
+            header = json.loads(raw[start:start + index_len].decode('utf-8'))
+        except (struct.error, ValueError):
+            _logger.warning('bundle_corrupt', path=str(path))
+            return
+        if header.get('fingerprint') != _fingerprint():
+            return  # Другая версия игры или pygame: перегенерируем
+        self.index = header['entries']
+        self.data = memoryview(raw)[start + index_len:]
+
+    def load(self, key):
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        offset, width, height, fmt, meta = entry
+        length = width * height * len(fmt)
+        pixels = self.data[offset:offset + length]
+        if len(pixels) != length:
+            return None
+        # frombuffer не копирует - копия (или convert) отвязывает поверхность от файла
+        surface = pygame.image.frombuffer(pixels, (width, height), fmt)
+        return _to_display_format(surface, fmt == 'RGBA'), meta
+
+
+def _to_display_format(surface, alpha):
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return surface.convert_alpha() if alpha else surface.convert()
+    return surface.copy()
+
+
+def _current_bundle():
+    global _bundle
+    path = bundle_path()
+    if _bundle is None or _bundle.path != path:
+        _bundle = _Bundle(path)
+        _added.clear()
+    return _bundle
+
+
+def _write_bundle(path, fingerprint, old_index, old_data, added):
+    """Rewrite the bundle with the old entries plus `added` (I/O thread)."""
+    entries = {}
+    chunks = []
+    offset = 0
+    for key, (old_offset, width, height, fmt, meta) in old_index.items():
+        if key in added:
+            continue
+        length = width * height * len(fmt)
+        chunks.append(old_data[old_offset:old_offset + length])
+        entries[key] = [offset, width, height, fmt, meta]
+        offset += length
+    for key, (width, height, fmt, meta, pixels) in added.items():
+        chunks.append(pixels)
+        entries[key] = [offset, width, height, fmt, meta]
+        offset += len(pixels)
+    index = json.dumps({'fingerprint': fingerprint, 'entries': entries},
+                       separators=(',', ':')).encode('utf-8')
+
+    # Кэш можно перегенерировать: без fsync и .bak, только атомарная замена
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(index)))
+            f.write(index)
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp, path)
+    except OSError as e:
+        _logger.warning('bundle_write_failed', path=str(path), error=str(e))
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _persist(key, surface, meta):
+    global _write
+    bundle = _current_bundle()
+    if bundle.path is None:
+        return
+    alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+    fmt = 'RGBA' if alpha else 'RGB'
+    size = len(bundle.data) + sum(len(item[4]) for item in _added.values())
+    width, height = surface.get_size()
+    if size + width * height * len(fmt) > MAX_BUNDLE_BYTES:
+        return
+    _added[key] = (width, height, fmt, meta, pygame.image.tobytes(surface, fmt))
+    # Пока идёт запись, следующие промахи копятся в одной задаче в очереди (тот же key)
+    _write = io_executor.submit(_write_bundle, bundle.path, _fingerprint(), bundle.index, bundle.data,
+                                dict(_added), key=('asset_cache', str(bundle.path)))
+
+
+def get_entry(kind, params, generate):
+    """Surface and meta for (kind, params).
+
+    Args:
+        kind: Asset family ('tile', 'arrow', ...)
+        params: Everything the generator depends on (hashable, stable repr)
+        generate: Called on a miss; returns (surface, meta), meta JSON-ready
+
+    Returns:
+        (surface, meta); the surface is shared and must not be drawn on
+    """
+    memory_key = (kind, params)
+    cached = _memory.get(memory_key)
+    if cached is not None:
+        return cached
+    key = _key(kind, params)
+    cached = _current_bundle().load(key)
+    if cached is None:
+        surface, meta = generate()
+        _persist(key, surface, meta)
+        cached = (surface, meta)
+    _memory[memory_key] = cached
+    return cached
+
+
+def get_surface(kind, params, generate):
+    """Like get_entry() for generators returning only a surface."""
+    return get_entry(kind, params, lambda: (generate(), None))[0]
+
+
+def flush(timeout=None):
+    """Wait for the last queued bundle write."""
+    if _write is not None:
+        try:
+            _write.result(timeout)
+        except Exception:  # Ошибка записи уже в логе; отмена при shutdown - не ошибка
+            pass
+
+
+def clear_memory():
+    """Drop the in-memory layer (the bundle of the new preset is read on demand)."""
+    global _bundle
+    _memory.clear()
+    _bundle = None
+    _added.clear()
+
+
+# Размеры всех поверхностей зависят от масштаба
+scale.add_listener(clear_memory)
+
+
+def bake(board_size=None):
+    """Generate the bundles of every size preset; returns the written paths."""
+    from game_digits import constants, ranks
+    from game_digits.app import GameApp
+    from game_digits.sprites import Arrow, Tile
+
+    saved_preset = settings.get_current_preset()
+    app = None
+    paths = []
+    try:
+        for preset in settings.SIZE_ORDER:
+            settings.set_preset(preset)
+            if app is None:
+                scale.rescale()
+                # Фон поля, плитки меню и паузы строятся в раскладке окна
+                app = GameApp(board_size=board_size or settings.get_board_size())
+            else:
+                app.apply_scale()
+            for number, color in constants.COLORS.items():
+                Tile(number, (0, 0), color).update_color((255, 139, 2))  # И выделенная
+            for direction in ('up', 'down', 'left', 'right'):
+                Arrow.get_arrow_image(direction)
+            app.update_display()
+            badges = pygame.Surface((scale.scaled(400), scale.scaled(60)), pygame.SRCALPHA)
+            rect = (badges.get_width() // 2, badges.get_height() // 2, scale.scaled(220), scale.scaled(30))
+            for _, name, fg, bg in ranks.RANKS:
+                ranks.draw_rank_badge(badges, rect, name, fg, bg)
+            paths.append(bundle_path())
+            flush()
+    finally:
+        settings.set_preset(saved_preset)
+        scale.rescale()
+    return paths
+
+
+if __name__ == '__main__':
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+    for written in bake():
+        print(written)
+    pygame.quit()
@@ -0,0 +1,152 @@
+"""
+Sound effects: sample cache, mixer channels reserved per category, mute.
+
+    audio.pre_init()                        # before pygame.init()
+    startup.defer(audio.get_audio().preload)
+    audio.get_audio().play('remove')
+
+Samples are loaded in a background thread and kept by the process-wide
+manager, so a new GameApp/TestGameApp reuses them. play() never waits: a
+sound that is not loaded yet is skipped (and its loading started), a
+missing or broken file is logged once and stays silent.
+
+Every category gets its own reserved channels. A burst of removals takes
+the next channel of 'remove', stopping its oldest sound if all are busy,
+and never steals the channel of the celebration fanfare.
+"""
+
+import threading
+
+import pygame
+
+from game_digits import get_sound_path
+from game_digits import io_executor
+from game_digits import log
+
+# Параметры микшера: моно и короткий буфер - эффекты без задержки
+MIXER_PARAMS = {'frequency': 44100, 'size': -16, 'channels': 1, 'buffer': 256}
+
+# Имя звука -> (файл, категория)
+SOUNDS = {
+    'remove': ('remove.wav', 'remove'),
+    'spawn': ('spawn.wav', 'spawn'),
+    'celebration': ('celebration.wav', 'fanfare'),
+}
+
+# Категория -> число зарезервированных каналов
+CATEGORIES = {
+    'remove': 3,
+    'spawn': 2,
+    'fanfare': 1,
+}
+
+_logger = log.get_logger('audio')
+
+
+def pre_init():
+    """Set the mixer parameters; call before pygame.init()."""
+    pygame.mixer.pre_init(**MIXER_PARAMS)
+
+
+class AudioManager:
+    """Samples, reserved channels, volume and mute of the sound effects."""
+
+    def __init__(self):
+        self.enabled = True
+        self.volume = 1.0
+        self._samples = {}      # name -> Sound, или None если файла нет
+        self._lock = threading.Lock()
+        self._loading = None    # Future фоновой загрузки
+        self._channels = None   # category -> [Channel], создаются при первом play()
+        self._next = {}         # category -> индекс следующего канала по кругу
+
+    @staticmethod
+    def is_available():
+        """Whether the mixer is initialized (no audio device - no sound)."""
+        return pygame.mixer.get_init() is not None
+
+    def preload(self):
+        """Load every sample that is not loaded yet (runs in a background thread)."""
+        if not self.is_available():
+            return
+        for name, (filename, _) in SOUNDS.items():
+            with self._lock:
+                if name in self._samples:
+                    continue
+            try:
+                sample = pygame.mixer.Sound(get_sound_path(filename))
+            except (pygame.error, FileNotFoundError) as e:
+                sample = None  # Звук не найден - игра работает без него
+                _logger.warning('sound_missing', sound=name, error=str(e))
+            with self._lock:
+                self._samples.setdefault(name, sample)
+
+    def _sample(self, name):
+        with self._lock:
+            if name in self._samples:
+                return self._samples[name]
+        if self._loading is None or self._loading.done():
+            self._loading = io_executor.submit(self.preload, key=('audio', 'preload'))
+        return None
+
+    def _setup_channels(self):
+        reserved = sum(CATEGORIES.values())
+        if pygame.mixer.get_num_channels() < reserved + 2:
+            pygame.mixer.set_num_channels(reserved + 2)  # Пара свободных для Sound.play()
+        pygame.mixer.set_reserved(reserved)
+        self._channels = {}
+        first = 0
+        for category, count in CATEGORIES.items():
+            self._channels[category] = [pygame.mixer.Channel(i) for i in range(first, first + count)]
+            self._next[category] = 0
+            first += count
+
+    def _channel(self, category):
+        if self._channels is None:
+            self._setup_channels()
+        channels = self._channels[category]
+        for channel in channels:
+            if not channel.get_busy():
+                return channel
+        # Все заняты: прерываем самый старый звук этой категории
+        index = self._next[category]
+        self._next[category] = (index + 1) % len(channels)
+        return channels[index]
+
+    def play(self, name):
+        """Play a sound by name on its category's channels (never blocks)."""
+        if not self.enabled or not self.is_available():
+            return
+        sample = self._sample(name)
+        if sample is None:
+            return
+        channel = self._channel(SOUNDS[name][1])
+        channel.set_volume(self.volume)
+        channel.play(sample)
+
+    def set_enabled(self, enabled):
+        """Mute or unmute; muting also stops the sounds that are playing."""
+        self.enabled = enabled
+        if not enabled and self._channels is not None:
+            for channels in self._channels.values():
+                for channel in channels:
+                    channel.stop()
+
+    def toggle(self):
+        self.set_enabled(not self.enabled)
+        return self.enabled
+
+    def set_volume(self, volume):
+        """Volume of the following sounds, 0.0..1.0."""
+        self.volume = max(0.0, min(1.0, volume))
+
+
+_audio = None
+
+
+def get_audio():
+    """The process-wide audio manager (created on first use)."""
+    global _audio
+    if _audio is None:
+        _audio = AudioManager()
+    return _audio
@@ -1,7 +1,9 @@
 # Размеры сетки (импортируем из scale.py для легкого изменения)
 from game_digits import scale
+from game_digits import settings
 
-BOARD_SIZE = 10
+# Размер поля по умолчанию; фактический размер задаётся при создании игры
+BOARD_SIZE = settings.DEFAULT_BOARD_SIZE
 
 
 # Динамические значения - читаются из scale при каждом вызове
@@ -46,36 +48,39 @@ def recalculate():
     GAP = scale.GAP
 
 
+scale.add_listener(recalculate)
+
+
 def create_background_surface(width, height):
-    """Создаёт поверхность с диагональными линиями под углом 60 градусов."""
+    """Поверхность с диагональными линиями под углом 60 градусов (общая, из кэша)."""
+    from game_digits import asset_cache
+    params = (width, height, STRIPE_SPACING, BACKGROUND_COLOR, STRIPE_COLOR)
+    return asset_cache.get_surface('background', params, lambda: _draw_background(width, height))
+
+
+def _draw_background(width, height):
     import pygame
     import math
-    surface = pygame.Surface((width, height))
-    surface.fill(BACKGROUND_COLOR)
-
-    # Угол 60 градусов (от горизонтали)
-    # tan(60°) = √3 ≈ 1.732
-    angle_rad = math.radians(60)
-    tan_angle = math.tan(angle_rad)
 
-    # Рисуем диагональные линии из левого нижнего в правый верхний
-    # Для угла 60° от горизонтали: dy/dx = tan(60°)
-    # Линия идёт снизу-слева вверх-вправо
+    # Угол 60 градусов (от горизонтали): линии идут снизу-слева вверх-вправо
+    # и за всю высоту сдвигаются вправо на run = height / tan(60°)
+    run = int(height / math.tan(math.radians(60)))
     spacing = STRIPE_SPACING
 
-    # Нужно покрыть всю поверхность линиями
-    # Начинаем с нижнего левого угла и идём вправо и вверх
-    max_offset = width + height * tan_angle
-
-    for offset in range(-int(height / tan_angle), int(max_offset), spacing):
-        # Точка старта на нижней границе (y = height)
-        x1 = offset
-        y1 = height
-        # Точка конца на верхней границе (y = 0)
-        x2 = offset + height / tan_angle
-        y2 = 0
-        pygame.draw.line(surface, STRIPE_COLOR, (x1, y1), (x2, y2), 1)
+    # Линии идут через spacing пикселей, поэтому каждая строка текстуры -
+    # одна и та же периодичная полоска, сдвинутая по x. Блит полоски на
+    # строку вместо сотен вызовов pygame.draw.line
+    row = pygame.Surface((width + spacing, 1))
+    row.fill(BACKGROUND_COLOR)
+    pixels = pygame.PixelArray(row)
+    pixels[::spacing, 0] = row.map_rgb(STRIPE_COLOR)
+    pixels.close()
 
+    surface = pygame.Surface((width, height))
+    for y in range(height):
+        # x линии, которая начинается на нижней границе в x = -run
+        x = round(run * (height - y) / height) - run
+        surface.blit(row, (x % spacing - spacing, y))
     return surface
 
 
@@ -0,0 +1,276 @@
+"""
+Local stand-in for the Supabase `scores` table (for offline tests and load tests).
+
+Implements the subset of the PostgREST API that api_client uses:
+- POST /rest/v1/scores?on_conflict=player_id   upsert (object or list)
+- GET  /rest/v1/scores?select=...&order=score.desc&player_id=eq.X&score=gt.N
+  with Range / Range-Unit, Prefer: count=exact (Content-Range) and
+  ETag / If-None-Match (304)
+
+Faults can be injected: fixed latency with jitter, a share of requests
+answered with 503, and a share of connections dropped without a response.
+
+Run:
+    python -m game_digits.dev_server --port 8787 --latency 0.05 --error-rate 0.1
+    GAME_DIGITS_API_URL=http://127.0.0.1:8787 python main.py
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+SCORES_PATH = "/rest/v1/scores"
+
+
+class ScoreStore:
+    """Thread-safe in-memory scores table keyed by player_id."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rows = {}
+
+    def upsert(self, rows):
+        with self._lock:
+            for row in rows:
+                player_id = row.get('player_id')
+                if player_id is None:
+                    raise ValueError("player_id is required")
+                merged = dict(self._rows.get(player_id, {}))
+                merged.update(row)
+                self._rows[player_id] = merged
+
+    def select(self, filters, order):
+        with self._lock:
+            rows = [dict(row) for row in self._rows.values()]
+        for column, op, value in filters:
+            rows = [row for row in rows if _matches(row.get(column), op, value)]
+        if order:
+            column, _, direction = order.partition('.')
+            rows.sort(key=lambda row: row.get(column, 0), reverse=(direction == 'desc'))
+        return rows
+
+    def __len__(self):
+        with self._lock:
+            return len(self._rows)
+
+
+def _matches(actual, op, value):
+    if op == 'eq':
+        return str(actual) == value
+    try:
+        actual, value = float(actual), float(value)
+    except (TypeError, ValueError):
+        return False
+    return {'gt': actual > value, 'gte': actual >= value,
+            'lt': actual < value, 'lte': actual <= value}.get(op, False)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive, as Supabase
+    disable_nagle_algorithm = True  # Headers and body go out in separate writes
+
+    def log_message(self, format, *args):
+        pass  # Quiet: load tests make thousands of requests
+
+    # -- fault injection -------------------------------------------------
+
+    def _inject_faults(self):
+        """Apply latency/drops/errors. Returns True if the request was handled."""
+        server = self.server
+        server.count('requests')
+        if server.latency or server.jitter:
+            time.sleep(server.latency + server.rng.uniform(0, server.jitter))
+        roll = server.rng.random()
+        if roll < server.drop_rate:
+            server.count('dropped')
+            self.close_connection = True
+            self.connection.close()
+            return True
+        if roll < server.drop_rate + server.error_rate:
+            server.count('errors')
+            self._send_json(503, {"message": "injected error"})
+            return True
+        return False
+
+    # -- helpers -----------------------------------------------------------
+
+    def _send_json(self, status, data, headers=None):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _parse(self):
+        parts = urlsplit(self.path)
+        return parts.path, parse_qsl(parts.query)
+
+    def _authorized(self):
+        key = self.server.api_key
+        return key is None or self.headers.get('apikey') == key
+
+    # -- methods -----------------------------------------------------------
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+        if self._inject_faults():
+            return
+        path, query = self._parse()
+        if path != SCORES_PATH:
+            self._send_json(404, {"message": "not found"})
+            return
+        if not self._authorized():
+            self._send_json(401, {"message": "invalid api key"})
+            return
+        if dict(query).get('on_conflict') != 'player_id':
+            self._send_json(409, {"message": "duplicate key (on_conflict=player_id required)"})
+            return
+        try:
+            data = json.loads(body)
+            rows = data if isinstance(data, list) else [data]
+            self.server.store.upsert(rows)
+        except (ValueError, AttributeError) as e:
+            self._send_json(400, {"message": str(e)})
+            return
+        self.server.count('upserts', len(rows))
+        if 'return=representation' in self.headers.get('Prefer', ''):
+            self._send_json(201, rows)
+        else:
+            self._send_json(201, [])
+
+    def do_GET(self):
+        if self._inject_faults():
+            return
+        path, query = self._parse()
+        if path != SCORES_PATH:
+            self._send_json(404, {"message": "not found"})
+            return
+        if not self._authorized():
+            self._send_json(401, {"message": "invalid api key"})
+            return
+
+        select, order, filters = None, None, []
+        for name, value in query:
+            if name == 'select':
+                select = [c for c in value.split(',') if c and c != '*'] or None
+            elif name == 'order':
+                order = value
+            else:
+                op, _, operand = value.partition('.')
+                filters.append((name, op, operand))
+        rows = self.server.store.select(filters, order)
+        total = len(rows)
+
+        start, end = 0, total - 1
+        range_header = self.headers.get('Range')
+        if range_header:
+            first, _, last = range_header.partition('-')
+            start = int(first or 0)
+            end = min(int(last), total - 1) if last else total - 1
+        rows = rows[start:end + 1]
+        if select:
+            rows = [{c: row.get(c) for c in select} for row in rows]
+
+        body = json.dumps(rows, ensure_ascii=False).encode('utf-8')
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        headers = {'ETag': etag}
+        if 'count=exact' in self.headers.get('Prefer', ''):
+            shown = f"{start}-{start + len(rows) - 1}" if rows else "*"
+            headers['Content-Range'] = f"{shown}/{total}"
+
+        if self.headers.get('If-None-Match') == etag:
+            self.server.count('not_modified')
+            self.send_response(304)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self._send_json(200, rows, headers)
+
+
+class DevServer(ThreadingHTTPServer):
+    """Threaded HTTP server with a ScoreStore and fault injection.
+
+    Args:
+        host, port: Listen address (port 0 = pick a free port)
+        latency: Seconds added to every request
+        jitter: Extra random latency in [0, jitter] seconds
+        error_rate: Share of requests answered with 503
+        drop_rate: Share of requests whose connection is closed without an answer
+        api_key: Required apikey header (None = accept any)
+        seed: Seed for fault injection
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, jitter=0.0,
+                 error_rate=0.0, drop_rate=0.0, api_key=None, seed=None):
+        super().__init__((host, port), _Handler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.api_key = api_key
+        self.rng = random.Random(seed)
+        self.store = ScoreStore()
+        self.stats = {}
+        self._stats_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, name, amount=1):
+        with self._stats_lock:
+            self.stats[name] = self.stats.get(name, 0) + amount
+
+    def start(self):
+        """Serve in a background thread. Returns self."""
+        self._thread = threading.Thread(target=self.serve_forever, name="dev-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Supabase scores API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8787)
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds per request")
+    parser.add_argument('--jitter', type=float, default=0.0, help="extra random seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="share of 503 answers")
+    parser.add_argument('--drop-rate', type=float, default=0.0, help="share of dropped connections")
+    parser.add_argument('--api-key', default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    server = DevServer(args.host, args.port, args.latency, args.jitter,
+                       args.error_rate, args.drop_rate, args.api_key, args.seed)
+    print(f"Serving scores API on {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Stats: {server.stats}, rows: {len(server.store)}")
+
+
+if __name__ == "__main__":
+    main()
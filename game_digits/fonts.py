@@ -0,0 +1,35 @@
+"""
+Кэш шрифтов по (файл, размер).
+
+pygame.font.Font читает и разбирает TTF-файл при каждом создании, поэтому
+окна и спрайты берут шрифты отсюда. При смене масштаба кэш очищается
+(старые размеры больше не нужны).
+"""
+
+import pygame
+
+from game_digits import get_font_path
+from game_digits import scale
+
+BOLD_FONT = "2204.ttf"
+TILE_FONT = "OpenSans-VariableFont_wdth,wght.ttf"
+
+_fonts = {}
+
+
+def get_font(filename, size):
+    """Шрифт из папки assets/fonts заданного размера (общий объект, не менять стиль)."""
+    key = (filename, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(get_font_path(filename), size)
+        _fonts[key] = font
+    return font
+
+
+def clear_cache():
+    """Сбросить кэш (вызывается при смене масштаба)."""
+    _fonts.clear()
+
+
+scale.add_listener(clear_cache)
@@ -1,19 +1,26 @@
 import random
 import pygame
 
+from game_digits import instrument
+from game_digits import log
 from game_digits import scale
 from game_digits.constants import COLORS, BOARD_SIZE
 from game_digits.sprites import Tile
 from game_digits.patterns import get_random_pattern
 
+_logger = log.get_logger('game')
+
 
 class Game:
     COUNTDOWN_EVENT = pygame.USEREVENT + 2
-    TILE_APPEAR_EVENT = pygame.USEREVENT + 3
 
-    def __init__(self, tiles, time_limit=300):
+    def __init__(self, tiles, time_limit=300, board_size=BOARD_SIZE, seed=None):
         self.tiles = tiles
-        self.board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        # Seed of the game's random generator (stored in game history)
+        self.seed = seed if seed is not None else random.randrange(2 ** 31)
+        self.rng = random.Random(self.seed)
+        self.board_size = board_size
+        self.board = [[None for _ in range(board_size)] for _ in range(board_size)]
         self.score = 0
         self.time_limit = time_limit
         self.current_time = time_limit
@@ -24,37 +31,74 @@ class Game:
         self.COLORS = COLORS
         self.prepare_to_end = False
 
+        # Statistics for game history
+        self.moves = 0
+        self.removals = 0
+
         # Tile appearance animation state
         self.is_initializing = True
         self.tile_appear_delay = 25  # ms between tile appearances
         self.pending_tiles = []  # List of (position, number) to appear
+        self.next_tile_index = 0  # Cursor into pending_tiles
+        self.appear_start_time = None  # Timeline start (ms), None = not running
         self.current_pattern_name = None
         self.prepare_tile_appearance()
 
     def prepare_tile_appearance(self):
         """Prepare tiles for animated appearance."""
-        pattern_name, positions = get_random_pattern()
-        self.current_pattern_name = pattern_name
+        self.current_pattern_name, self.pending_tiles = self.initial_tiles()
+        self.next_tile_index = 0
 
+    def initial_tiles(self):
+        """Board setup: (pattern name, [(position, number), ...]) in appearance order.
+
+        The full game fills the board along a random appearance pattern;
+        TestGame overrides this with its 6-tile layout.
+        """
+        pattern_name, positions = get_random_pattern(self.board_size, self.rng)
         # Generate random numbers for each position
-        self.pending_tiles = []
-        for pos in positions:
-            number = random.randint(1, 9)
-            self.pending_tiles.append((pos, number))
+        return pattern_name, [(pos, self.rng.randint(1, 9)) for pos in positions]
+
+    def start_tile_appearance(self, start_time=None):
+        """Start the tile appearance timeline.
+
+        Tile i appears at start_time + (i + 1) * tile_appear_delay, so the
+        intro lasts exactly get_intro_duration() regardless of frame rate.
+        """
+        self.appear_start_time = pygame.time.get_ticks() if start_time is None else start_time
+
+    def get_intro_duration(self):
+        """Designed duration of the appearance animation in ms."""
+        return len(self.pending_tiles) * self.tile_appear_delay
 
-    def start_tile_appearance(self):
-        """Start the tile appearance animation timer."""
-        pygame.time.set_timer(self.TILE_APPEAR_EVENT, self.tile_appear_delay)
+    def spawn_due_tiles(self, now=None):
+        """Spawn every tile whose appear time has come (several per frame if needed).
+
+        Returns:
+            list: Tiles spawned by this call
+        """
+        if self.appear_start_time is None:
+            return []
+        if now is None:
+            now = pygame.time.get_ticks()
+        due = min(len(self.pending_tiles), (now - self.appear_start_time) // self.tile_appear_delay)
+        spawned = []
+        while self.next_tile_index < due:
+            spawned.append(self.spawn_next_tile())
+        if self.next_tile_index >= len(self.pending_tiles):
+            # All tiles spawned
+            self.appear_start_time = None
+            self.is_initializing = False
+        return spawned
 
     def spawn_next_tile(self):
         """Spawn the next tile in the appearance sequence."""
-        if not self.pending_tiles:
-            # All tiles spawned
-            pygame.time.set_timer(self.TILE_APPEAR_EVENT, 0)
+        if self.next_tile_index >= len(self.pending_tiles):
             self.is_initializing = False
             return None
 
-        pos, number = self.pending_tiles.pop(0)
+        pos, number = self.pending_tiles[self.next_tile_index]
+        self.next_tile_index += 1
         row, col = pos
         tile = Tile(number, (row, col), COLORS[number])
         self.board[row][col] = tile
@@ -74,6 +118,7 @@ class Game:
             self.selected_tile = None
             self.original_color = None
 
+    @instrument.timed('game.remove_tiles')
     def remove_tiles(self, tile1, tile2):
         """
         Удаляет пару плиток если они подходят.
@@ -92,6 +137,8 @@ class Game:
                     self.board[x1][j] is None for j in range(min(y1, y2) + 1, max(y1, y2))
                 ):
                     self.score += (abs(y1 - y2) + 1) * (abs(y1 - y2) + 2) // 2
+                    self.removals += 1
+                    instrument.count('game.removals')
                     self.board[x1][y1] = None
                     self.board[x2][y2] = None
                     self.tiles.remove(tile1, tile2)
@@ -105,6 +152,8 @@ class Game:
                     self.board[i][y1] is None for i in range(min(x1, x2) + 1, max(x1, x2))
                 ):
                     self.score += (abs(x1 - x2) + 1) * (abs(x1 - x2) + 2) // 2
+                    self.removals += 1
+                    instrument.count('game.removals')
                     self.board[x1][y1] = None
                     self.board[x2][y2] = None
                     self.tiles.remove(tile1, tile2)
@@ -115,6 +164,7 @@ class Game:
                     return positions
         return None
 
+    @instrument.timed('game.add_new_tile')
     def add_new_tile(self):
         """
         Добавляет новую плитку на свободную позицию.
@@ -137,20 +187,20 @@ class Game:
                 right_col = (tile.rect.x + scale.TILE_SIZE - 1 - scale.GAP) // cell_size
                 bottom_row = (tile.rect.y + scale.TILE_SIZE - 1 - scale.GAP) // cell_size
                 # Добавляем все ячейки которые плитка пересекает
-                for row in range(max(0, top_row), min(BOARD_SIZE, bottom_row + 1)):
-                    for col in range(max(0, left_col), min(BOARD_SIZE, right_col + 1)):
+                for row in range(max(0, top_row), min(self.board_size, bottom_row + 1)):
+                    for col in range(max(0, left_col), min(self.board_size, right_col + 1)):
                         occupied_positions.add((row, col))
             else:
                 # Позиция неподвижной плитки
                 occupied_positions.add(tile.position)
 
         empty_positions = [
-            (i, j) for i in range(BOARD_SIZE) for j in range(BOARD_SIZE)
+            (i, j) for i in range(self.board_size) for j in range(self.board_size)
             if self.board[i][j] is None and (i, j) not in occupied_positions
         ]
 
         if empty_positions:
-            position = random.choice(empty_positions)
+            position = self.rng.choice(empty_positions)
             existing_numbers = set(tile.number for tile in self.tiles)
             possible_numbers = set()
             for num in existing_numbers:
@@ -158,7 +208,7 @@ class Game:
                 possible_numbers.add(num)
                 possible_numbers.add(pair)
             if possible_numbers:
-                number = random.choice(list(possible_numbers))
+                number = self.rng.choice(list(possible_numbers))
                 color = self.COLORS[number]
                 new_tile = Tile(number, position, color)
                 self.tiles.add(new_tile)
@@ -191,10 +241,26 @@ class Game:
     def post_remove_actions(self):
         if not self.timer_started:
             self.start_timer()
-        if not any(tile for row in self.board for tile in row):
+        # Все плитки на доске входят в self.tiles - проверка за O(1)
+        if not self.tiles:
             self.prepare_to_end = True
             self.stop_timer()
 
+    def get_stats(self):
+        """Статистика партии для истории игр."""
+        return {
+            'pattern': self.current_pattern_name,
+            'duration': self.time_limit - self.current_time,
+            'moves': self.moves,
+            'removals': self.removals,
+            'seed': self.seed,
+            'board_size': self.board_size,
+        }
+
+    def has_empty_cells(self):
+        """Есть ли на доске свободные ячейки (без сканирования доски)."""
+        return len(self.tiles) < self.board_size * self.board_size
+
     def deduct_score(self, n):
         deduction = sum(range(1, n + 1))
         self.score = max(0, self.score - deduction)
@@ -221,14 +287,18 @@ class Game:
         old_x, old_y = old_position
         new_x, new_y = new_position
 
-        # Проверяем что целевая ячейка не занята другой плиткой
+        # Проверяем что целевая ячейка не занята другой плиткой. Движущаяся плитка
+        # числится на доске в стартовой ячейке, пока не остановится, но уже уехала
+        # из неё (иначе планировщик предсказал бы столкновение) - ячейку можно занять
         existing = self.board[new_x][new_y]
-        if existing is not None and existing != tile:
-            # Ячейка занята! Это критическая ошибка логики коллизий
+        if existing is not None and existing != tile and not existing.is_moving:
+            # Ячейка занята! Это ошибка логики коллизий
             # Не перезаписываем - оставляем плитку на старом месте
-            print(f"WARNING: Collision not handled! Tile at {new_position} blocked by another tile")
+            _logger.warning('collision_not_handled', cell=new_position, origin=old_position)
             return False
 
-        self.board[old_x][old_y] = None
+        # Стартовую ячейку могла уже занять другая плитка (см. выше)
+        if self.board[old_x][old_y] is tile:
+            self.board[old_x][old_y] = None
         self.board[new_x][new_y] = tile
         return True
@@ -0,0 +1,275 @@
+"""
+Game history: every finished game in an SQLite database.
+
+records.json keeps only the top 10. history.db stores all games with their
+statistics (pattern, duration, moves, removals, seed, board size), and the
+top list, percentiles, daily bests and rank progression are indexed queries
+over the games of one board size.
+
+The database runs in WAL mode with synchronous=NORMAL, and all SQL is
+constant text, so sqlite3's statement cache reuses prepared statements.
+The game never touches it on the main thread: record_game_async() and
+top_async() run on the I/O executor (the records panel and the place in
+the result window come from the in-memory records.py cache).
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from game_digits import io_executor
+from game_digits import main_thread
+from game_digits import records
+from game_digits import settings
+from game_digits import storage
+from game_digits.ranks import get_rank_name
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    played_at TEXT NOT NULL,
+    day TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    bonus INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    rank TEXT NOT NULL,
+    pattern TEXT,
+    duration INTEGER,
+    moves INTEGER,
+    removals INTEGER,
+    seed INTEGER,
+    board_size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_games_board_total ON games(board_size, total);
+CREATE INDEX IF NOT EXISTS idx_games_board_day_total ON games(board_size, day, total);
+CREATE INDEX IF NOT EXISTS idx_games_board_id ON games(board_size, id);
+"""
+
+_INSERT_GAME = """
+INSERT INTO games (played_at, day, score, bonus, total, rank,
+                   pattern, duration, moves, removals, seed, board_size)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SELECT_TOP = """
+SELECT score, bonus, total, rank, played_at FROM games WHERE board_size = ?
+ORDER BY total DESC, id ASC LIMIT ?
+"""
+_SELECT_BEST = "SELECT MAX(total) FROM games WHERE board_size = ?"
+_SELECT_COUNT_ALL = "SELECT COUNT(*) FROM games"
+_SELECT_COUNT = "SELECT COUNT(*) FROM games WHERE board_size = ?"
+_SELECT_COUNT_BELOW = "SELECT COUNT(*) FROM games WHERE board_size = ? AND total < ?"
+_SELECT_TOTAL_AT = """
+SELECT total FROM games WHERE board_size = ? ORDER BY total LIMIT 1 OFFSET ?
+"""
+_SELECT_DAILY_BEST = """
+SELECT day, MAX(total) FROM games WHERE board_size = ?
+GROUP BY day ORDER BY day DESC LIMIT ?
+"""
+# Games that beat the best of all earlier games (running maximum over the id order)
+_SELECT_PROGRESS = """
+SELECT played_at, total FROM (
+    SELECT id, played_at, total,
+           MAX(total) OVER (ORDER BY id ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING) AS best
+    FROM games WHERE board_size = ?
+) WHERE best IS NULL OR total > best ORDER BY id
+"""
+
+
+def get_history_path(test_mode=False):
+    """Get the path to the history database."""
+    records_dir = Path.home() / ".game_digits"
+    records_dir.mkdir(exist_ok=True)
+    filename = "test_history.db" if test_mode else "history.db"
+    return records_dir / filename
+
+
+def _display_date(played_at):
+    """ISO timestamp -> 'dd.mm.yyyy' (the format records.json uses)."""
+    try:
+        return datetime.fromisoformat(played_at).strftime('%d.%m.%Y')
+    except ValueError:
+        return played_at
+
+
+class GameHistory:
+    """SQLite store of all finished games, queried for one board size.
+
+    If the database cannot be opened, every query returns an empty result
+    and record_game() does nothing (same as records.py on I/O errors).
+    The connection is shared by the I/O worker threads under a lock.
+    """
+
+    def __init__(self, test_mode=False, board_size=None):
+        self.test_mode = test_mode
+        self.board_size = board_size or settings.DEFAULT_BOARD_SIZE
+        self.path = get_history_path(test_mode)
+        self.conn = None
+        self._lock = threading.Lock()
+        try:
+            self.conn = sqlite3.connect(self.path, cached_statements=64, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self._migrate()
+        except sqlite3.Error:
+            self.conn = None
+
+    def _migrate(self):
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self._import_legacy_records()
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _import_legacy_records(self):
+        """Seed an empty database with the old top 10 from records.json."""
+        if self.conn.execute(_SELECT_COUNT_ALL).fetchone()[0]:
+            return
+        # The file itself, not the repository: this runs on a worker thread
+        legacy = storage.read_json(records.get_records_path(self.test_mode), [])
+        if not isinstance(legacy, list):
+            legacy = []
+        rows = []
+        for rec in reversed(legacy):
+            try:
+                played = datetime.strptime(rec.get('date', ''), '%d.%m.%Y')
+            except ValueError:
+                played = datetime.now()
+            total = rec.get('total', 0)
+            rows.append((
+                played.isoformat(timespec='seconds'), played.date().isoformat(),
+                rec.get('score', 0), rec.get('bonus', 0), total,
+                rec.get('rank') or get_rank_name(total),
+                None, None, None, None, None, settings.DEFAULT_BOARD_SIZE,
+            ))
+        self.conn.executemany(_INSERT_GAME, rows)
+
+    def _query(self, sql, params=()):
+        if self.conn is None:
+            return []
+        try:
+            with self._lock:
+                return self.conn.execute(sql, params).fetchall()
+        except sqlite3.Error:
+            return []
+
+    def record_game(self, score, bonus, total, rank=None, pattern=None, duration=None,
+                    moves=None, removals=None, seed=None, board_size=None):
+        """Store a finished game (board_size defaults to the board of this history).
+
+        Returns:
+            int or None: Row id of the stored game
+        """
+        if self.conn is None:
+            return None
+        now = datetime.now()
+        try:
+            with self._lock, self.conn:
+                cursor = self.conn.execute(_INSERT_GAME, (
+                    now.isoformat(timespec='seconds'), now.date().isoformat(),
+                    score, bonus, total, rank or get_rank_name(total),
+                    pattern, duration, moves, removals, seed, board_size or self.board_size,
+                ))
+            return cursor.lastrowid
+        except sqlite3.Error:
+            return None
+
+    def top(self, limit=records.MAX_RECORDS):
+        """Best games, in the same dict format as records.load_records()."""
+        return [
+            {'score': score, 'bonus': bonus, 'total': total, 'rank': rank,
+             'date': _display_date(played_at)}
+            for score, bonus, total, rank, played_at in self._query(_SELECT_TOP, (self.board_size, limit))
+        ]
+
+    def best_score(self):
+        """Best total score, or 0 if there are no games."""
+        rows = self._query(_SELECT_BEST, (self.board_size,))
+        return (rows[0][0] or 0) if rows else 0
+
+    def count(self):
+        rows = self._query(_SELECT_COUNT, (self.board_size,))
+        return rows[0][0] if rows else 0
+
+    def percentile_of(self, total):
+        """Share of games (0..100) with a lower total than this one, or None on a database error."""
+        count = self.count()
+        if not count:
+            return 100.0
+        rows = self._query(_SELECT_COUNT_BELOW, (self.board_size, total))
+        if not rows:
+            return None
+        return 100.0 * rows[0][0] / count
+
+    def score_at_percentile(self, percent):
+        """Total at the given percentile (nearest rank), or None without games."""
+        count = self.count()
+        if not count:
+            return None
+        offset = min(count - 1, max(0, round(percent / 100 * (count - 1))))
+        rows = self._query(_SELECT_TOTAL_AT, (self.board_size, offset))
+        return rows[0][0] if rows else None
+
+    def daily_best(self, days=30):
+        """List of (day 'YYYY-MM-DD', best total), most recent first."""
+        return self._query(_SELECT_DAILY_BEST, (self.board_size, days))
+
+    def rank_progression(self):
+        """Games that raised the personal best: list of (played_at, total, rank).
+
+        Ranks are recomputed from totals so old rows follow current thresholds.
+        """
+        return [
+            (played_at, total, get_rank_name(total))
+            for played_at, total in self._query(_SELECT_PROGRESS, (self.board_size,))
+        ]
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+# Process-wide connections: (test_mode, board_size) -> GameHistory
+_histories = {}
+_histories_lock = threading.Lock()
+
+
+def get_history(test_mode=False, board_size=None):
+    """Get the shared game history for the given mode and board size.
+
+    Opening runs the migration, so call it from the I/O executor.
+    """
+    key = (test_mode, board_size or settings.DEFAULT_BOARD_SIZE)
+    with _histories_lock:
+        history = _histories.get(key)
+        if history is None:
+            history = GameHistory(*key)
+            _histories[key] = history
+    return history
+
+
+def record_game_async(game, test_mode=False):
+    """Store a finished game on the I/O executor.
+
+    Args:
+        game: Keyword arguments of GameHistory.record_game() (board_size picks the history)
+    """
+    return io_executor.submit(_record_game, game, test_mode)
+
+
+def _record_game(game, test_mode):
+    get_history(test_mode, game.get('board_size')).record_game(**game)
+
+
+def top_async(callback, test_mode=False, board_size=None, limit=records.MAX_RECORDS):
+    """Read the best games on the I/O executor; callback(rows) runs on the main thread."""
+    return io_executor.submit(_top, callback, test_mode, board_size, limit)
+
+
+def _top(callback, test_mode, board_size, limit):
+    main_thread.call_soon(callback, get_history(test_mode, board_size).top(limit))
@@ -0,0 +1,184 @@
+"""
+Hot-path instrumentation: named timers and counters.
+
+    from game_digits import instrument
+
+    @instrument.timed('game.remove_tiles')
+    def remove_tiles(...): ...
+
+    with instrument.timer('records.sort'):
+        ...
+
+    instrument.count('game.removals')
+
+Instrumentation is off unless the GAME_DIGITS_INSTRUMENT environment
+variable is set or main.py gets --instrument[=PATH]; either must happen
+before the instrumented modules are imported. While off, timed() returns
+the function itself, timer() returns a shared no-op context manager and
+count() is a no-op function, so instrumented code runs as before.
+
+While on, every timer collects calls/total/min/max and at exit the report
+is written to PATH (default ~/.game_digits/instrument.json). A path ending
+in .csv produces one row per timer and counter, which is convenient for
+comparing builds side by side.
+"""
+
+import atexit
+import contextlib
+import csv
+import functools
+import io
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_PATH = Path.home() / ".game_digits" / "instrument.json"
+ENV_VAR = 'GAME_DIGITS_INSTRUMENT'
+
+_enabled = False
+_path = None
+_lock = threading.Lock()
+_timers = {}    # name -> [calls, total_s, min_s, max_s]
+_counters = {}  # name -> int
+
+_NULL_TIMER = contextlib.nullcontext()
+
+
+def is_enabled():
+    return _enabled
+
+
+def _record(name, seconds):
+    with _lock:
+        stats = _timers.get(name)
+        if stats is None:
+            _timers[name] = [1, seconds, seconds, seconds]
+        else:
+            stats[0] += 1
+            stats[1] += seconds
+            if seconds < stats[2]:
+                stats[2] = seconds
+            if seconds > stats[3]:
+                stats[3] = seconds
+
+
+class _Timer:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+def timer(name):
+    """Context manager timing its block under name (no-op when disabled)."""
+    if not _enabled:
+        return _NULL_TIMER
+    return _Timer(name)
+
+
+def timed(name=None):
+    """Decorator timing every call under name (default: module.qualname).
+
+    Applied at import time: when instrumentation is off, the function is
+    returned unchanged.
+    """
+    def decorate(fn):
+        if not _enabled:
+            return fn
+        label = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _record(label, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+def _count_noop(name, amount=1):
+    pass
+
+
+def _count(name, amount=1):
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+count = _count_noop
+
+
+def enable(path=None):
+    """Turn instrumentation on and export the report at exit.
+
+    Args:
+        path: Report file (.json or .csv); default DEFAULT_PATH
+    """
+    global _enabled, _path, count
+    if not _enabled:
+        atexit.register(export)
+    _enabled = True
+    _path = Path(path) if path else DEFAULT_PATH
+    count = _count
+
+
+def report():
+    """Current timers and counters as a JSON-ready dict."""
+    with _lock:
+        timers = {
+            name: {
+                'calls': calls,
+                'total_ms': round(total * 1000, 4),
+                'mean_us': round(total / calls * 1e6, 3),
+                'min_us': round(low * 1e6, 3),
+                'max_us': round(high * 1e6, 3),
+            }
+            for name, (calls, total, low, high) in sorted(_timers.items())
+        }
+        counters = dict(sorted(_counters.items()))
+    return {'timers': timers, 'counters': counters}
+
+
+def _to_csv(data):
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(['kind', 'name', 'calls', 'total_ms', 'mean_us', 'min_us', 'max_us', 'value'])
+    for name, stats in data['timers'].items():
+        writer.writerow(['timer', name, stats['calls'], stats['total_ms'], stats['mean_us'],
+                         stats['min_us'], stats['max_us'], ''])
+    for name, value in data['counters'].items():
+        writer.writerow(['counter', name, '', '', '', '', '', value])
+    return out.getvalue()
+
+
+def export(path=None):
+    """Write the report to path (default: the path given to enable())."""
+    if not _enabled:
+        return None
+    from game_digits import storage
+    path = Path(path) if path else _path
+    data = report()
+    text = _to_csv(data) if path.suffix.lower() == '.csv' else json.dumps(data, indent=2)
+    try:
+        storage.write_text_atomic(path, text)
+    except OSError:
+        return None
+    return path
+
+
+# Environment switch: GAME_DIGITS_INSTRUMENT=1 or GAME_DIGITS_INSTRUMENT=/path/report.csv
+_env = os.environ.get(ENV_VAR, '')
+if _env and _env != '0':
+    enable(None if _env == '1' else _env)
@@ -0,0 +1,216 @@
+"""
+Bounded executor for background I/O (disk writes, API calls, logs).
+
+A fixed number of worker threads take tasks from one bounded queue, so the
+game loop only enqueues and never waits on disk or network.
+
+Back-pressure policy:
+- A task with a key replaces its queued (not yet started) predecessor with
+  the same key, so repeated saves of one file or repeated upload pumps
+  collapse into one slot. Tasks with the same key never run concurrently.
+- When the queue already holds max_queue tasks, droppable tasks (logs) are
+  rejected and counted in `dropped`. Keyed tasks are still accepted (their
+  number is bounded by the number of keys). Other tasks (a game stored in
+  history, a score put into the outbox) wait in submit() until a worker
+  takes a task, so the queue stays bounded; submitted from a worker thread
+  they are accepted at once, since waiting there could deadlock the pool.
+- A task may be delayed (retry backoff); delayed tasks are discarded at
+  shutdown, since everything that must survive is already on disk.
+"""
+
+import atexit
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+DEFAULT_WORKERS = 2
+DEFAULT_QUEUE_SIZE = 64
+
+
+class _Task:
+    __slots__ = ('fn', 'args', 'kwargs', 'key', 'not_before', 'future')
+
+    def __init__(self, fn, args, kwargs, key, not_before):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key
+        self.not_before = not_before
+        self.future = Future()
+
+
+class IOExecutor:
+    """Fixed pool of I/O worker threads with a bounded task queue.
+
+    Args:
+        max_workers: Number of worker threads (started on first submit)
+        max_queue: Queue size above which droppable tasks are rejected
+        name: Thread name prefix
+    """
+
+    def __init__(self, max_workers=DEFAULT_WORKERS, max_queue=DEFAULT_QUEUE_SIZE, name="io"):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.name = name
+        self._cond = threading.Condition()
+        self._tasks = deque()
+        self._active = 0
+        self._active_keys = set()
+        self._threads = []
+        self._shutdown = False
+        self.dropped = 0  # Droppable tasks rejected because the queue was full
+
+    def _start_workers(self):
+        while len(self._threads) < self.max_workers:
+            thread = threading.Thread(
+                target=self._worker, name=f"{self.name}-{len(self._threads)}", daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def submit(self, fn, *args, key=None, delay=0.0, droppable=False, **kwargs):
+        """Queue fn(*args, **kwargs) for a worker thread.
+
+        Blocks only for a task without key and droppable while the queue is full.
+
+        Args:
+            key: Coalescing key (see module docstring)
+            delay: Seconds to wait before the task may run
+            droppable: Task may be rejected when the queue is full
+
+        Returns:
+            Future, or None if the task was rejected (queue full or shut down)
+        """
+        task = _Task(fn, args, kwargs, key, time.monotonic() + delay)
+        with self._cond:
+            if self._shutdown:
+                return None
+            if key is not None:
+                for queued in self._tasks:
+                    if queued.key == key:
+                        self._tasks.remove(queued)
+                        queued.future.cancel()
+                        break
+            if droppable and len(self._tasks) >= self.max_queue:
+                self.dropped += 1
+                return None
+            if key is None and threading.current_thread() not in self._threads:
+                while len(self._tasks) >= self.max_queue and not self._shutdown:
+                    self._cond.wait()
+                if self._shutdown:
+                    return None
+            self._tasks.append(task)
+            self._start_workers()
+            self._cond.notify()
+        return task.future
+
+    def _next_task(self):
+        """Pop the first due task whose key is not running. Caller holds the lock.
+
+        Returns:
+            (task, wait_seconds): task or None, and how long to wait if None
+        """
+        now = time.monotonic()
+        wait = None
+        for task in self._tasks:
+            if task.key is not None and task.key in self._active_keys:
+                continue
+            if task.not_before <= now:
+                self._tasks.remove(task)
+                self._cond.notify_all()  # A slot is free for a waiting submit()
+                return task, None
+            remaining = task.not_before - now
+            wait = remaining if wait is None else min(wait, remaining)
+        return None, wait
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while True:
+                    task, wait = self._next_task()
+                    if task is not None:
+                        break
+                    if self._shutdown and not self._tasks:
+                        return
+                    self._cond.wait(wait)
+                self._active += 1
+                if task.key is not None:
+                    self._active_keys.add(task.key)
+
+            if task.future.set_running_or_notify_cancel():
+                try:
+                    task.future.set_result(task.fn(*task.args, **task.kwargs))
+                except BaseException as e:
+                    task.future.set_exception(e)
+
+            with self._cond:
+                self._active -= 1
+                self._active_keys.discard(task.key)
+                self._cond.notify_all()
+
+    def _is_idle(self):
+        now = time.monotonic()
+        return self._active == 0 and not any(t.not_before <= now for t in self._tasks)
+
+    def wait_idle(self, timeout=None):
+        """Wait until no task is running or due (delayed tasks are ignored).
+
+        Returns:
+            bool: True if idle, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while not self._is_idle():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                # Poll so that newly due delayed tasks are noticed
+                self._cond.wait(0.05 if remaining is None else min(remaining, 0.05))
+        return True
+
+    def shutdown(self, timeout=None):
+        """Stop accepting tasks, finish queued ones and join workers.
+
+        Delayed tasks that are not yet due are discarded.
+
+        Returns:
+            bool: True if all work finished within timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._shutdown = True
+            now = time.monotonic()
+            for task in [t for t in self._tasks if t.not_before > now]:
+                self._tasks.remove(task)
+                task.future.cancel()
+            self._cond.notify_all()
+        for thread in self._threads:
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            thread.join(remaining)
+        return not any(thread.is_alive() for thread in self._threads)
+
+
+_executor = None
+
+
+def get_executor():
+    """The process-wide I/O executor (created on first use)."""
+    global _executor
+    if _executor is None:
+        _executor = IOExecutor()
+        # Safety net for scripts that don't call shutdown() themselves
+        atexit.register(_executor.shutdown, 2.0)
+    return _executor
+
+
+def submit(fn, *args, **kwargs):
+    """Submit a task to the process-wide executor (see IOExecutor.submit)."""
+    return get_executor().submit(fn, *args, **kwargs)
+
+
+def shutdown(timeout=None):
+    """Flush and stop the process-wide executor (called from main.py on exit)."""
+    if _executor is None:
+        return True
+    return _executor.shutdown(timeout)
@@ -0,0 +1,134 @@
+"""
+Global leaderboard: top players and this player's position.
+
+The UI only reads get_cached(), an in-memory copy owned by the main thread.
+refresh() schedules a background task on the I/O executor that:
+- loads the disk cache (~/.game_digits/leaderboard.json) on first use,
+- if the cache is older than CACHE_TTL, asks the server with If-None-Match
+  (a 304 answer costs no body) and a Range header for the top-N slice,
+- saves the result to disk and hands it to the main thread via main_thread.
+
+When the server is unreachable, the last cached copy keeps being shown.
+"""
+
+import time
+from pathlib import Path
+
+from game_digits import io_executor
+from game_digits import log
+from game_digits import main_thread
+from game_digits import storage
+
+CACHE_PATH = Path.home() / ".game_digits" / "leaderboard.json"
+CACHE_TTL = 300  # seconds
+TOP_N = 10
+
+_logger = log.get_logger('leaderboard')
+
+# Main-thread state
+_cache = None
+_refreshing = False
+
+# Worker-side client (tasks run one at a time under the same executor key)
+_client = None
+
+
+def get_cached():
+    """Last known leaderboard or None. Never touches disk or network.
+
+    Returns:
+        dict with keys: fetched_at, etag, top (list of {name, score, player_id}),
+        total_players, player ({position, score} or None)
+    """
+    return _cache
+
+
+def _set_cache(data):
+    global _cache, _refreshing
+    _refreshing = False
+    if data is not None:
+        _cache = data
+        main_thread.post_result('leaderboard_updated')
+
+
+def _is_fresh(data, now):
+    return data is not None and now - data.get('fetched_at', 0) < CACHE_TTL
+
+
+def _fetch(client, cached):
+    """Query the server, reusing cached rows on 304."""
+    from game_digits import api_client
+    etag = cached.get('etag') if cached else None
+    rows, etag, total = client.fetch_top(TOP_N, etag)
+    if rows is None:
+        # Not modified: keep cached rows and player count
+        rows = cached.get('top', [])
+        total = cached.get('total_players')
+
+    player_id = api_client.get_player_id()
+    player = None
+    for i, row in enumerate(rows):
+        if row.get('player_id') == player_id:
+            player = {'position': i + 1, 'score': row.get('score', 0)}
+            break
+    if player is None:
+        found = client.fetch_player_position(player_id)
+        if found is not None:
+            player = {'position': found[0], 'score': found[1]}
+
+    return {
+        'fetched_at': time.time(),
+        'etag': etag,
+        'top': rows,
+        'total_players': total,
+        'player': player,
+    }
+
+
+def _refresh_task(cached, force, client):
+    global _client
+    if cached is None:
+        cached = storage.read_json(CACHE_PATH)
+        if not isinstance(cached, dict):
+            cached = None
+    if not force and _is_fresh(cached, time.time()):
+        main_thread.call_soon(_set_cache, cached)
+        return
+
+    if client is None:
+        if _client is None:
+            # Imported here, on the worker: the HTTP stack is not needed for the first frame
+            from game_digits import api_client
+            _client = api_client.SupabaseClient()
+        client = _client
+    try:
+        data = _fetch(client, cached)
+    except Exception as e:
+        _logger.warning('refresh_failed', error=str(e))
+        main_thread.call_soon(_set_cache, cached)  # Show the stale copy
+        return
+
+    storage.save_json_async(CACHE_PATH, data)
+    _logger.info('refreshed', players=data['total_players'])
+    main_thread.call_soon(_set_cache, data)
+
+
+def refresh(force=False, client=None):
+    """Update the leaderboard in the background if the cache is stale.
+
+    Call from the main thread. The result arrives through main_thread.dispatch()
+    (get_cached() changes and ASYNC_RESULT_EVENT kind='leaderboard_updated').
+
+    Args:
+        force: Ignore CACHE_TTL
+        client: SupabaseClient to use (e.g. one pointed at a local server)
+    """
+    global _refreshing
+    if _refreshing:
+        return
+    if not force and _is_fresh(_cache, time.time()):
+        return
+    _refreshing = True
+    future = io_executor.submit(_refresh_task, _cache, force, client, key='leaderboard')
+    if future is None:
+        _refreshing = False
@@ -0,0 +1,165 @@
+"""
+Structured game log: JSON lines in ~/.game_digits/game_log.jsonl.
+
+Logging only appends a dict to an in-memory buffer; a flush task on the I/O
+executor writes the buffer in one batch every FLUSH_INTERVAL seconds. The
+file is rotated when it grows past MAX_BYTES (game_log.jsonl.1, .2, ...), so
+the disk footprint is capped at about MAX_BYTES * (BACKUP_COUNT + 1).
+
+Usage:
+    logger = log.get_logger('api')
+    logger.info('submit', score=1200, attempt=1)
+
+The minimum level comes from the GAME_DIGITS_LOG_LEVEL environment variable
+(DEBUG, INFO, WARNING, ERROR; default INFO).
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+from game_digits import io_executor
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: 'DEBUG', INFO: 'INFO', WARNING: 'WARNING', ERROR: 'ERROR'}
+
+LOG_PATH = Path.home() / ".game_digits" / "game_log.jsonl"
+MAX_BYTES = 256 * 1024
+BACKUP_COUNT = 2
+FLUSH_INTERVAL = 1.0  # seconds
+BUFFER_LIMIT = 2000  # Records kept in memory; older ones are dropped when full
+
+
+def _level_from_env():
+    name = os.environ.get('GAME_DIGITS_LOG_LEVEL', 'INFO').upper()
+    for level, level_name in LEVEL_NAMES.items():
+        if level_name == name:
+            return level
+    return INFO
+
+
+class LogWriter:
+    """Buffer of log records with batched, size-rotated writes."""
+
+    def __init__(self, path=LOG_PATH, level=None, max_bytes=MAX_BYTES,
+                 backup_count=BACKUP_COUNT, flush_interval=FLUSH_INTERVAL):
+        self.path = Path(path)
+        self.level = _level_from_env() if level is None else level
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self._buffer = deque(maxlen=BUFFER_LIMIT)
+        self._lock = threading.Lock()
+        self._flush_scheduled = False
+        self.dropped = 0
+
+    def emit(self, level, component, event, fields):
+        if level < self.level:
+            return
+        record = {
+            'ts': round(time.time(), 3),
+            'level': LEVEL_NAMES.get(level, str(level)),
+            'component': component,
+            'event': event,
+        }
+        record.update(fields)
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+            self._buffer.append(record)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        future = io_executor.submit(
+            self.flush, key=('log-flush', str(self.path)), delay=self.flush_interval
+        )
+        if future is None:
+            # Executor shut down (exiting) - write right away
+            self.flush()
+
+    def _rotate(self):
+        for i in range(self.backup_count, 0, -1):
+            source = self.path if i == 1 else self.path.with_name(f"{self.path.name}.{i - 1}")
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{i}"))
+
+    def flush(self):
+        """Write buffered records (runs on the I/O executor or at exit)."""
+        with self._lock:
+            records = list(self._buffer)
+            self._buffer.clear()
+            self._flush_scheduled = False
+        if not records:
+            return
+        lines = "".join(json.dumps(rec, ensure_ascii=False, default=str) + "\n" for rec in records)
+        try:
+            self.path.parent.mkdir(exist_ok=True)
+            try:
+                size = self.path.stat().st_size
+            except OSError:
+                size = 0
+            if size and size + len(lines) > self.max_bytes:
+                self._rotate()
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+        except OSError:
+            pass  # Logging must never break the game
+
+
+class Logger:
+    """Per-component front end of the shared LogWriter."""
+
+    def __init__(self, component, writer):
+        self.component = component
+        self.writer = writer
+
+    def is_enabled(self, level):
+        return level >= self.writer.level
+
+    def log(self, level, event, **fields):
+        self.writer.emit(level, self.component, event, fields)
+
+    def debug(self, event, **fields):
+        self.writer.emit(DEBUG, self.component, event, fields)
+
+    def info(self, event, **fields):
+        self.writer.emit(INFO, self.component, event, fields)
+
+    def warning(self, event, **fields):
+        self.writer.emit(WARNING, self.component, event, fields)
+
+    def error(self, event, **fields):
+        self.writer.emit(ERROR, self.component, event, fields)
+
+
+_writer = None
+_loggers = {}
+
+
+def get_writer():
+    """The process-wide log writer."""
+    global _writer
+    if _writer is None:
+        _writer = LogWriter()
+    return _writer
+
+
+def get_logger(component):
+    """Logger for a component ('api', 'storage', 'perf', ...)."""
+    logger = _loggers.get(component)
+    if logger is None:
+        logger = Logger(component, get_writer())
+        _loggers[component] = logger
+    return logger
+
+
+def flush():
+    """Write everything buffered so far (called from main.py on exit)."""
+    if _writer is not None:
+        _writer.flush()
@@ -0,0 +1,63 @@
+"""
+Delivery of background results to the main (pygame) thread.
+
+Background tasks (I/O executor, API client) must not touch pygame surfaces
+or UI state. They call call_soon() or post_result(), which only put an item
+into a thread-safe queue. The scene loop calls dispatch() once per frame:
+it runs queued callbacks and turns posted results into ASYNC_RESULT_EVENT
+pygame events, until a small per-frame time budget is used up. Whatever is
+left waits for the next frame.
+"""
+
+import queue
+import time
+
+import pygame
+
+from game_digits import log
+
+# Result of a background operation: event.kind + keyword data as attributes
+ASYNC_RESULT_EVENT = pygame.USEREVENT + 4
+
+DISPATCH_BUDGET_MS = 2.0
+
+_queue = queue.SimpleQueue()
+_logger = log.get_logger('main_thread')
+
+
+def call_soon(fn, *args, **kwargs):
+    """Run fn(*args, **kwargs) on the main thread at the next dispatch(). Thread-safe."""
+    _queue.put((fn, args, kwargs))
+
+
+def post_result(kind, **data):
+    """Deliver a result as ASYNC_RESULT_EVENT(kind=kind, **data). Thread-safe."""
+    _queue.put((None, kind, data))
+
+
+def dispatch(budget_ms=DISPATCH_BUDGET_MS):
+    """Process queued items on the main thread, at most budget_ms per call.
+
+    At least one item is processed per call, so the queue always drains.
+
+    Returns:
+        int: Number of items processed
+    """
+    deadline = time.perf_counter() + budget_ms / 1000
+    count = 0
+    while True:
+        try:
+            fn, args, kwargs = _queue.get_nowait()
+        except queue.Empty:
+            break
+        if fn is None:
+            pygame.event.post(pygame.event.Event(ASYNC_RESULT_EVENT, kind=args, **kwargs))
+        else:
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                _logger.error('callback_failed', callback=getattr(fn, '__name__', repr(fn)), error=str(e))
+        count += 1
+        if time.perf_counter() >= deadline:
+            break
+    return count
@@ -0,0 +1,300 @@
+"""
+Event-driven scheduler for tile slides.
+
+All tile motion is axis-aligned, at constant speed, on a grid. So positions
+are a closed-form function of time, and collision times can be computed
+analytically instead of stepping pixel by pixel and testing rects every frame.
+The scheduler predicts the next event (arrival, collision with another moving
+tile, or collision with a static tile) only when the set of slides or the
+board changes. Each frame it only interpolates positions.
+"""
+import math
+
+from game_digits import instrument
+from game_digits import scale
+from game_digits.constants import grid_to_pixel
+
+# Pixel direction vectors (dx, dy) for each move direction
+DIRECTION_VECTORS = {
+    "up": (0, -1),
+    "down": (0, 1),
+    "left": (-1, 0),
+    "right": (1, 0),
+}
+
+# Grid direction vectors (d_row, d_col) for each move direction
+GRID_VECTORS = {
+    "up": (-1, 0),
+    "down": (1, 0),
+    "left": (0, -1),
+    "right": (0, 1),
+}
+
+# Speed presets are expressed in pixels per frame at this nominal frame rate
+NOMINAL_FPS = 60
+
+# Event kinds (order = priority when several events happen at the same time)
+ARRIVAL = 'arrival'
+STATIC_COLLISION = 'static_collision'
+COLLISION = 'collision'
+_EVENT_PRIORITY = {ARRIVAL: 0, STATIC_COLLISION: 1, COLLISION: 2}
+
+
+def speed_per_ms(speed_per_frame):
+    """Convert a speed preset (pixels per nominal frame) to pixels per ms."""
+    return speed_per_frame * NOMINAL_FPS / 1000
+
+
+class Slide:
+    """Constant-speed straight motion of a tile from its cell to a target cell.
+
+    A slide with no direction describes a static body (used for obstacles).
+    """
+
+    __slots__ = ('tile', 'direction', 'dx', 'dy', 'start_x', 'start_y',
+                 'start_cell', 'target_cell', 'speed', 'start_time', 'end_time')
+
+    def __init__(self, tile, direction, start_pos, start_cell, target_cell, speed, start_time):
+        self.tile = tile
+        self.direction = direction
+        self.dx, self.dy = DIRECTION_VECTORS.get(direction, (0, 0))
+        self.start_x, self.start_y = start_pos
+        self.start_cell = start_cell
+        self.target_cell = target_cell
+        self.speed = speed
+        self.start_time = start_time
+        target_x, target_y = grid_to_pixel(*target_cell)
+        distance = abs(target_x - self.start_x) + abs(target_y - self.start_y)
+        self.end_time = start_time + (distance / speed if speed > 0 else 0)
+
+    @classmethod
+    def static(cls, tile, cell):
+        """Create a motionless body occupying a grid cell."""
+        return cls(tile, None, grid_to_pixel(*cell), cell, cell, 0, 0)
+
+    def travelled_at(self, time):
+        """Distance in pixels covered by the given time."""
+        elapsed = min(max(0, time - self.start_time), self.end_time - self.start_time)
+        return self.speed * elapsed
+
+    def position_at(self, time):
+        """Top-left pixel position (floats) at the given time."""
+        travelled = self.travelled_at(time)
+        return self.start_x + self.dx * travelled, self.start_y + self.dy * travelled
+
+    def velocity_at(self, time):
+        """Velocity (vx, vy) in px/ms for the open interval right after `time`."""
+        if self.start_time <= time < self.end_time:
+            return self.dx * self.speed, self.dy * self.speed
+        return 0, 0
+
+    def path_cells(self):
+        """Grid cells the slide passes through, excluding the start cell."""
+        if self.direction is None:
+            return []
+        d_row, d_col = GRID_VECTORS[self.direction]
+        row, col = self.start_cell
+        cells = []
+        while (row, col) != self.target_cell:
+            row += d_row
+            col += d_col
+            cells.append((row, col))
+        return cells
+
+
+class MotionEvent:
+    """A predicted motion event: arrival or collision at a given time."""
+
+    __slots__ = ('time', 'kind', 'tile', 'other')
+
+    def __init__(self, time, kind, tile, other=None):
+        self.time = time
+        self.kind = kind
+        self.tile = tile
+        self.other = other
+
+    def sort_key(self):
+        return self.time, _EVENT_PRIORITY[self.kind]
+
+
+def _overlap_interval(d0, v, size, t_start, t_end):
+    """Open interval within (t_start, t_end) where |d0 + v * (t - t_start)| < size.
+
+    Returns (lo, hi) or None if the interval is empty.
+    """
+    if v == 0:
+        return (t_start, t_end) if abs(d0) < size else None
+    t_a = t_start + (-size - d0) / v
+    t_b = t_start + (size - d0) / v
+    lo = max(min(t_a, t_b), t_start)
+    hi = min(max(t_a, t_b), t_end)
+    if lo >= hi:
+        return None
+    return lo, hi
+
+
+@instrument.timed('motion.predict_collision')
+def predict_collision(a, b, t_from, size):
+    """Earliest time >= t_from at which two bodies' square rects overlap.
+
+    Both bodies move piecewise linearly (they stop on arrival), so the
+    relative offset is linear between breakpoints, and each segment is solved
+    in closed form. Returns the moment of first contact or None.
+    """
+    breakpoints = sorted({t_from} | {
+        t for t in (a.start_time, a.end_time, b.start_time, b.end_time)
+        if t > t_from
+    })
+    breakpoints.append(math.inf)
+
+    for t_start, t_end in zip(breakpoints, breakpoints[1:]):
+        ax, ay = a.position_at(t_start)
+        bx, by = b.position_at(t_start)
+        avx, avy = a.velocity_at(t_start)
+        bvx, bvy = b.velocity_at(t_start)
+
+        x_interval = _overlap_interval(bx - ax, bvx - avx, size, t_start, t_end)
+        if x_interval is None:
+            continue
+        y_interval = _overlap_interval(by - ay, bvy - avy, size, t_start, t_end)
+        if y_interval is None:
+            continue
+
+        lo = max(x_interval[0], y_interval[0])
+        hi = min(x_interval[1], y_interval[1])
+        if lo < hi:
+            return lo
+    return None
+
+
+class MotionScheduler:
+    """Keeps active slides and resolves their arrivals and collisions at event times.
+
+    Usage per frame:
+        for event in scheduler.due_events(now, board):
+            ...resolve event (snap / finalize tiles)...
+        scheduler.interpolate(now)
+    """
+
+    def __init__(self):
+        self.slides = {}
+        self._next_event = None
+        self._dirty = False
+        self._time = 0  # Время последнего разрешённого события: с него идёт предсказание
+
+    def __len__(self):
+        return len(self.slides)
+
+    def __contains__(self, tile):
+        return tile in self.slides
+
+    def clear(self):
+        """Drop all slides (new game)."""
+        self.slides.clear()
+        self._next_event = None
+        self._dirty = False
+        self._time = 0
+
+    def invalidate(self):
+        """Board changed (spawn, removal): re-predict the next event lazily."""
+        self._dirty = True
+
+    def start(self, tile, direction, target_cell, speed, now):
+        """Start sliding a tile from its current cell to target_cell."""
+        self.slides[tile] = Slide(
+            tile, direction, tile.rect.topleft, tile.position, target_cell, speed, now
+        )
+        # События до now уже разрешены кадрами due_events()
+        self._time = max(self._time, now)
+        self._dirty = True
+
+    def stop(self, tile):
+        """Forget the slide of a tile (it was stopped or finalized)."""
+        if self.slides.pop(tile, None) is not None:
+            self._dirty = True
+
+    def shift(self, delta):
+        """Shift all timings by delta ms (used to freeze motion during pause)."""
+        for slide in self.slides.values():
+            slide.start_time += delta
+            slide.end_time += delta
+        self._time += delta
+        if self._next_event is not None:
+            self._next_event.time += delta
+
+    def get_slide(self, tile):
+        return self.slides.get(tile)
+
+    @instrument.timed('motion.predict_next_event')
+    def _predict(self, t_from, board):
+        """Predict the earliest event at or after t_from across all slides."""
+        size = scale.TILE_SIZE
+        best = None
+
+        def consider(event):
+            nonlocal best
+            if best is None or event.sort_key() < best.sort_key():
+                best = event
+
+        slides = list(self.slides.values())
+        for i, slide in enumerate(slides):
+            consider(MotionEvent(max(t_from, slide.end_time), ARRIVAL, slide.tile))
+
+            # Static tiles that appeared on the path after the move started
+            for row, col in slide.path_cells():
+                cell = board[row][col]
+                if cell is None or cell is slide.tile or cell in self.slides:
+                    continue
+                hit = predict_collision(slide, Slide.static(cell, (row, col)), t_from, size)
+                if hit is not None:
+                    consider(MotionEvent(hit, STATIC_COLLISION, slide.tile, cell))
+                    break  # Obstacles further along the path cannot be reached first
+
+            for other in slides[i + 1:]:
+                hit = predict_collision(slide, other, t_from, size)
+                if hit is not None:
+                    consider(MotionEvent(hit, COLLISION, slide.tile, other.tile))
+        return best
+
+    def peek(self, board):
+        """Return the next predicted event (recomputed only when dirty).
+
+        Prediction starts at the last resolved event, not at the frame time:
+        one long frame may hold several events in a row. Once a frame has no
+        more due events, it starts at that frame's time, so a board change
+        between frames is never resolved in the past.
+        """
+        if self._dirty:
+            self._next_event = self._predict(self._time, board) if self.slides else None
+            self._dirty = False
+        return self._next_event
+
+    def due_events(self, now, board):
+        """Yield events with time <= now in chronological order.
+
+        Before each event is yielded, every moving tile is placed at its
+        position at the event time and the involved slides are dropped,
+        so the caller can snap/finalize tiles with a consistent board state.
+        """
+        while True:
+            event = self.peek(board)
+            if event is None or event.time > now:
+                # Всё до now разрешено: то, что появится на поле позже
+                # (спавн на уже пройденной клетке), предсказывается от now
+                self._time = max(self._time, now)
+                return
+            self.interpolate(event.time)
+            if event.kind == ARRIVAL:
+                event.tile.rect.topleft = grid_to_pixel(*self.slides[event.tile].target_cell)
+            self.stop(event.tile)
+            if event.kind == COLLISION:
+                self.stop(event.other)
+            self._time = event.time
+            self._dirty = True
+            yield event
+
+    def interpolate(self, now):
+        """Place every moving tile at its interpolated position for rendering."""
+        for tile, slide in self.slides.items():
+            x, y = slide.position_at(now)
+            tile.rect.topleft = (round(x), round(y))
@@ -1,55 +1,59 @@
 """
 Module for generating tile appearance patterns.
 All patterns return a list of (row, col) tuples in the order tiles should appear.
+
+Deterministic patterns are computed once per board size and cached as tuples.
 """
 import random
+from types import MappingProxyType
+
 from game_digits.constants import BOARD_SIZE
 
 
-def snake_by_rows(reverse_start=False):
+def snake_by_rows(reverse_start=False, size=BOARD_SIZE):
     """Snake pattern by rows (left-right, then right-left, etc.)."""
     positions = []
-    for row in range(BOARD_SIZE):
-        cols = range(BOARD_SIZE) if (row % 2 == 0) != reverse_start else range(BOARD_SIZE - 1, -1, -1)
+    for row in range(size):
+        cols = range(size) if (row % 2 == 0) != reverse_start else range(size - 1, -1, -1)
         for col in cols:
             positions.append((row, col))
     return positions
 
 
-def snake_by_rows_reverse():
+def snake_by_rows_reverse(size=BOARD_SIZE):
     """Snake pattern by rows, starting from bottom."""
     positions = []
-    for row in range(BOARD_SIZE - 1, -1, -1):
-        cols = range(BOARD_SIZE) if ((BOARD_SIZE - 1 - row) % 2 == 0) else range(BOARD_SIZE - 1, -1, -1)
+    for row in range(size - 1, -1, -1):
+        cols = range(size) if ((size - 1 - row) % 2 == 0) else range(size - 1, -1, -1)
         for col in cols:
             positions.append((row, col))
     return positions
 
 
-def snake_by_cols(reverse_start=False):
+def snake_by_cols(reverse_start=False, size=BOARD_SIZE):
     """Snake pattern by columns (top-down, then down-top, etc.)."""
     positions = []
-    for col in range(BOARD_SIZE):
-        rows = range(BOARD_SIZE) if (col % 2 == 0) != reverse_start else range(BOARD_SIZE - 1, -1, -1)
+    for col in range(size):
+        rows = range(size) if (col % 2 == 0) != reverse_start else range(size - 1, -1, -1)
         for row in rows:
             positions.append((row, col))
     return positions
 
 
-def snake_by_cols_reverse():
+def snake_by_cols_reverse(size=BOARD_SIZE):
     """Snake pattern by columns, starting from right."""
     positions = []
-    for col in range(BOARD_SIZE - 1, -1, -1):
-        rows = range(BOARD_SIZE) if ((BOARD_SIZE - 1 - col) % 2 == 0) else range(BOARD_SIZE - 1, -1, -1)
+    for col in range(size - 1, -1, -1):
+        rows = range(size) if ((size - 1 - col) % 2 == 0) else range(size - 1, -1, -1)
         for row in rows:
             positions.append((row, col))
     return positions
 
 
-def spiral_clockwise(start_corner="top_left"):
+def spiral_clockwise(start_corner="top_left", size=BOARD_SIZE):
     """Spiral pattern clockwise from specified corner."""
     positions = []
-    visited = [[False] * BOARD_SIZE for _ in range(BOARD_SIZE)]
+    visited = [[False] * size for _ in range(size)]
 
     # Direction vectors: right, down, left, up
     directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
@@ -57,14 +61,14 @@ def spiral_clockwise(start_corner="top_left"):
     # Starting positions and direction indices for each corner
     corners = {
         "top_left": (0, 0, 0),      # start at (0,0), go right first
-        "top_right": (0, BOARD_SIZE - 1, 1),   # start at (0,9), go down first
-        "bottom_right": (BOARD_SIZE - 1, BOARD_SIZE - 1, 2),  # start at (9,9), go left first
-        "bottom_left": (BOARD_SIZE - 1, 0, 3),  # start at (9,0), go up first
+        "top_right": (0, size - 1, 1),   # start at (0,9), go down first
+        "bottom_right": (size - 1, size - 1, 2),  # start at (9,9), go left first
+        "bottom_left": (size - 1, 0, 3),  # start at (9,0), go up first
     }
 
     row, col, dir_idx = corners[start_corner]
 
-    for _ in range(BOARD_SIZE * BOARD_SIZE):
+    for _ in range(size * size):
         positions.append((row, col))
         visited[row][col] = True
 
@@ -73,7 +77,7 @@ def spiral_clockwise(start_corner="top_left"):
         new_row, new_col = row + dr, col + dc
 
         # If can't continue, turn clockwise
-        if not (0 <= new_row < BOARD_SIZE and 0 <= new_col < BOARD_SIZE and not visited[new_row][new_col]):
+        if not (0 <= new_row < size and 0 <= new_col < size and not visited[new_row][new_col]):
             dir_idx = (dir_idx + 1) % 4
             dr, dc = directions[dir_idx]
             new_row, new_col = row + dr, col + dc
@@ -83,10 +87,10 @@ def spiral_clockwise(start_corner="top_left"):
     return positions
 
 
-def spiral_counterclockwise(start_corner="top_left"):
+def spiral_counterclockwise(start_corner="top_left", size=BOARD_SIZE):
     """Spiral pattern counter-clockwise from specified corner."""
     positions = []
-    visited = [[False] * BOARD_SIZE for _ in range(BOARD_SIZE)]
+    visited = [[False] * size for _ in range(size)]
 
     # Direction vectors: down, right, up, left (counter-clockwise from top-left)
     directions_map = {
@@ -98,23 +102,23 @@ def spiral_counterclockwise(start_corner="top_left"):
 
     corners = {
         "top_left": (0, 0),
-        "top_right": (0, BOARD_SIZE - 1),
-        "bottom_right": (BOARD_SIZE - 1, BOARD_SIZE - 1),
-        "bottom_left": (BOARD_SIZE - 1, 0),
+        "top_right": (0, size - 1),
+        "bottom_right": (size - 1, size - 1),
+        "bottom_left": (size - 1, 0),
     }
 
     row, col = corners[start_corner]
     directions = directions_map[start_corner]
     dir_idx = 0
 
-    for _ in range(BOARD_SIZE * BOARD_SIZE):
+    for _ in range(size * size):
         positions.append((row, col))
         visited[row][col] = True
 
         dr, dc = directions[dir_idx]
         new_row, new_col = row + dr, col + dc
 
-        if not (0 <= new_row < BOARD_SIZE and 0 <= new_col < BOARD_SIZE and not visited[new_row][new_col]):
+        if not (0 <= new_row < size and 0 <= new_col < size and not visited[new_row][new_col]):
             dir_idx = (dir_idx + 1) % 4
             dr, dc = directions[dir_idx]
             new_row, new_col = row + dr, col + dc
@@ -124,49 +128,49 @@ def spiral_counterclockwise(start_corner="top_left"):
     return positions
 
 
-def diagonal_wave(start_corner="top_left"):
+def diagonal_wave(start_corner="top_left", size=BOARD_SIZE):
     """Diagonal wave pattern from specified corner."""
     positions = []
 
     if start_corner == "top_left":
         # Diagonals from top-left to bottom-right
-        for diag in range(2 * BOARD_SIZE - 1):
-            for row in range(BOARD_SIZE):
+        for diag in range(2 * size - 1):
+            for row in range(size):
                 col = diag - row
-                if 0 <= col < BOARD_SIZE:
+                if 0 <= col < size:
                     positions.append((row, col))
     elif start_corner == "top_right":
         # Diagonals from top-right to bottom-left
-        for diag in range(2 * BOARD_SIZE - 1):
-            for row in range(BOARD_SIZE):
-                col = BOARD_SIZE - 1 - diag + row
-                if 0 <= col < BOARD_SIZE:
+        for diag in range(2 * size - 1):
+            for row in range(size):
+                col = size - 1 - diag + row
+                if 0 <= col < size:
                     positions.append((row, col))
     elif start_corner == "bottom_left":
         # Diagonals from bottom-left to top-right
-        for diag in range(2 * BOARD_SIZE - 1):
-            for row in range(BOARD_SIZE - 1, -1, -1):
-                col = diag - (BOARD_SIZE - 1 - row)
-                if 0 <= col < BOARD_SIZE:
+        for diag in range(2 * size - 1):
+            for row in range(size - 1, -1, -1):
+                col = diag - (size - 1 - row)
+                if 0 <= col < size:
                     positions.append((row, col))
     elif start_corner == "bottom_right":
         # Diagonals from bottom-right to top-left
-        for diag in range(2 * BOARD_SIZE - 1):
-            for row in range(BOARD_SIZE - 1, -1, -1):
-                col = BOARD_SIZE - 1 - diag + (BOARD_SIZE - 1 - row)
-                if 0 <= col < BOARD_SIZE:
+        for diag in range(2 * size - 1):
+            for row in range(size - 1, -1, -1):
+                col = size - 1 - diag + (size - 1 - row)
+                if 0 <= col < size:
                     positions.append((row, col))
 
     return positions
 
 
-def from_center():
+def from_center(size=BOARD_SIZE):
     """Expanding squares from center to edges."""
     positions = []
-    center = BOARD_SIZE // 2
+    center = size // 2
 
     # For even board size, center is 4 tiles
-    if BOARD_SIZE % 2 == 0:
+    if size % 2 == 0:
         # Start with center 4 tiles
         positions.extend([(center - 1, center - 1), (center - 1, center),
                          (center, center - 1), (center, center)])
@@ -178,7 +182,7 @@ def from_center():
             ring_positions = []
             for row in range(center - 1 - ring, center + 1 + ring):
                 for col in range(center - 1 - ring, center + 1 + ring):
-                    if 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE:
+                    if 0 <= row < size and 0 <= col < size:
                         if (row, col) not in added:
                             ring_positions.append((row, col))
                             added.add((row, col))
@@ -194,7 +198,7 @@ def from_center():
             ring_positions = []
             for row in range(center - ring, center + ring + 1):
                 for col in range(center - ring, center + ring + 1):
-                    if 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE:
+                    if 0 <= row < size and 0 <= col < size:
                         if (row, col) not in added:
                             ring_positions.append((row, col))
                             added.add((row, col))
@@ -204,45 +208,81 @@ def from_center():
     return positions
 
 
-def to_center():
+def to_center(size=BOARD_SIZE):
     """Contracting squares from edges to center."""
-    return list(reversed(from_center()))
+    return list(reversed(from_center(size)))
 
 
-def random_order():
+def random_order(size=BOARD_SIZE):
     """Random order of tile appearance."""
-    positions = [(row, col) for row in range(BOARD_SIZE) for col in range(BOARD_SIZE)]
+    positions = [(row, col) for row in range(size) for col in range(size)]
     random.shuffle(positions)
     return positions
 
 
-# List of all available patterns with their names
+# List of all available patterns with their names (each takes board size)
 ALL_PATTERNS = [
-    ("snake_rows", snake_by_rows),
-    ("snake_rows_reverse", snake_by_rows_reverse),
-    ("snake_rows_alt", lambda: snake_by_rows(reverse_start=True)),
-    ("snake_cols", snake_by_cols),
-    ("snake_cols_reverse", snake_by_cols_reverse),
-    ("snake_cols_alt", lambda: snake_by_cols(reverse_start=True)),
-    ("spiral_cw_top_left", lambda: spiral_clockwise("top_left")),
-    ("spiral_cw_top_right", lambda: spiral_clockwise("top_right")),
-    ("spiral_cw_bottom_right", lambda: spiral_clockwise("bottom_right")),
-    ("spiral_cw_bottom_left", lambda: spiral_clockwise("bottom_left")),
-    ("spiral_ccw_top_left", lambda: spiral_counterclockwise("top_left")),
-    ("spiral_ccw_top_right", lambda: spiral_counterclockwise("top_right")),
-    ("spiral_ccw_bottom_right", lambda: spiral_counterclockwise("bottom_right")),
-    ("spiral_ccw_bottom_left", lambda: spiral_counterclockwise("bottom_left")),
-    ("diagonal_top_left", lambda: diagonal_wave("top_left")),
-    ("diagonal_top_right", lambda: diagonal_wave("top_right")),
-    ("diagonal_bottom_left", lambda: diagonal_wave("bottom_left")),
-    ("diagonal_bottom_right", lambda: diagonal_wave("bottom_right")),
+    ("snake_rows", lambda size: snake_by_rows(size=size)),
+    ("snake_rows_reverse", lambda size: snake_by_rows_reverse(size)),
+    ("snake_rows_alt", lambda size: snake_by_rows(reverse_start=True, size=size)),
+    ("snake_cols", lambda size: snake_by_cols(size=size)),
+    ("snake_cols_reverse", lambda size: snake_by_cols_reverse(size)),
+    ("snake_cols_alt", lambda size: snake_by_cols(reverse_start=True, size=size)),
+    ("spiral_cw_top_left", lambda size: spiral_clockwise("top_left", size)),
+    ("spiral_cw_top_right", lambda size: spiral_clockwise("top_right", size)),
+    ("spiral_cw_bottom_right", lambda size: spiral_clockwise("bottom_right", size)),
+    ("spiral_cw_bottom_left", lambda size: spiral_clockwise("bottom_left", size)),
+    ("spiral_ccw_top_left", lambda size: spiral_counterclockwise("top_left", size)),
+    ("spiral_ccw_top_right", lambda size: spiral_counterclockwise("top_right", size)),
+    ("spiral_ccw_bottom_right", lambda size: spiral_counterclockwise("bottom_right", size)),
+    ("spiral_ccw_bottom_left", lambda size: spiral_counterclockwise("bottom_left", size)),
+    ("diagonal_top_left", lambda size: diagonal_wave("top_left", size)),
+    ("diagonal_top_right", lambda size: diagonal_wave("top_right", size)),
+    ("diagonal_bottom_left", lambda size: diagonal_wave("bottom_left", size)),
+    ("diagonal_bottom_right", lambda size: diagonal_wave("bottom_right", size)),
     ("from_center", from_center),
     ("to_center", to_center),
     ("random", random_order),
 ]
 
+# Patterns that must be regenerated on every call
+RANDOM_PATTERNS = {"random"}
+
+# Precomputed patterns: board size -> read-only {name: tuple of (row, col)}
+_pattern_cache = {}
+
+
+def get_patterns(size=BOARD_SIZE):
+    """Returns all deterministic patterns for a board size (computed once).
+
+    Returns:
+        Mapping of pattern name -> tuple of (row, col) positions.
+    """
+    patterns = _pattern_cache.get(size)
+    if patterns is None:
+        patterns = MappingProxyType({
+            name: tuple(pattern_func(size))
+            for name, pattern_func in ALL_PATTERNS
+            if name not in RANDOM_PATTERNS
+        })
+        _pattern_cache[size] = patterns
+    return patterns
+
+
+def get_pattern(name, size=BOARD_SIZE, rng=random):
+    """Returns positions of a pattern by name for a board size."""
+    if name in RANDOM_PATTERNS:
+        positions = list(get_patterns(size)["snake_rows"])
+        rng.shuffle(positions)
+        return tuple(positions)
+    return get_patterns(size)[name]
+
+
+def get_random_pattern(size=BOARD_SIZE, rng=random):
+    """Returns a random pattern name and its positions (tuple of (row, col)).
 
-def get_random_pattern():
-    """Returns a random pattern function and its name."""
-    name, pattern_func = random.choice(ALL_PATTERNS)
-    return name, pattern_func()
+    rng: random.Random instance (or the random module) used for the choice,
+    so a seeded game reproduces the same pattern.
+    """
+    name, _ = rng.choice(ALL_PATTERNS)
+    return name, get_pattern(name, size, rng)
@@ -0,0 +1,211 @@
+"""
+Frame-time profiler overlay, toggled with F3.
+
+The scene loop (scenes.SceneManager) calls, with the name of the top scene:
+
+    perf_hud.frame_start('game')     # once per frame
+    perf_hud.mark('events')          # after each phase (scenes add their own)
+    perf_hud.draw(screen)            # just before pygame.display.update()
+    perf_hud.handle_event(event)     # F3 toggles the HUD
+
+mark() charges the time since the previous mark to the named phase. Frame
+times and phase times go into ring buffers of SAMPLES frames; the HUD shows
+FPS, p50/p95/p99 frame time and the mean of every phase, re-rendered
+REFRESH_MS apart so the overlay itself stays cheap.
+
+Blits and surface allocations cannot be counted without slowing pygame
+down, so one frame in COUNT_EVERY is a counting frame: a profile hook
+counts blit/fill calls and calls that return new surfaces, and
+pygame.Surface is temporarily replaced by a counting subclass. That frame
+is left out of the timing samples.
+
+When the HUD is off every call is a single flag check.
+"""
+
+import sys
+import time
+from collections import deque
+
+import pygame
+
+from game_digits import fonts
+
+SAMPLES = 240
+REFRESH_MS = 250
+COUNT_EVERY = 60
+FONT_SIZE = 13
+
+enabled = False
+
+_frames = deque(maxlen=SAMPLES)  # Frame durations, seconds
+_phases = {}                     # Phase -> deque of durations, seconds
+_current = {}                    # Phase times of the frame in progress
+_loop = None
+_frame_start = None
+_last_mark = 0.0
+_frame_index = 0
+_counting = False
+_skip_sample = False             # The frame in progress is a counting frame
+_counts = {'blits': 0, 'allocs': 0}
+_last_counts = None
+_panel = None
+_panel_time = 0
+
+# Surface methods that draw onto the surface / return a new surface
+_BLIT_METHODS = frozenset(('blit', 'blits', 'fill'))
+_ALLOC_METHODS = frozenset(('copy', 'convert', 'convert_alpha', 'subsurface'))
+
+_Surface = pygame.Surface
+
+
+class _CountingSurface(_Surface):
+    """pygame.Surface that counts its construction (counting frames only)."""
+
+    def __init__(self, *args, **kwargs):
+        _counts['allocs'] += 1
+        super().__init__(*args, **kwargs)
+
+
+def _count_calls(frame, event, arg):
+    if event != 'c_call':
+        return
+    owner = getattr(arg, '__self__', None)
+    if isinstance(owner, _Surface):
+        name = arg.__name__
+        if name in _BLIT_METHODS:
+            _counts['blits'] += 1
+        elif name in _ALLOC_METHODS:
+            _counts['allocs'] += 1
+    elif owner is pygame.transform or (isinstance(owner, pygame.font.Font) and arg.__name__ == 'render'):
+        _counts['allocs'] += 1
+
+
+def _start_counting():
+    global _counting, _skip_sample
+    _counts['blits'] = _counts['allocs'] = 0
+    _counting = _skip_sample = True
+    pygame.Surface = _CountingSurface
+    sys.setprofile(_count_calls)
+
+
+def _stop_counting():
+    global _counting, _last_counts
+    sys.setprofile(None)
+    pygame.Surface = _Surface
+    _counting = False
+    _last_counts = dict(_counts)
+
+
+def toggle():
+    """Show or hide the HUD. Samples start over on every switch."""
+    global enabled, _frame_start, _panel, _last_counts, _loop, _skip_sample
+    if _counting:
+        _stop_counting()
+    _skip_sample = False
+    enabled = not enabled
+    _frames.clear()
+    _phases.clear()
+    _current.clear()
+    _frame_start = None
+    _panel = None
+    _last_counts = None
+    _loop = None
+
+
+def handle_event(event):
+    """Toggle on F3. Returns True if the event was consumed."""
+    if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+        toggle()
+        return True
+    return False
+
+
+def frame_start(loop):
+    """Close the previous frame and open a new one for loop ('game', 'menu', ...)."""
+    global _frame_start, _last_mark, _frame_index, _loop, _skip_sample
+    if not enabled:
+        return
+    now = time.perf_counter()
+    if _counting:
+        _stop_counting()
+    if _skip_sample:
+        _skip_sample = False  # The counting frame is not a timing sample
+    elif _frame_start is not None and loop == _loop:
+        _frames.append(now - _frame_start)
+        for name, seconds in _current.items():
+            samples = _phases.get(name)
+            if samples is None:
+                samples = _phases[name] = deque(maxlen=SAMPLES)
+            samples.append(seconds)
+    if loop != _loop:
+        # Another loop took over (menu -> game): its phases are different
+        _frames.clear()
+        _phases.clear()
+        _loop = loop
+    _current.clear()
+    _frame_start = _last_mark = now
+    _frame_index += 1
+    if _frame_index % COUNT_EVERY == 0:
+        _start_counting()
+
+
+def mark(phase):
+    """Charge the time since the previous mark (or frame start) to phase."""
+    global _last_mark
+    if not enabled or _frame_start is None:
+        return
+    now = time.perf_counter()
+    _current[phase] = _current.get(phase, 0.0) + now - _last_mark
+    _last_mark = now
+
+
+def _percentile(values, p):
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+def _render_panel():
+    font = fonts.get_font(fonts.TILE_FONT, FONT_SIZE)
+    lines = []
+    frames = sorted(_frames)
+    if frames:
+        mean = sum(frames) / len(frames)
+        lines.append((f"{_loop}  {1 / mean:.1f} FPS", f"{mean * 1000:.2f} ms"))
+        lines.append(("p50 / p95 / p99",
+                      " / ".join(f"{_percentile(frames, p) * 1000:.1f}" for p in (50, 95, 99))))
+    else:
+        lines.append((f"{_loop or '-'}", "collecting..."))
+    for name, samples in _phases.items():
+        lines.append((name, f"{sum(samples) / len(samples) * 1000:.3f} ms"))
+    if _last_counts is not None:
+        lines.append(("blits / allocs", f"{_last_counts['blits']} / {_last_counts['allocs']}"))
+
+    line_height = font.get_linesize()
+    rendered = [(font.render(left, True, (255, 255, 255)), font.render(right, True, (255, 230, 140)))
+                for left, right in lines]
+    left_width = max(left.get_width() for left, _ in rendered)
+    right_width = max(right.get_width() for _, right in rendered)
+    pad = 6
+    panel = _Surface((left_width + right_width + 3 * pad, len(rendered) * line_height + 2 * pad),
+                     pygame.SRCALPHA)
+    panel.fill((0, 0, 0, 170))
+    for i, (left, right) in enumerate(rendered):
+        y = pad + i * line_height
+        panel.blit(left, (pad, y))
+        panel.blit(right, (2 * pad + left_width, y))
+    return panel
+
+
+def draw(surface, pos=(4, 4)):
+    """Draw the HUD onto surface (call right before presenting the frame)."""
+    global _panel, _panel_time
+    if not enabled:
+        return
+    if _counting:
+        _stop_counting()  # Do not count the HUD's own drawing
+    mark('other')  # Whatever ran since the last mark
+    now = pygame.time.get_ticks()
+    if _panel is None or now - _panel_time >= REFRESH_MS:
+        _panel = _render_panel()
+        _panel_time = now
+    surface.blit(_panel, pos)
+    mark('hud')
@@ -4,6 +4,8 @@ Rankings from the original game community.
 """
 import math
 
+from game_digits import instrument
+
 # Rank definitions: (min_score, name, fg_color, bg_color)
 # fg_color = text color, bg_color = badge background color
 RANKS = [
@@ -329,6 +331,7 @@ def _draw_shine(surface, badge_w, height, offset_x, offset_y, time_ms, rank_scor
     surface.blit(shine_surface, (offset_x, offset_y), special_flags=pygame.BLEND_RGBA_ADD)
 
 
+@instrument.timed('ranks.draw_rank_badge')
 def draw_rank_badge(surface, rect, rank_name, fg_color, bg_color, max_width=None, time_ms=0):
     """
     Draw a rank badge (capsule/pill shape) with auto-sizing and soft edges.
@@ -343,8 +346,7 @@ def draw_rank_badge(surface, rect, rank_name, fg_color, bg_color, max_width=None
         max_width: Maximum allowed width (optional, uses rect width if not set)
         time_ms: Current time in milliseconds (for animation)
     """
-    import pygame
-    from game_digits import get_font_path, scale
+    from game_digits import fonts, scale
 
     center_x, center_y, given_width, height = rect
     max_w = max_width if max_width else given_width
@@ -354,7 +356,7 @@ def draw_rank_badge(surface, rect, rank_name, fg_color, bg_color, max_width=None
 
     # Find the right font size that fits
     font_size = base_font_size
-    font = pygame.font.Font(get_font_path("2204.ttf"), font_size)
+    font = fonts.get_font(fonts.BOLD_FONT, font_size)
     text_surf = font.render(rank_name, True, fg_color)
     text_w = text_surf.get_width()
     badge_w = text_w + 2 * pad_x
@@ -362,7 +364,7 @@ def draw_rank_badge(surface, rect, rank_name, fg_color, bg_color, max_width=None
     # Reduce font size if needed to fit
     while badge_w > max_w and font_size > min_font_size:
         font_size -= 2  # Step by 2 for faster convergence
-        font = pygame.font.Font(get_font_path("2204.ttf"), font_size)
+        font = fonts.get_font(fonts.BOLD_FONT, font_size)
         text_surf = font.render(rank_name, True, fg_color)
         text_w = text_surf.get_width()
         badge_w = text_w + 2 * pad_x
@@ -378,10 +380,17 @@ def draw_rank_badge(surface, rect, rank_name, fg_color, bg_color, max_width=None
 
     # Get or create cached badge surface
     if cache_key not in _badge_cache:
-        badge_surface, is_legendary, offsets = _create_badge_surface(
-            badge_w, height, bg_color, rank_score, scale
-        )
-        _badge_cache[cache_key] = (badge_surface.copy(), is_legendary, offsets)
+        from game_digits import asset_cache
+
+        def generate():
+            badge_surface, is_legendary, offsets = _create_badge_surface(
+                badge_w, height, bg_color, rank_score, scale
+            )
+            return badge_surface, [is_legendary, list(offsets)]
+
+        params = (badge_w, height, tuple(bg_color[:3]), rank_score)
+        badge_surface, (is_legendary, offsets) = asset_cache.get_entry('rank_badge', params, generate)
+        _badge_cache[cache_key] = (badge_surface, is_legendary, tuple(offsets))
 
     cached_surface, is_legendary, (offset_x, offset_y) = _badge_cache[cache_key]
 
@@ -434,3 +443,8 @@ def clear_badge_cache():
     """Clear the badge surface cache (call when resolution changes)."""
     global _badge_cache
     _badge_cache = {}
+
+
+# Значки зависят от размеров - сбрасываем кэш при смене масштаба
+from game_digits import scale as _scale  # noqa: E402
+_scale.add_listener(clear_badge_cache)
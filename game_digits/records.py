@@ -1,81 +1,224 @@
 """
 Records storage and management for the game.
-Stores top 10 best results in a JSON file.
+Stores top 10 best results in a JSON file, one file per board size.
+
+The file is read through a process-wide RecordsRepository per mode and board
+size, which keeps the top list in memory (sorted by total, descending) and
+re-reads the file only when its mtime changes. It is the one source of the
+top list: the records panel of the menu and the place in the result window
+both read it. A board without a records file is seeded from the game
+history (history.py) in the background. All writes go through RecordsRepository.save(),
+which commits atomically on the I/O executor (see storage.py).
 """
 
-import json
+import bisect
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 
+from game_digits import instrument
+from game_digits import settings
+from game_digits import storage
 from game_digits.ranks import get_rank_name
 
+MAX_RECORDS = 10
 
-def get_records_path(test_mode=False):
-    """Get the path to the records file."""
+
+def _board_key(board_size):
+    """None -> the default board (the size all old records were played on)."""
+    return settings.DEFAULT_BOARD_SIZE if board_size is None else board_size
+
+
+def get_records_path(test_mode=False, board_size=None):
+    """Get the path to the records file.
+
+    The default board keeps records.json; other sizes use records_<N>.json.
+    """
     # Store in user's home directory under .game_digits
     home = Path.home()
     records_dir = home / ".game_digits"
     records_dir.mkdir(exist_ok=True)
-    filename = "test_records.json" if test_mode else "records.json"
-    return records_dir / filename
+    stem = "test_records" if test_mode else "records"
+    board_size = _board_key(board_size)
+    if board_size != settings.DEFAULT_BOARD_SIZE:
+        stem = f"{stem}_{board_size}"
+    return records_dir / f"{stem}.json"
 
 
-def load_records(test_mode=False):
-    """Load records from file.
+def _total(record):
+    return record.get('total', 0)
 
-    Returns:
-        list: List of record dictionaries, sorted by total score descending.
-              Each record has: score, bonus, total, date
-    """
-    records_path = get_records_path(test_mode)
 
-    if not records_path.exists():
-        return []
+class RecordsRepository:
+    """In-memory top list backed by a records file.
+
+    Records are kept sorted by total descending; a parallel list of negated
+    totals lets bisect find insertion points (ties keep older records first).
+    The list is used on the main thread only; _mtime and the save generations
+    are also written by the storage writer, so they are guarded by _lock.
+    """
 
-    try:
-        with open(records_path, 'r', encoding='utf-8') as f:
-            records = json.load(f)
-        # Ensure records are sorted by total descending
-        records.sort(key=lambda x: x.get('total', 0), reverse=True)
-        records = records[:10]  # Keep only top 10
+    def __init__(self, test_mode=False, board_size=None):
+        self.test_mode = test_mode
+        self.board_size = _board_key(board_size)
+        self.path = get_records_path(test_mode, self.board_size)
+        self._records = []
+        self._keys = []  # -total for each record, ascending
+        self._lock = threading.Lock()
+        self._mtime = None  # mtime of the file we loaded or wrote
+        self._loaded = False
+        self._save_generation = 0  # Incremented on every save()
+        self._saved_generation = 0  # Last generation committed by the writer
+        self._seeding = False  # Seed from history requested
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _set_records(self, records):
+        records = sorted(records, key=_total, reverse=True)[:MAX_RECORDS]
+        self._records = records
+        self._keys = [-_total(rec) for rec in records]
+
+    def _ensure_fresh(self):
+        """Reload from disk if the file changed since the last load/save."""
+        with self._lock:
+            in_flight = self._saved_generation != self._save_generation
+            known_mtime = self._mtime
+        if self._loaded and in_flight:
+            return  # Our own write is in flight, memory is authoritative
+        mtime = self._file_mtime()
+        if self._loaded and mtime == known_mtime:
+            return
+
+        # Falls back to records.json.bak if the main file is missing or corrupt
+        records = storage.read_json(self.path, [])
+        if not isinstance(records, list):
+            records = []
+        self._set_records(records)
+        with self._lock:
+            self._mtime = mtime
+        self._loaded = True
+
+        if mtime is None and not self._records and not self._seeding:
+            self._seeding = True
+            # Imported here: history imports records for its legacy import
+            from game_digits import history
+            history.top_async(self._seed, self.test_mode, self.board_size, MAX_RECORDS)
 
         # Migration: add rank field if missing
         needs_save = False
-        for rec in records:
+        for rec in self._records:
             if 'rank' not in rec:
-                rec['rank'] = get_rank_name(rec.get('total', 0))
+                rec['rank'] = get_rank_name(_total(rec))
                 needs_save = True
-
         if needs_save:
-            save_records(records, test_mode)
+            self.save()
+
+    def _seed(self, records):
+        """Top list from history for a board without a records file (main thread)."""
+        if records and not self._records:
+            self._set_records(records)
+            self.save()
+
+    def save(self):
+        """Queue the current top list for an atomic write (the only write path).
+
+        Returns immediately; the file is committed on the storage writer thread.
+        """
+        with self._lock:
+            self._save_generation += 1
+            generation = self._save_generation
+
+        def on_saved(ok):
+            # Runs on the writer thread. Remember the mtime of our own write so it
+            # doesn't trigger a reload (on failure the in-memory list stays authoritative as well)
+            mtime = self._file_mtime()
+            with self._lock:
+                self._mtime = mtime
+                self._saved_generation = max(self._saved_generation, generation)
+
+        storage.save_json_async(self.path, self._records, on_saved=on_saved)
+
+    def top(self):
+        """Copy of the top list, sorted by total descending."""
+        self._ensure_fresh()
+        return list(self._records)
+
+    def best_score(self):
+        """Best total score, or 0 if no records."""
+        self._ensure_fresh()
+        return _total(self._records[0]) if self._records else 0
+
+    def position_for(self, total):
+        """1-based position a new total would take, or None if it doesn't qualify."""
+        self._ensure_fresh()
+        index = bisect.bisect_right(self._keys, -total)
+        return index + 1 if index < MAX_RECORDS else None
+
+    def add(self, record):
+        """Insert a record if it qualifies and save.
+
+        Returns:
+            int or None: 1-based position, or None if not in top list
+        """
+        self._ensure_fresh()
+        index = bisect.bisect_right(self._keys, -_total(record))
+        if index >= MAX_RECORDS:
+            return None
+        self._records.insert(index, record)
+        self._keys.insert(index, -_total(record))
+        del self._records[MAX_RECORDS:]
+        del self._keys[MAX_RECORDS:]
+        self.save()
+        return index + 1
+
+    def replace(self, records):
+        """Replace the whole top list and save."""
+        self._set_records(records)
+        self.save()
+
+
+# Process-wide repositories: (test_mode, board_size) -> RecordsRepository
+_repositories = {}
+
+
+def get_repository(test_mode=False, board_size=None):
+    """Get the shared records repository for the given mode and board size."""
+    key = (test_mode, _board_key(board_size))
+    repo = _repositories.get(key)
+    if repo is None:
+        repo = RecordsRepository(*key)
+        _repositories[key] = repo
+    return repo
+
+
+@instrument.timed('records.load_records')
+def load_records(test_mode=False, board_size=None):
+    """Load records (from the in-memory cache if the file is unchanged).
 
-        return records
-    except (json.JSONDecodeError, IOError):
-        return []
+    Returns:
+        list: List of record dictionaries, sorted by total score descending.
+              Each record has: score, bonus, total, date, rank
+    """
+    return get_repository(test_mode, board_size).top()
 
 
-def save_records(records, test_mode=False):
+def save_records(records, test_mode=False, board_size=None):
     """Save records to file.
 
     Args:
         records: List of record dictionaries
         test_mode: If True, save to test records file
+        board_size: Board the records belong to (None - the default board)
     """
-    records_path = get_records_path(test_mode)
-
-    # Sort and keep only top 10
-    records.sort(key=lambda x: x.get('total', 0), reverse=True)
-    records = records[:10]
+    get_repository(test_mode, board_size).replace(records)
 
-    try:
-        with open(records_path, 'w', encoding='utf-8') as f:
-            json.dump(records, f, ensure_ascii=False, indent=2)
-    except IOError:
-        pass  # Silently fail if can't write
 
-
-def add_record(score, bonus, total, test_mode=False):
+def add_record(score, bonus, total, test_mode=False, board_size=None):
     """Add a new record if it qualifies for top 10.
 
     Args:
@@ -83,13 +226,12 @@ def add_record(score, bonus, total, test_mode=False):
         bonus: Speed bonus (300 + 5 * remaining_time)
         total: Total score (score + bonus)
         test_mode: If True, use test records file
+        board_size: Board the game was played on (None - the default board)
 
     Returns:
         int or None: Position in leaderboard (1-10) if record was added,
                      None if didn't qualify for top 10
     """
-    records = load_records(test_mode)
-
     new_record = {
         'score': score,
         'bonus': bonus,
@@ -97,35 +239,19 @@ def add_record(score, bonus, total, test_mode=False):
         'date': datetime.now().strftime('%d.%m.%Y'),
         'rank': get_rank_name(total)
     }
-
-    # Check if this score qualifies for top 10
-    if len(records) < 10 or total > records[-1].get('total', 0):
-        records.append(new_record)
-        records.sort(key=lambda x: x.get('total', 0), reverse=True)
-        records = records[:10]
-        save_records(records, test_mode)
-
-        # Find position of new record
-        for i, rec in enumerate(records):
-            if rec == new_record:
-                return i + 1  # 1-indexed position
-
-    return None
+    return get_repository(test_mode, board_size).add(new_record)
 
 
-def get_best_score():
+def get_best_score(test_mode=False, board_size=None):
     """Get the best total score.
 
     Returns:
         int: Best total score, or 0 if no records
     """
-    records = load_records()
-    if records:
-        return records[0].get('total', 0)
-    return 0
+    return get_repository(test_mode, board_size).best_score()
 
 
-def is_new_record(total):
+def is_new_record(total, test_mode=False, board_size=None):
     """Check if a score would be a new record (top 10).
 
     Args:
@@ -134,7 +260,4 @@ def is_new_record(total):
     Returns:
         bool: True if this would qualify for top 10
     """
-    records = load_records()
-    if len(records) < 10:
-        return True
-    return total > records[-1].get('total', 0)
+    return get_repository(test_mode, board_size).position_for(total) is not None
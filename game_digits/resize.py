@@ -0,0 +1,56 @@
+"""
+Debounced window resizing.
+
+While the user drags the window border, SDL sends a stream of VIDEORESIZE
+events. Rebuilding the layout (fonts, tiles, background) for each of them
+would render assets for sizes that are on screen for a single frame, so
+the scene loop only records the latest size with on_event(). It also checks
+ready() once per frame, whatever scene is on top, and the owner of the window
+takes the size with poll() after it has stayed unchanged for DEBOUNCE_MS.
+"""
+
+import pygame
+
+DEBOUNCE_MS = 200
+
+_pending = None       # Last size reported by the window, not applied yet
+_pending_since = 0    # pygame ticks of the last VIDEORESIZE
+_current = None       # Size the layout was built for
+
+
+def set_current(size):
+    """Remember the size the layout was built for; events with it are ignored."""
+    global _current, _pending
+    _current = tuple(size)
+    if _pending == _current:
+        _pending = None
+
+
+def on_event(event):
+    """Record a VIDEORESIZE event. Returns True if the event was consumed."""
+    global _pending, _pending_since
+    if event.type != pygame.VIDEORESIZE:
+        return False
+    size = (event.w, event.h)
+    _pending = None if size == _current else size
+    _pending_since = pygame.time.get_ticks()
+    return True
+
+
+def ready(now=None):
+    """A new window size has been stable for DEBOUNCE_MS."""
+    if _pending is None:
+        return False
+    if now is None:
+        now = pygame.time.get_ticks()
+    return now - _pending_since >= DEBOUNCE_MS
+
+
+def poll(now=None):
+    """Take the settled window size, or None if there is none (yet)."""
+    global _pending
+    if not ready(now):
+        return None
+    size = _pending
+    _pending = None
+    return size
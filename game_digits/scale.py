@@ -123,98 +123,85 @@ TYPEWRITER_CHAR_DELAY = 400
 TYPEWRITER_PAUSE_TIME = 2000
 
 
+# Масштабируемые значения: NAME = scaled(BASE_NAME)
+_SCALED_NAMES = (
+    # Плитки и стрелки
+    'TILE_SIZE', 'GAP', 'TILE_FONT_SIZE', 'ARROW_SIZE',
+    # Панель
+    'PANEL_WIDTH',
+    # Шрифты панели, меню, результата и паузы
+    'FONT_PANEL_LABEL', 'FONT_PANEL_VALUE', 'FONT_PANEL_PAUSE',
+    'FONT_MENU_BUTTON', 'FONT_MENU_RECORDS_TITLE', 'FONT_MENU_RECORDS', 'FONT_MENU_RECORDS_SMALL',
+    'FONT_RESULT_TITLE', 'FONT_RESULT_LABEL', 'FONT_RESULT_VALUE', 'FONT_RESULT_BUTTON',
+    'FONT_PAUSE_TEXT', 'FONT_PAUSE_TITLE',
+    # Кнопки
+    'BUTTON_WIDTH', 'BUTTON_HEIGHT', 'RECORDS_BTN_WIDTH', 'RECORDS_BTN_HEIGHT',
+    'CLOSE_BTN_SIZE', 'PAUSE_BTN_WIDTH', 'PAUSE_BTN_HEIGHT', 'SOUND_ICON_SIZE',
+    # Иконки и панель
+    'ICON_SIZE', 'VALUE_BAR_HEIGHT', 'PROGRESS_BAR_HEIGHT', 'PANEL_PADDING',
+    # Рамки
+    'FRAME_WIDTH', 'BORDER_WIDTH', 'CORNER_RADIUS', 'GRID_CELL_SIZE',
+    # Панель рекордов
+    'RECORDS_PANEL_TOP', 'RECORDS_ROW_HEIGHT', 'RECORDS_HEADER_Y', 'RECORDS_START_Y',
+    'RECORDS_COL_1', 'RECORDS_COL_2', 'RECORDS_COL_3', 'RECORDS_COL_4',
+    # Анимации паузы
+    'PATTERN_SPACING', 'PATTERN_MARGIN', 'SNAKE_MARGIN', 'SNAKE_PATH_SPACING',
+    'CAROUSEL_RADIUS', 'SWING_ROPE_LENGTH',
+)
+
+
 def recalculate():
     """Пересчитать все масштабируемые значения.
 
-    Вызывать после изменения настроек разрешения.
-    Возвращает словарь со всеми пересчитанными значениями.
+    Один проход по _SCALED_NAMES от базовых констант; масштаб читается
+    один раз. Вызывать после изменения настроек разрешения.
     """
-    global TILE_SIZE, GAP, TILE_FONT_SIZE, ARROW_SIZE, PANEL_WIDTH
-    global FONT_PANEL_LABEL, FONT_PANEL_VALUE, FONT_PANEL_PAUSE
-    global FONT_MENU_BUTTON, FONT_MENU_RECORDS_TITLE, FONT_MENU_RECORDS, FONT_MENU_RECORDS_SMALL
-    global FONT_RESULT_TITLE, FONT_RESULT_LABEL, FONT_RESULT_VALUE, FONT_RESULT_BUTTON
-    global FONT_PAUSE_TEXT, FONT_PAUSE_TITLE
-    global BUTTON_WIDTH, BUTTON_HEIGHT, RECORDS_BTN_WIDTH, RECORDS_BTN_HEIGHT
-    global CLOSE_BTN_SIZE, PAUSE_BTN_WIDTH, PAUSE_BTN_HEIGHT, SOUND_ICON_SIZE
-    global ICON_SIZE, VALUE_BAR_HEIGHT, PROGRESS_BAR_HEIGHT, PANEL_PADDING
-    global FRAME_WIDTH, BORDER_WIDTH, CORNER_RADIUS, GRID_CELL_SIZE
-    global RECORDS_PANEL_TOP, RECORDS_ROW_HEIGHT, RECORDS_HEADER_Y, RECORDS_START_Y
-    global RECORDS_COL_1, RECORDS_COL_2, RECORDS_COL_3, RECORDS_COL_4, RECORDS_PANEL_HEIGHT
-    global PATTERN_SPACING, PATTERN_MARGIN, SNAKE_MARGIN, SNAKE_PATH_SPACING
-    global CAROUSEL_RADIUS, SWING_ROPE_LENGTH
-
-    # Плитки
-    TILE_SIZE = scaled(BASE_TILE_SIZE)
-    GAP = scaled(BASE_GAP)
-    TILE_FONT_SIZE = scaled(BASE_TILE_FONT_SIZE)
-
-    # Стрелки
-    ARROW_SIZE = scaled(BASE_ARROW_SIZE)
+    global RECORDS_PANEL_HEIGHT
+    factor = get_scale()
+    namespace = globals()
+    for name in _SCALED_NAMES:
+        namespace[name] = max(1, int(namespace['BASE_' + name] * factor))
 
-    # Панель
-    PANEL_WIDTH = scaled(BASE_PANEL_WIDTH)
+    # Производные значения
+    RECORDS_PANEL_HEIGHT = (namespace['RECORDS_START_Y'] + 10 * namespace['RECORDS_ROW_HEIGHT']
+                            + max(1, int(BASE_RECORDS_BOTTOM_PAD * factor)))
 
-    # Шрифты панели
-    FONT_PANEL_LABEL = scaled(BASE_FONT_PANEL_LABEL)
-    FONT_PANEL_VALUE = scaled(BASE_FONT_PANEL_VALUE)
-    FONT_PANEL_PAUSE = scaled(BASE_FONT_PANEL_PAUSE)
 
-    # Шрифты меню
-    FONT_MENU_BUTTON = scaled(BASE_FONT_MENU_BUTTON)
-    FONT_MENU_RECORDS_TITLE = scaled(BASE_FONT_MENU_RECORDS_TITLE)
-    FONT_MENU_RECORDS = scaled(BASE_FONT_MENU_RECORDS)
-    FONT_MENU_RECORDS_SMALL = scaled(BASE_FONT_MENU_RECORDS_SMALL)
+def base_window_size(board_size):
+    """Размер окна (ширина, высота) при масштабе 1.0: поле в рамке + панель."""
+    field = board_size * BASE_TILE_SIZE + (board_size + 1) * BASE_GAP + 4 * BASE_FRAME_WIDTH
+    return field + BASE_PANEL_WIDTH, field
 
-    # Шрифты результата
-    FONT_RESULT_TITLE = scaled(BASE_FONT_RESULT_TITLE)
-    FONT_RESULT_LABEL = scaled(BASE_FONT_RESULT_LABEL)
-    FONT_RESULT_VALUE = scaled(BASE_FONT_RESULT_VALUE)
-    FONT_RESULT_BUTTON = scaled(BASE_FONT_RESULT_BUTTON)
 
-    # Шрифты паузы
-    FONT_PAUSE_TEXT = scaled(BASE_FONT_PAUSE_TEXT)
-    FONT_PAUSE_TITLE = scaled(BASE_FONT_PAUSE_TITLE)
+def fit_scale(width, height, board_size):
+    """Наибольший масштаб, при котором окно игры помещается в width x height."""
+    base_width, base_height = base_window_size(board_size)
+    return min(width / base_width, height / base_height)
 
-    # Кнопки
-    BUTTON_WIDTH = scaled(BASE_BUTTON_WIDTH)
-    BUTTON_HEIGHT = scaled(BASE_BUTTON_HEIGHT)
-    RECORDS_BTN_WIDTH = scaled(BASE_RECORDS_BTN_WIDTH)
-    RECORDS_BTN_HEIGHT = scaled(BASE_RECORDS_BTN_HEIGHT)
-    CLOSE_BTN_SIZE = scaled(BASE_CLOSE_BTN_SIZE)
-    PAUSE_BTN_WIDTH = scaled(BASE_PAUSE_BTN_WIDTH)
-    PAUSE_BTN_HEIGHT = scaled(BASE_PAUSE_BTN_HEIGHT)
-    SOUND_ICON_SIZE = scaled(BASE_SOUND_ICON_SIZE)
 
-    # Иконки и панель
-    ICON_SIZE = scaled(BASE_ICON_SIZE)
-    VALUE_BAR_HEIGHT = scaled(BASE_VALUE_BAR_HEIGHT)
-    PROGRESS_BAR_HEIGHT = scaled(BASE_PROGRESS_BAR_HEIGHT)
-    PANEL_PADDING = scaled(BASE_PANEL_PADDING)
+# ============================================
+# СМЕНА МАСШТАБА БЕЗ ПЕРЕЗАПУСКА
+# ============================================
+# Подписчики вызываются после recalculate(): сбрасывают кэши шрифтов,
+# стрелок, значков и т.п., зависящие от размеров.
+_listeners = []
 
-    # Рамки
-    FRAME_WIDTH = scaled(BASE_FRAME_WIDTH)
-    BORDER_WIDTH = scaled(BASE_BORDER_WIDTH)
-    CORNER_RADIUS = scaled(BASE_CORNER_RADIUS)
-    GRID_CELL_SIZE = scaled(BASE_GRID_CELL_SIZE)
 
-    # Панель рекордов
-    RECORDS_PANEL_TOP = scaled(BASE_RECORDS_PANEL_TOP)
-    RECORDS_ROW_HEIGHT = scaled(BASE_RECORDS_ROW_HEIGHT)
-    RECORDS_HEADER_Y = scaled(BASE_RECORDS_HEADER_Y)
-    RECORDS_START_Y = scaled(BASE_RECORDS_START_Y)
-    RECORDS_COL_1 = scaled(BASE_RECORDS_COL_1)
-    RECORDS_COL_2 = scaled(BASE_RECORDS_COL_2)
-    RECORDS_COL_3 = scaled(BASE_RECORDS_COL_3)
-    RECORDS_COL_4 = scaled(BASE_RECORDS_COL_4)
-    RECORDS_PANEL_HEIGHT = RECORDS_START_Y + 10 * RECORDS_ROW_HEIGHT + scaled(BASE_RECORDS_BOTTOM_PAD)
+def add_listener(callback):
+    """Подписать callback() на смену масштаба."""
+    if callback not in _listeners:
+        _listeners.append(callback)
 
-    # Анимации паузы
-    PATTERN_SPACING = scaled(BASE_PATTERN_SPACING)
-    PATTERN_MARGIN = scaled(BASE_PATTERN_MARGIN)
-    SNAKE_MARGIN = scaled(BASE_SNAKE_MARGIN)
-    SNAKE_PATH_SPACING = scaled(BASE_SNAKE_PATH_SPACING)
-    CAROUSEL_RADIUS = scaled(BASE_CAROUSEL_RADIUS)
-    SWING_ROPE_LENGTH = scaled(BASE_SWING_ROPE_LENGTH)
+
+def rescale():
+    """Пересчитать значения и уведомить подписчиков.
+
+    Окно и pygame при этом не пересоздаются - приложение само
+    перестраивает раскладку (см. GameApp.apply_scale).
+    """
+    recalculate()
+    for callback in list(_listeners):
+        callback()
 
 
 # Инициализация значений при загрузке модуля
@@ -0,0 +1,227 @@
+"""
+Scene stack and the single main loop.
+
+The start menu, the game, the pause overlay and the result and settings
+windows are scenes. SceneManager.run() is the only loop of the game: every
+frame it dispatches background results, pumps the event queue once, updates
+and draws the top scene, presents once and waits on one clock:
+
+    scenes = SceneManager()
+    scenes.push(menu, on_finish=on_menu_finished)
+    scenes.run()            # returns on QUIT or when the stack is empty
+
+A scene ends itself with finish(result): it is popped and on_finish(result)
+of its push() decides what comes next. QUIT, F3 (perf_hud) and VIDEORESIZE
+(resize) are handled here for every scene. Once a new window size has
+settled, on_resize() of the window owner rescales the game and relayout()
+rebuilds every scene of the stack, bottom first, whatever scene is on top.
+
+Overlays are drawn over a still copy of the frame below them, taken once
+when they are pushed, instead of redrawing the covered scene every frame.
+A non-modal overlay passes the events it does not consume to the scene
+below (the pause covers the field, the panel buttons stay live).
+"""
+
+import pygame
+
+from game_digits import main_thread
+from game_digits import perf_hud
+from game_digits import resize
+from game_digits import startup
+
+FPS = 60
+
+
+class Scene:
+    """One screen of the game: handle_event(), update() and draw() per frame."""
+
+    name = 'scene'   # Loop label in perf_hud
+    modal = True     # False: events the scene does not consume go to the scene below
+    manager = None   # Set by push()
+
+    def enter(self, manager):
+        """Called by push() before the scene goes on top of the stack."""
+        self.manager = manager
+
+    def handle_event(self, event):
+        """Handle one event. Returns True if it was consumed."""
+        return False
+
+    def update(self, now):
+        """Advance animations and logic to `now` (pygame ticks, ms)."""
+
+    def relayout(self):
+        """Rebuild the layout after the window was rescaled (scenes below are done)."""
+
+    def draw(self, screen):
+        """Draw the whole frame onto screen (the manager presents it)."""
+
+    def finish(self, result=None):
+        """Leave the stack and pass result to the on_finish of push()."""
+        self.manager.finish(self, result)
+
+
+class Overlay(Scene):
+    """Scene drawn over a still frame of the scene below.
+
+    `background` is a screen-sized copy taken by push() from the scene below,
+    unless the owner set it before (a window over a simplified backdrop).
+    """
+
+    background = None
+    _dimmed = None  # (alpha, кадр с затемнением)
+
+    def enter(self, manager):
+        super().enter(manager)
+        if self.background is None:
+            self.background = manager.snapshot()
+        self._dimmed = None
+
+    def relayout(self):
+        """Take a new still frame of the scene below in its new layout."""
+        below = self.manager.below(self)
+        if below is not None:
+            self.background = self.manager.snapshot(below)
+        self._dimmed = None
+
+    def draw_background(self, screen, dim=0):
+        """Blit the still frame, darkened by black of alpha `dim`.
+
+        The darkened copy is kept, so after a fade-in every frame is one blit.
+        """
+        if dim <= 0:
+            screen.blit(self.background, (0, 0))
+            return
+        if self._dimmed is None or self._dimmed[0] != dim:
+            frame = self.background.copy()
+            # Умножение на (255 - dim) - то же, что чёрный слой с прозрачностью dim
+            shade = 255 - dim
+            frame.fill((shade, shade, shade), special_flags=pygame.BLEND_MULT)
+            self._dimmed = (dim, frame)
+        screen.blit(self._dimmed[1], (0, 0))
+
+
+class SceneManager:
+    """Stack of scenes and the main loop that runs the top one."""
+
+    def __init__(self, fps=FPS, on_resize=None):
+        """
+        Args:
+            fps: Frame rate limit of run()
+            on_resize: Callback of the window owner, called once a new window
+                size has settled: takes it with resize.poll() and rescales
+                (True, then every scene is relaid out) or returns False to
+                keep the size pending
+        """
+        self.fps = fps
+        self.on_resize = on_resize
+        self.clock = pygame.time.Clock()
+        self.running = False
+        self._stack = []  # [(scene, on_finish)]
+
+    @property
+    def top(self):
+        """The scene that is updated and drawn, or None."""
+        return self._stack[-1][0] if self._stack else None
+
+    def __len__(self):
+        return len(self._stack)
+
+    def push(self, scene, on_finish=None):
+        """Put scene on top; on_finish(result) is called when it finishes."""
+        scene.enter(self)
+        self._stack.append((scene, on_finish))
+
+    def pop(self):
+        """Remove the top scene without calling its on_finish."""
+        scene, _ = self._stack.pop()
+        return scene
+
+    def replace(self, scene, on_finish=None):
+        """Pop the top scene and push scene instead."""
+        self.pop()
+        self.push(scene, on_finish)
+
+    def finish(self, scene, result=None):
+        """Remove scene from the stack and call its on_finish(result)."""
+        for i in range(len(self._stack) - 1, -1, -1):
+            if self._stack[i][0] is scene:
+                _, on_finish = self._stack.pop(i)
+                if on_finish is not None:
+                    on_finish(result)
+                return
+
+    def below(self, scene):
+        """The scene under scene in the stack, or None."""
+        for i in range(len(self._stack) - 1, 0, -1):
+            if self._stack[i][0] is scene:
+                return self._stack[i - 1][0]
+        return None
+
+    def snapshot(self, scene=None):
+        """Draw scene (the top one by default) and return a copy of the frame."""
+        screen = pygame.display.get_surface()
+        if scene is None:
+            scene = self.top
+        if scene is not None:
+            scene.draw(screen)
+        return screen.copy()
+
+    def quit(self):
+        """Stop run() before the next update."""
+        self.running = False
+
+    def _relayout(self):
+        for scene, _ in list(self._stack):
+            scene.relayout()
+
+    def _route(self, event):
+        for scene, _ in reversed(list(self._stack)):
+            if scene.handle_event(event) or scene.modal:
+                return
+
+    def run(self):
+        """The main loop: runs until QUIT, quit() or an empty stack."""
+        self.running = True
+        presented = False
+        while self.running and self._stack:
+            perf_hud.frame_start(self.top.name)
+
+            # Результаты фоновых задач (callbacks, ASYNC_RESULT_EVENT)
+            main_thread.dispatch()
+            perf_hud.mark('dispatch')
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+                    break
+                if resize.on_event(event) or perf_hud.handle_event(event):
+                    continue
+                if self._stack:
+                    self._route(event)
+            if not self.running or not self._stack:
+                break
+            # Размер окна устоялся: перестраиваем раскладку под любой верхней
+            # сценой (окна результата и настроек тоже), а не только в игре и меню
+            if self.on_resize is not None and resize.ready() and self.on_resize():
+                self._relayout()
+            perf_hud.mark('events')
+
+            self.top.update(pygame.time.get_ticks())
+            perf_hud.mark('update')
+            scene = self.top  # update() may finish the scene
+            if scene is None:
+                break
+
+            screen = pygame.display.get_surface()
+            scene.draw(screen)
+            perf_hud.mark('draw')
+            perf_hud.draw(screen)
+            pygame.display.update()
+            perf_hud.mark('present')
+            if not presented:
+                presented = True
+                startup.first_frame()
+
+            self.clock.tick(self.fps)
+        self.running = False
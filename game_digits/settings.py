@@ -1,9 +1,10 @@
 # Модуль настроек игры
 # Поддерживает динамическое изменение масштаба и скорости
 
-import json
 from pathlib import Path
 
+from game_digits import storage
+
 # Путь к файлу конфигурации
 CONFIG_PATH = Path.home() / ".game_digits" / "config.json"
 
@@ -23,13 +24,25 @@ SPEED_PRESETS = {
     'very_fast': {'name': 'Очень быстро', 'speed': 8},
 }
 
+# Границы произвольного масштаба (окно, растянутое мышью, или поле "марафона",
+# уменьшенное под экран: 32 клетки помещаются в 1080 пикселей примерно при 0.45)
+MIN_SCALE = 0.3
+MAX_SCALE = 3.0
+
 # Порядок пресетов для переключения
 SIZE_ORDER = ['small', 'medium', 'large', 'xlarge']
 SPEED_ORDER = ['slow', 'normal', 'fast', 'very_fast']
 
+# Размеры игрового поля (клеток по стороне)
+DEFAULT_BOARD_SIZE = 10
+BOARD_SIZES = [8, 10, 12, 16]
+MARATHON_BOARD_SIZES = [24, 32]  # Для стресс-тестов движка и рендера
+
 # Текущие настройки (глобальное состояние)
 _current_size = 'medium'
 _current_speed = 'normal'
+_board_size = DEFAULT_BOARD_SIZE
+_custom_scale = None  # Масштаб под размер окна; None - масштаб пресета
 
 # Для обратной совместимости
 PRESETS = SIZE_PRESETS
@@ -57,9 +70,29 @@ def get_preset_name():
 
 def get_scale():
     """Получить текущий масштаб."""
+    if _custom_scale is not None:
+        return _custom_scale
     return SIZE_PRESETS[_current_size]['scale']
 
 
+def set_custom_scale(value):
+    """Задать масштаб, подобранный под размер окна (ограничен MIN_SCALE..MAX_SCALE)."""
+    global _custom_scale
+    _custom_scale = max(MIN_SCALE, min(MAX_SCALE, float(value)))
+    return _custom_scale
+
+
+def clear_custom_scale():
+    """Вернуться к масштабу текущего пресета."""
+    global _custom_scale
+    _custom_scale = None
+
+
+def has_custom_scale():
+    """Масштаб задан размером окна, а не пресетом."""
+    return _custom_scale is not None
+
+
 def get_speed():
     """Получить текущую скорость."""
     return SPEED_PRESETS[_current_speed]['speed']
@@ -134,6 +167,33 @@ def get_all_presets():
     return [(key, SIZE_PRESETS[key]['name']) for key in SIZE_ORDER]
 
 
+def get_all_board_sizes():
+    """Все допустимые размеры поля: стандартные и "марафон"."""
+    return BOARD_SIZES + MARATHON_BOARD_SIZES
+
+
+def get_board_size():
+    """Получить размер игрового поля (клеток по стороне)."""
+    return _board_size
+
+
+def set_board_size(size):
+    """Установить размер игрового поля.
+
+    Принимает только BOARD_SIZES и MARATHON_BOARD_SIZES: рекорды и история
+    ведутся отдельно для каждого размера.
+    """
+    global _board_size
+    try:
+        size = int(size)
+    except (TypeError, ValueError):
+        return False
+    if size not in get_all_board_sizes():
+        return False
+    _board_size = size
+    return True
+
+
 # === Имя игрока ===
 
 _player_name = "Player"  # Значение по умолчанию
@@ -142,24 +202,16 @@ _player_name = "Player"  # Значение по умолчанию
 def _load_config():
     """Загрузить конфигурацию из файла."""
     global _player_name
-    if CONFIG_PATH.exists():
-        try:
-            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                _player_name = config.get('player_name', 'Player')
-        except (json.JSONDecodeError, IOError):
-            pass
+    # При повреждённом файле читается config.json.bak
+    config = storage.read_json(CONFIG_PATH, {})
+    if isinstance(config, dict):
+        _player_name = config.get('player_name', _player_name)
 
 
 def _save_config():
-    """Сохранить конфигурацию в файл."""
-    CONFIG_PATH.parent.mkdir(exist_ok=True)
+    """Сохранить конфигурацию в файл (атомарно, в фоновом потоке)."""
     config = {'player_name': _player_name}
-    try:
-        with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-            json.dump(config, f, ensure_ascii=False, indent=2)
-    except IOError:
-        pass
+    storage.save_json_async(CONFIG_PATH, config)
 
 
 def get_player_name():
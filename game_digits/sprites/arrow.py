@@ -1,5 +1,6 @@
 import pygame
 
+from game_digits import asset_cache
 from game_digits import scale as scale_module
 
 
@@ -17,10 +18,15 @@ class Arrow(pygame.sprite.Sprite):
         self.image = self.get_arrow_image(direction)
         self.rect = self.image.get_rect(topleft=position)
 
+    @classmethod
+    def clear_cache(cls):
+        """Сбросить кэш изображений (смена масштаба)."""
+        cls.arrow_images.clear()
+        cls._cached_arrow_size = None
+
     @classmethod
     def get_arrow_image(cls, direction):
         arrow_size = scale_module.ARROW_SIZE
-        base_arrow_size = scale_module.BASE_ARROW_SIZE
 
         # Инвалидация кэша при изменении масштаба
         if cls._cached_arrow_size != arrow_size:
@@ -30,6 +36,15 @@ class Arrow(pygame.sprite.Sprite):
         if direction in cls.arrow_images:
             return cls.arrow_images[direction].copy()
 
+        image = asset_cache.get_surface('arrow', (direction, arrow_size),
+                                        lambda: cls._render_arrow(direction, arrow_size))
+        cls.arrow_images[direction] = image
+        return image.copy()
+
+    @staticmethod
+    def _render_arrow(direction, arrow_size):
+        base_arrow_size = scale_module.BASE_ARROW_SIZE
+
         # Коэффициент масштабирования
         scale_factor = arrow_size / base_arrow_size
 
@@ -73,6 +88,7 @@ class Arrow(pygame.sprite.Sprite):
         elif direction == "left":
             image = pygame.transform.rotate(image, 180)
         # 'right' не требует вращения
+        return image
 
-        cls.arrow_images[direction] = image
-        return image.copy()
+
+scale_module.add_listener(Arrow.clear_cache)
@@ -1,6 +1,7 @@
 import pygame
 
-from game_digits import get_font_path
+from game_digits import asset_cache
+from game_digits import fonts
 from game_digits import scale
 from game_digits.constants import TILE_BORDER_COLOR, grid_to_pixel
 
@@ -13,15 +14,21 @@ class Tile(pygame.sprite.Sprite):
         self.color = color
         self.is_moving = False
         self.current_direction = None
-        tile_size = scale.TILE_SIZE
-        self.image = pygame.Surface((tile_size, tile_size))
-        self.rect = self.image.get_rect()
+        self.text_color = (0, 0, 0)
+        self.draw_tile(self.text_color)
+        self.rect = self.image.get_rect(topleft=grid_to_pixel(self.position[0], self.position[1]))
         self.target_rect = None
-        self.rect.topleft = grid_to_pixel(self.position[0], self.position[1])
-        self.draw_tile((0, 0, 0))
 
     def draw_tile(self, text_color):
-        self.image.fill(self.color)
+        """Взять картинку плитки из кэша (она общая для одинаковых плиток - не рисовать на ней)."""
+        self.text_color = text_color
+        params = (self.number, tuple(self.color), tuple(text_color), scale.TILE_SIZE, scale.TILE_FONT_SIZE)
+        self.image = asset_cache.get_surface('tile', params, lambda: self._render(text_color))
+
+    def _render(self, text_color):
+        tile_size = scale.TILE_SIZE
+        image = pygame.Surface((tile_size, tile_size))
+        image.fill(self.color)
 
         # === НАСТРАИВАЕМЫЕ ПАРАМЕТРЫ ===
         # bevel пропорционален размеру плитки (было 3px при TILE_SIZE=64, ~4.7%)
@@ -34,28 +41,33 @@ class Tile(pygame.sprite.Sprite):
         # Цвет для тени
         dark = tuple(clamp(int(c * dark_factor)) for c in self.color)
 
-        w, h = self.image.get_size()
+        w, h = image.get_size()
 
         # Нижняя грань (тень)
-        pygame.draw.rect(self.image, dark, (0, h - bevel, w, bevel))
+        pygame.draw.rect(image, dark, (0, h - bevel, w, bevel))
         # Правая грань (тень)
-        pygame.draw.rect(self.image, dark, (w - bevel, 0, bevel, h))
+        pygame.draw.rect(image, dark, (w - bevel, 0, bevel, h))
 
         # Тонкая рамка по контуру
-        pygame.draw.rect(self.image, TILE_BORDER_COLOR, self.image.get_rect(), 1)
+        pygame.draw.rect(image, TILE_BORDER_COLOR, image.get_rect(), 1)
 
         # Текст
-        font = pygame.font.Font(
-            get_font_path("OpenSans-VariableFont_wdth,wght.ttf"), scale.TILE_FONT_SIZE
-        )
+        font = fonts.get_font(fonts.TILE_FONT, scale.TILE_FONT_SIZE)
         text = font.render(str(self.number), True, text_color)
         text_rect = text.get_rect(center=(w // 2, h // 2))
-        self.image.blit(text, text_rect)
+        image.blit(text, text_rect)
+        return image
 
     def update_color(self, new_color, text_color=(255, 255, 202)):
         self.color = new_color
         self.draw_tile(text_color)
 
+    def rescale(self):
+        """Перерисовать плитку под текущий scale.TILE_SIZE и поставить в свою клетку."""
+        self.draw_tile(self.text_color)
+        self.rect = self.image.get_rect(topleft=grid_to_pixel(self.position[0], self.position[1]))
+        self.target_rect = None
+
     def target_move(self, direction, board):
         x, y = self.position
 
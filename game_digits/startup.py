@@ -0,0 +1,177 @@
+"""
+Startup timeline and work deferred until the first menu frame.
+
+main.py imports this module first, so T0 is (close to) process start:
+
+    startup.mark('import pygame')   # label the moment a step finished
+    startup.defer(preload_sounds)   # run in a background thread after first paint
+    startup.first_frame()           # the scene loop calls this after the first present
+
+Everything the first menu frame does not need (sounds, the result and
+settings windows with SQLite and the HTTP client behind them, the API
+outbox) is passed to defer() and loaded in a background thread while the
+menu intro animation plays.
+
+With --startup-trace every mark and every import of 1 ms or more (inclusive,
+indented by nesting) is printed as a timeline when the first frame is on
+screen.
+"""
+
+import sys
+import threading
+import time
+
+T0 = time.perf_counter()
+
+IMPORT_THRESHOLD_MS = 1.0
+
+_trace = False
+_marks = []     # (ms since T0, label)
+_imports = []   # (ms since T0 at start, duration ms, depth, module)
+_import_depth = 0
+_deferred = []
+_first_frame_done = False
+_lock = threading.Lock()
+
+
+def _now_ms():
+    return (time.perf_counter() - T0) * 1000
+
+
+def mark(label):
+    """Record that a startup step finished (only kept with --startup-trace)."""
+    if _trace:
+        _marks.append((_now_ms(), label))
+
+
+class _TimedLoader:
+    """Loader wrapper timing exec_module (the module body and its imports)."""
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        global _import_depth
+        if threading.current_thread() is not threading.main_thread():
+            self._loader.exec_module(module)  # Preloads: not part of the timeline
+            return
+        start = _now_ms()
+        depth = _import_depth
+        _import_depth += 1
+        try:
+            self._loader.exec_module(module)
+        finally:
+            _import_depth -= 1
+            duration = _now_ms() - start
+            if duration >= IMPORT_THRESHOLD_MS:
+                _imports.append((start, duration, depth, module.__name__))
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTimer:
+    """sys.meta_path entry that wraps the loaders found by the other finders."""
+
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimedLoader(spec.loader)
+                return spec
+        return None
+
+
+def enable_trace():
+    """Record marks and imports and print the timeline at the first frame."""
+    global _trace
+    if not _trace:
+        _trace = True
+        sys.meta_path.insert(0, _ImportTimer())
+
+
+def import_pygame():
+    """Import pygame without pkg_resources.
+
+    pygame.pkgdata imports pkg_resources (when setuptools is installed) only
+    to find resources inside zipped eggs; that import alone can take over
+    100 ms. With it hidden pygame falls back to plain files, which is what
+    the game uses anyway.
+    """
+    if 'pygame' in sys.modules:
+        return sys.modules['pygame']
+    hidden = 'pkg_resources' not in sys.modules
+    if hidden:
+        sys.modules['pkg_resources'] = None  # ImportError on import
+    try:
+        import pygame
+    finally:
+        if hidden:
+            del sys.modules['pkg_resources']
+    mark('import pygame')
+    return pygame
+
+
+def defer(fn, *args):
+    """Run fn(*args) in the background once the first frame is on screen.
+
+    Deferred work must not touch pygame surfaces that the main thread uses;
+    results go back through main_thread.call_soon() if the UI needs them.
+    """
+    with _lock:
+        if not _first_frame_done:
+            _deferred.append((fn, args))
+            return
+    _start_worker([(fn, args)])
+
+
+def _run_deferred(tasks):
+    for fn, args in tasks:
+        try:
+            fn(*args)
+        except Exception as e:  # A failed preload only means loading it later
+            from game_digits import log
+            log.get_logger('startup').warning('preload_failed', task=getattr(fn, '__name__', str(fn)),
+                                              error=str(e))
+        if _trace:
+            # The timeline is already printed: report preloads as they finish
+            print(f"{_now_ms():8.1f}  preloaded {getattr(fn, '__name__', fn)} (background)",
+                  file=sys.stderr)
+
+
+def _start_worker(tasks):
+    threading.Thread(target=_run_deferred, args=(tasks,), name="preload", daemon=True).start()
+
+
+def first_frame():
+    """The first frame is presented: print the trace and start the preloads."""
+    global _first_frame_done
+    with _lock:
+        if _first_frame_done:
+            return
+        _first_frame_done = True
+        tasks = list(_deferred)
+        _deferred.clear()
+    mark('first frame')
+    if _trace:
+        print_timeline()
+    if tasks:
+        _start_worker(tasks)
+
+
+def print_timeline(file=None):
+    """Print marks and slow imports in time order."""
+    file = file or sys.stderr
+    rows = list(_marks)
+    rows += [(start + duration, f"{'  ' * depth}import {name} ({duration:.1f} ms)")
+             for start, duration, depth, name in _imports]
+    rows.sort(key=lambda row: row[0])
+    print("Startup timeline (ms since start):", file=file)
+    for at, text in rows:
+        print(f"{at:8.1f}  {text}", file=file)
@@ -0,0 +1,139 @@
+"""
+Crash-safe JSON persistence.
+
+Writes go to a temporary file that is fsync'ed and then atomically renamed
+over the target. The previous version is kept as <name>.bak, and reads fall
+back to it if the main file is missing or corrupt.
+
+save_json_async() hands the write to the I/O executor (io_executor.py), so
+the game loop never blocks on disk. Saves of the same file are keyed by path:
+a save still waiting in the queue is replaced by a newer one, so only the
+latest content is written.
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+from game_digits import io_executor
+from game_digits import log
+
+_logger = log.get_logger('storage')
+
+# fsync policy: True = fsync file and directory on every commit (durable),
+# False = rely on the OS to flush (faster, still atomic via rename)
+FSYNC = True
+
+
+def _backup_path(path):
+    return path.with_name(path.name + ".bak")
+
+
+def _fsync_dir(directory):
+    """Persist a rename by syncing the directory (no-op where unsupported)."""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_text_atomic(path, text, durable=None):
+    """Atomically replace path with text, keeping the old version as .bak.
+
+    Raises:
+        OSError: If the file could not be written
+    """
+    path = Path(path)
+    durable = FSYNC if durable is None else durable
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        if durable:
+            os.fsync(f.fileno())
+
+    if path.exists():
+        try:
+            shutil.copyfile(path, _backup_path(path))
+        except OSError:
+            pass  # Backup is best effort, the new file is what matters
+    os.replace(tmp_path, path)
+    if durable:
+        _fsync_dir(path.parent)
+
+
+def write_json(path, data, durable=None):
+    """Synchronously and atomically write data as JSON."""
+    write_text_atomic(path, json.dumps(data, ensure_ascii=False, indent=2), durable)
+
+
+def _read_json_file(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_json(path, default=None):
+    """Read JSON from path, falling back to the .bak copy.
+
+    Returns:
+        Parsed data, or default if neither file is readable
+    """
+    path = Path(path)
+    for candidate in (path, _backup_path(path)):
+        try:
+            return _read_json_file(candidate)
+        except FileNotFoundError:
+            continue
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+            _logger.warning('read_failed', path=str(candidate), error=str(e))
+            continue
+    return default
+
+
+def _commit(path, text, durable, on_saved):
+    """Executor task: write one file and report the outcome."""
+    try:
+        write_text_atomic(path, text, durable)
+        ok = True
+    except OSError as e:
+        _logger.error('write_failed', path=str(path), error=str(e))
+        ok = False
+    if on_saved is not None:
+        on_saved(ok)
+
+
+def save_json_async(path, data, durable=None, on_saved=None):
+    """Queue an atomic JSON write on the I/O executor.
+
+    Data is serialized immediately, so the caller may keep mutating it.
+
+    Args:
+        path: Target file
+        data: JSON-serializable data
+        durable: Override FSYNC policy for this write
+        on_saved: Optional callback(ok) called from the worker thread
+            (not called if a newer save of the same file replaced this one)
+    """
+    path = Path(path)
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    durable = FSYNC if durable is None else durable
+    future = io_executor.submit(_commit, path, text, durable, on_saved, key=('save', str(path)))
+    if future is None:
+        # Executor already shut down (exiting) - write synchronously
+        _commit(path, text, durable, on_saved)
+
+
+def flush(timeout=None):
+    """Block until queued writes are on disk."""
+    return io_executor.get_executor().wait_idle(timeout)
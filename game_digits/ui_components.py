@@ -3,6 +3,8 @@ import pygame
 import pygame.gfxdraw
 import math
 
+from game_digits import asset_cache
+from game_digits import instrument
 from game_digits import scale
 
 
@@ -25,7 +27,13 @@ def draw_rounded_rect(surface, color, rect, radius):
 def draw_gradient_rounded_rect(surface, rect, color_top, color_bottom, radius):
     """Draw a rounded rectangle with vertical gradient."""
     x, y, w, h = rect
+    params = (w, h, tuple(color_top), tuple(color_bottom), radius)
+    gradient = asset_cache.get_surface(
+        'gradient', params, lambda: _render_gradient(w, h, color_top, color_bottom, radius))
+    surface.blit(gradient, (x, y))
 
+
+def _render_gradient(w, h, color_top, color_bottom, radius):
     # Create a temporary surface for the gradient
     temp_surface = pygame.Surface((w, h), pygame.SRCALPHA)
 
@@ -43,8 +51,7 @@ def draw_gradient_rounded_rect(surface, rect, color_top, color_bottom, radius):
 
     # Apply mask
     temp_surface.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-
-    surface.blit(temp_surface, (x, y))
+    return temp_surface
 
 
 def draw_pause_button(surface, rect, font, text="пауза", is_pressed=False):
@@ -295,6 +302,7 @@ def draw_value_bar(surface, rect, value, font):
     surface.blit(text_surface, text_rect)
 
 
+@instrument.timed('ui.draw_progress_bar')
 def draw_progress_bar(surface, rect, progress, radius=None):
     """Draw progress bar with blue background and two-color yellow fill."""
     x, y, w, h = rect
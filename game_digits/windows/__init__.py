@@ -1,8 +1,26 @@
-"""Windows module for game UI windows."""
+"""Windows module for game UI windows.
 
-from game_digits.windows.result_window import ResultWindow
-from game_digits.windows.start_menu import StartMenu
-from game_digits.windows.pause_overlay import PauseOverlay
-from game_digits.windows.settings_window import SettingsWindow
+Window classes are imported on first access, so importing one window (the
+start menu at startup) does not pull in the others and their dependencies
+(SQLite history, the HTTP client behind score submission).
+"""
+
+import importlib
+
+_MODULES = {
+    'ResultWindow': 'game_digits.windows.result_window',
+    'StartMenu': 'game_digits.windows.start_menu',
+    'PauseOverlay': 'game_digits.windows.pause_overlay',
+    'SettingsWindow': 'game_digits.windows.settings_window',
+}
 
 __all__ = ['ResultWindow', 'StartMenu', 'PauseOverlay', 'SettingsWindow']
+
+
+def __getattr__(name):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -5,8 +5,10 @@ Animated pause overlay with multiple animation patterns.
 import math
 import random
 import pygame
-from game_digits import get_font_path
+from game_digits import asset_cache
+from game_digits import fonts
 from game_digits import scale
+from game_digits import scenes
 
 
 class PauseTile:
@@ -24,30 +26,35 @@ class PauseTile:
         self.vy = 0
 
         # Font for the letter
-        self.font = pygame.font.Font(get_font_path("2204.ttf"), scale.FONT_PAUSE_TEXT)
+        self.font = fonts.get_font(fonts.BOLD_FONT, scale.FONT_PAUSE_TEXT)
 
         # Pre-render the tile surface
         self._render_tile()
 
     def _render_tile(self):
-        """Pre-render the tile with letter."""
-        self.surface = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
+        """Pre-render the tile with letter (shared through the asset cache)."""
+        params = (self.letter, tuple(self.color), self.tile_size, scale.FONT_PAUSE_TEXT)
+        self.surface = asset_cache.get_surface('pause_tile', params, self._draw_tile)
+
+    def _draw_tile(self):
+        surface = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
 
         radius = scale.scaled(8)
         rect = pygame.Rect(0, 0, self.tile_size, self.tile_size)
 
-        pygame.draw.rect(self.surface, self.color, rect, border_radius=radius)
+        pygame.draw.rect(surface, self.color, rect, border_radius=radius)
 
         highlight = pygame.Surface((self.tile_size, self.tile_size // 2), pygame.SRCALPHA)
         highlight.fill((255, 255, 255, 40))
-        self.surface.blit(highlight, (0, 0))
+        surface.blit(highlight, (0, 0))
 
         border_color = tuple(max(0, c - 40) for c in self.color)
-        pygame.draw.rect(self.surface, border_color, rect, width=scale.BORDER_WIDTH, border_radius=radius)
+        pygame.draw.rect(surface, border_color, rect, width=scale.BORDER_WIDTH, border_radius=radius)
 
         text = self.font.render(self.letter, True, (255, 255, 255))
         text_rect = text.get_rect(center=(self.tile_size // 2, self.tile_size // 2))
-        self.surface.blit(text, text_rect)
+        surface.blit(text, text_rect)
+        return surface
 
     def draw(self, surface: pygame.Surface):
         """Draw the tile at current position."""
@@ -319,12 +326,17 @@ class TypewriterPattern:
                 tile.y = self.center_y - bounce
 
 
-class PauseOverlay:
+class PauseOverlay(scenes.Overlay):
     """Animated overlay shown when game is paused.
 
-    Randomly selects from multiple animation patterns.
+    Randomly selects from multiple animation patterns. Covers the game field
+    only: clicks on the panel (pause and sound buttons) go to the game below.
+    Finishes with 'menu' when "В меню" is clicked.
     """
 
+    name = 'pause'
+    modal = False
+
     COLORS = [
         (231, 125, 128),  # П - red/pink
         (111, 183, 214),  # А - blue
@@ -335,17 +347,22 @@ class PauseOverlay:
 
     PATTERN_NAMES = ['wave', 'float', 'swing', 'breathe', 'carousel', 'typewriter', 'bounce', 'snake']
 
-    def __init__(self, field_width: int, field_height: int):
-        self.field_width = field_width
-        self.field_height = field_height
-
+    def __init__(self, field_width: int, field_height: int, offset: tuple = (0, 0)):
         self.tiles = []
         self.pattern = None
         self.pattern_index = 0
         self.start_time = 0
+        self.menu_button_hovered = False
+        self.menu_button_pressed = False
+        self.set_layout(field_width, field_height, offset)
+
+    def set_layout(self, field_width: int, field_height: int, offset: tuple = (0, 0)):
+        """Fonts, button and tiles for the current scale and field size."""
+        self.field_width = field_width
+        self.field_height = field_height
 
-        self.title_font = pygame.font.Font(get_font_path("2204.ttf"), scale.FONT_PAUSE_TITLE)
-        self.button_font = pygame.font.Font(get_font_path("2204.ttf"), scale.FONT_MENU_BUTTON)
+        self.title_font = fonts.get_font(fonts.BOLD_FONT, scale.FONT_PAUSE_TITLE)
+        self.button_font = fonts.get_font(fonts.BOLD_FONT, scale.FONT_MENU_BUTTON)
 
         # Кнопка "В меню" (внизу по центру)
         btn_width = scale.scaled(160)
@@ -356,13 +373,15 @@ class PauseOverlay:
             btn_width,
             btn_height
         )
-        self.menu_button_hovered = False
-        self.menu_button_pressed = False
-        # Смещение для преобразования в экранные координаты
-        self.offset_x = 0
-        self.offset_y = 0
+        # Смещение поля на экране (экранные координаты кнопки)
+        self.offset_x, self.offset_y = offset
+        self.field_rect = pygame.Rect(offset, (field_width, field_height))
 
-        self._create_tiles()
+        # Та же анимация, но вокруг нового центра поля
+        if self.pattern is not None:
+            self._select_pattern()
+        else:
+            self._create_tiles()
 
     def _create_tiles(self):
         """Create tile objects for ПАУЗА."""
@@ -409,16 +428,18 @@ class PauseOverlay:
             self.pattern = TypewriterPattern(self.tiles, center_x, center_y)
 
     def start(self):
-        """Start the animation with a random pattern."""
+        """Start the animation with a random pattern (before every push)."""
         self.start_time = pygame.time.get_ticks()
         self.pattern_index = random.randint(0, len(self.PATTERN_NAMES) - 1)
         self._select_pattern()
+        self.background = None  # Новый снимок игры при push()
+        self.menu_button_hovered = False
+        self.menu_button_pressed = False
 
-    def update(self):
+    def update(self, now):
         """Update tile positions based on current pattern."""
         if self.pattern:
-            current_time = pygame.time.get_ticks() - self.start_time
-            self.pattern.update(current_time)
+            self.pattern.update(now - self.start_time)
 
     def _draw_menu_button(self, surface: pygame.Surface):
         """Draw the 'В меню' button."""
@@ -492,22 +513,32 @@ class PauseOverlay:
         btn_rect = self.get_screen_button_rect()
         return was_pressed and btn_rect.collidepoint(screen_pos)
 
-    def draw(self, surface: pygame.Surface, offset_x: int = 0, offset_y: int = 0):
-        """Draw the pause overlay."""
-        self.offset_x = offset_x
-        self.offset_y = offset_y
+    def handle_event(self, event):
+        """"В меню" button; clicks on the field are swallowed."""
+        if event.type == pygame.MOUSEMOTION:
+            self.handle_mouse_move(event.pos)
+            return True
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.handle_mouse_down(event.pos)
+            return self.field_rect.collidepoint(event.pos)
+        if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            if self.handle_mouse_up(event.pos):
+                self.finish('menu')
+                return True
+        return False
 
-        overlay = pygame.Surface((self.field_width, self.field_height), pygame.SRCALPHA)
+    def draw(self, screen: pygame.Surface):
+        """Draw the still game frame and the pause overlay over the field."""
+        self.draw_background(screen)
+
+        # Subsurface: drawing is clipped to the field without a surface per frame
+        overlay = screen.subsurface(self.field_rect)
 
         # Fully opaque dark background
-        overlay.fill((35, 50, 65, 255))
+        overlay.fill((35, 50, 65))
 
-        # Update and draw tiles
-        self.update()
         for tile in self.tiles:
             tile.draw(overlay)
 
         # Draw "В меню" button at bottom
         self._draw_menu_button(overlay)
-
-        surface.blit(overlay, (offset_x, offset_y))
@@ -1,12 +1,16 @@
 """Result window for displaying game results."""
-import sys
 import pygame
 
-from game_digits import get_font_path
+from game_digits import perf_hud
+from game_digits import fonts
 from game_digits import ui_components as ui
 from game_digits import records
+from game_digits import history
+from game_digits import leaderboard
+from game_digits import main_thread
 from game_digits import ranks
 from game_digits import scale
+from game_digits import scenes
 from game_digits import settings
 from game_digits import api_client
 from game_digits.sprites import ConfettiSystem
@@ -23,44 +27,35 @@ CONGRATS_TEXT_COLOR = (171, 78, 59)
 CONGRATS_BORDER_COLOR = (220, 200, 160)
 
 
-class ResultWindow:
+class ResultWindow(scenes.Overlay):
     """Display the game result window with final score.
 
+    Finishes with 'new_game' if the user wants to start a new game or
+    'menu' if the close button was clicked.
+
     Args:
         screen: Pygame screen surface
         screen_size: Tuple (width, height) of the screen
         game_score: Player's score from the game
         current_time: Remaining time when game ended
-        redraw_callback: Function to call to redraw game background
+        background: Game frame to show under the window (None - the scene below)
+        game_stats: Optional dict from Game.get_stats() stored in game history
     """
 
+    name = 'result'
+
     # Animation timing constants (in milliseconds)
     WINDOW_FADE_IN_DURATION = 200   # Fade in of window and overlay
     ROW_APPEAR_DELAY = 1000         # Interval between row appearances (1s)
     NUMBER_ANIMATION_DURATION = 2500  # Number animation duration (2.5s)
 
-    def __init__(self, screen, screen_size, game_score, current_time, redraw_callback, play_sound_callback=None, test_mode=False):
-        # Window dimensions (масштабируемые - вычисляем в __init__ для динамического масштаба)
-        self.WINDOW_WIDTH = scale.scaled(420)
-        self.WINDOW_HEIGHT = scale.scaled(340)
-
-        # Layout constants (масштабируемые)
-        self.HEADER_HEIGHT = scale.scaled(50)
-        self.PADDING = scale.scaled(20)
-        self.ROW_HEIGHT = scale.scaled(50)
-        self.ROW_GAP = scale.scaled(12)
-        self.screen = screen
-        self.screen_width, self.screen_height = screen_size
+    def __init__(self, screen, screen_size, game_score, current_time, background=None, play_sound_callback=None, test_mode=False, game_stats=None):
         self.game_score = game_score
         self.current_time = current_time
-        self.redraw_callback = redraw_callback
+        self.background = background
         self.play_sound = play_sound_callback
         self.test_mode = test_mode
 
-        # Calculate window position (centered)
-        self.window_x = (self.screen_width - self.WINDOW_WIDTH) // 2
-        self.window_y = (self.screen_height - self.WINDOW_HEIGHT) // 2
-
         # Calculate scores
         self.remaining_time = round(self.current_time)
         self.bonus = 300 + 5 * self.remaining_time
@@ -69,47 +64,44 @@ class ResultWindow:
         # Get rank info (name, fg_color, bg_color)
         self.rank_name, self.rank_fg, self.rank_bg = ranks.get_rank(self.total_score)
 
-        # Add height for rank row (same as other rows)
-        self.RANK_ROW_HEIGHT = self.ROW_HEIGHT + self.ROW_GAP  # Same visual height as other rows
-        self.WINDOW_HEIGHT += self.RANK_ROW_HEIGHT
+        # Records and history are kept per board size: results of different boards don't compare
+        game_stats = game_stats or {}
+        self.board_size = game_stats.get('board_size') or settings.get_board_size()
 
-        # Save record FIRST to know if we need extra space
+        # Save record FIRST to know if we need extra space (in-memory top list,
+        # the one the records panel of the start menu shows)
         self.record_position = records.add_record(
             score=self.game_score,
             bonus=self.bonus,
             total=self.total_score,
+            test_mode=self.test_mode,
+            board_size=self.board_size
+        )
+
+        # Every finished game goes to history (records keep only the top 10), in the background
+        history.record_game_async(
+            dict(game_stats,
+                 score=self.game_score,
+                 bonus=self.bonus,
+                 total=self.total_score,
+                 rank=self.rank_name,
+                 board_size=self.board_size),
             test_mode=self.test_mode
         )
 
         # Отправляем на сервер ТОЛЬКО если это новый лучший результат (1 место)
-        if self.record_position == 1 and not self.test_mode:
+        # и только с обычного поля: глобальная таблица ведётся для него одного
+        self.score_sent = False
+        self.world_position = None  # Место в мире после отправки (из leaderboard)
+        if (self.record_position == 1 and not self.test_mode
+                and self.board_size == settings.DEFAULT_BOARD_SIZE):
+            self.score_sent = True
             api_client.submit_score(
                 game_score=self.game_score,
                 remaining_time=self.remaining_time
             )
 
-        # Adjust window height if showing congratulations
-        self.CONGRATS_HEIGHT = scale.scaled(35) if self.record_position is not None else 0
-        self.actual_window_height = self.WINDOW_HEIGHT + self.CONGRATS_HEIGHT
-
-        # Recalculate window position with new height
-        self.window_y = (self.screen_height - self.actual_window_height) // 2
-
-        # Load fonts
-        bold_font_path = get_font_path("2204.ttf")
-        self.title_font = pygame.font.Font(bold_font_path, scale.FONT_RESULT_TITLE)
-        self.label_font = pygame.font.Font(bold_font_path, scale.FONT_RESULT_LABEL)
-        self.value_font = pygame.font.Font(bold_font_path, scale.FONT_RESULT_VALUE)
-        self.button_font = pygame.font.Font(bold_font_path, scale.FONT_RESULT_BUTTON)
-        self.rank_fallback_font = pygame.font.Font(bold_font_path, scale.scaled(20))  # For long rank names
-
-        # Button positions (relative to window) - adjusted for congrats row and rank row
-        self.new_game_btn_rel = pygame.Rect(
-            self.PADDING,
-            self.HEADER_HEIGHT + self.PADDING + (self.ROW_HEIGHT + self.ROW_GAP) * 3 + self.RANK_ROW_HEIGHT + self.CONGRATS_HEIGHT + scale.scaled(12),
-            self.WINDOW_WIDTH - 2 * self.PADDING,
-            scale.scaled(50)
-        )
+        self._init_layout(screen, screen_size)
 
         # Button state tracking
         self.new_game_pressed = False
@@ -124,6 +116,8 @@ class ResultWindow:
         self.rows_animation_started = False
         self.rows_animation_start_time = 0
         self.animation_complete = False
+        self.window_opacity = 0
+        self.overlay_alpha = 0
 
         # Конфетти для топ-10
         self.confetti = None
@@ -131,20 +125,58 @@ class ResultWindow:
         if self.record_position is not None:
             self.confetti = ConfettiSystem(self.screen_width, self.screen_height)
 
+    def _init_layout(self, screen, screen_size):
+        # Window dimensions (масштабируемые - вычисляем при раскладке для динамического масштаба)
+        self.WINDOW_WIDTH = scale.scaled(420)
+        self.WINDOW_HEIGHT = scale.scaled(340)
+
+        # Layout constants (масштабируемые)
+        self.HEADER_HEIGHT = scale.scaled(50)
+        self.PADDING = scale.scaled(20)
+        self.ROW_HEIGHT = scale.scaled(50)
+        self.ROW_GAP = scale.scaled(12)
+        self.screen = screen
+        self.screen_width, self.screen_height = screen_size
+
+        # Add height for rank row (same as other rows)
+        self.RANK_ROW_HEIGHT = self.ROW_HEIGHT + self.ROW_GAP  # Same visual height as other rows
+        self.WINDOW_HEIGHT += self.RANK_ROW_HEIGHT
+
+        # Adjust window height if showing congratulations
+        self.CONGRATS_HEIGHT = scale.scaled(35) if self.record_position is not None else 0
+        self.actual_window_height = self.WINDOW_HEIGHT + self.CONGRATS_HEIGHT
+
+        # Calculate window position (centered)
+        self.window_x = (self.screen_width - self.WINDOW_WIDTH) // 2
+        self.window_y = (self.screen_height - self.actual_window_height) // 2
+
+        # Load fonts
+        self.title_font = fonts.get_font(fonts.BOLD_FONT, scale.FONT_RESULT_TITLE)
+        self.label_font = fonts.get_font(fonts.BOLD_FONT, scale.FONT_RESULT_LABEL)
+        self.value_font = fonts.get_font(fonts.BOLD_FONT, scale.FONT_RESULT_VALUE)
+        self.button_font = fonts.get_font(fonts.BOLD_FONT, scale.FONT_RESULT_BUTTON)
+        self.rank_fallback_font = fonts.get_font(fonts.BOLD_FONT, scale.scaled(20))  # For long rank names
+
+        # Button positions (relative to window) - adjusted for congrats row and rank row
+        self.new_game_btn_rel = pygame.Rect(
+            self.PADDING,
+            self.HEADER_HEIGHT + self.PADDING + (self.ROW_HEIGHT + self.ROW_GAP) * 3 + self.RANK_ROW_HEIGHT + self.CONGRATS_HEIGHT + scale.scaled(12),
+            self.WINDOW_WIDTH - 2 * self.PADDING,
+            scale.scaled(50)
+        )
+
+        # Button rects in screen coordinates (the close button is known after drawing)
+        self.close_btn_screen = pygame.Rect(0, 0, 0, 0)
+        self.new_game_btn_screen = self.new_game_btn_rel.move(self.window_x, self.window_y)
+
     def _draw_window(self, rows_to_show=3, current_total=None, opacity=255, overlay_alpha=128):
         """Draw the complete result window with animation state.
 
         Returns:
             Tuple of (close_btn_rect, new_game_btn_rect)
         """
-        # Redraw game scene via callback
-        self.redraw_callback()
-
-        # Darken background with fade-in
-        if overlay_alpha > 0:
-            overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, overlay_alpha))
-            self.screen.blit(overlay, (0, 0))
+        # Still game frame, darkened with fade-in
+        self.draw_background(self.screen, dim=overlay_alpha)
 
         # Create window surface
         window_surface = pygame.Surface((self.WINDOW_WIDTH, self.actual_window_height), pygame.SRCALPHA)
@@ -343,6 +375,8 @@ class ResultWindow:
 
     def _get_place_text(self, position):
         """Возвращает текст поздравления с местом."""
+        if self.world_position is not None:
+            return f"Рекорд! {self.world_position} место в мире"
         if position == 1:
             return "Новый рекорд! 1 место!"
         elif position == 2:
@@ -352,100 +386,86 @@ class ResultWindow:
         else:
             return f"Топ-10! {position} место!"
 
-    def show(self):
-        """Display the result window and wait for user interaction.
-
-        Returns:
-            str: 'new_game' if user wants to start new game,
-                 'menu' if user clicked close button,
-                 None if window closed
-        """
+    def enter(self, manager):
+        super().enter(manager)
         self.animation_start_time = pygame.time.get_ticks()
 
-        # Initial draw (transparent window for fade-in)
-        close_btn_rect, new_game_btn_rect = self._draw_window(
-            rows_to_show=0, opacity=0, overlay_alpha=0
-        )
-
-        # Adjust button rects for screen coordinates
-        close_btn_screen = pygame.Rect(
-            self.window_x + close_btn_rect.x,
-            self.window_y + close_btn_rect.y,
-            close_btn_rect.width,
-            close_btn_rect.height
+    def relayout(self):
+        """Window of the new scale centered over a new frame of the game."""
+        super().relayout()
+        screen = pygame.display.get_surface()
+        self._init_layout(screen, screen.get_size())
+        if self.confetti is not None:
+            self.confetti.screen_width, self.confetti.screen_height = screen.get_size()
+
+    def update(self, now):
+        """Advance the rows, the total and the confetti."""
+        self.window_opacity, self.overlay_alpha = self._update_animation(now)
+
+        # Конфетти при попадании в топ-10
+        if self.confetti is not None:
+            # Запускаем конфетти когда анимация завершена
+            if self.animation_complete and not self.confetti_started:
+                self.confetti.start()
+                self.confetti_started = True
+                if self.play_sound:
+                    self.play_sound('celebration')
+            if self.confetti_started:
+                self.confetti.update()
+
+    def draw(self, screen):
+        close_btn_rect, _ = self._draw_window(
+            rows_to_show=self.visible_rows,
+            current_total=self.animated_total if self.visible_rows >= 3 else None,
+            opacity=self.window_opacity,
+            overlay_alpha=self.overlay_alpha
         )
-        new_game_btn_screen = pygame.Rect(
-            self.window_x + self.new_game_btn_rel.x,
-            self.window_y + self.new_game_btn_rel.y,
-            self.new_game_btn_rel.width,
-            self.new_game_btn_rel.height
-        )
-
-        waiting = True
-        result = None
-
-        while waiting:
-            current_time = pygame.time.get_ticks()
-
-            # Update animation
-            window_opacity, overlay_alpha = self._update_animation(current_time)
-
-            # Redraw with current animation state
-            close_btn_rect, new_game_btn_rect = self._draw_window(
-                rows_to_show=self.visible_rows,
-                current_total=self.animated_total if self.visible_rows >= 3 else None,
-                opacity=window_opacity,
-                overlay_alpha=overlay_alpha
-            )
-
-            # Конфетти при попадании в топ-10
-            if self.confetti is not None:
-                # Запускаем конфетти когда анимация завершена
-                if self.animation_complete and not self.confetti_started:
-                    self.confetti.start()
-                    self.confetti_started = True
-                    if self.play_sound:
-                        self.play_sound('celebration')
-
-                # Обновляем и рисуем конфетти
-                if self.confetti_started:
-                    self.confetti.update()
-                    self.confetti.draw(self.screen)
-
-            # Single display update per frame (after all drawing)
-            pygame.display.update()
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    waiting = False
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.MOUSEBUTTONDOWN and self.animation_complete:
-                    pos = event.pos
-                    # Check close button
-                    if close_btn_screen.collidepoint(pos):
-                        self.close_pressed = True
-                    # Check new game button
-                    elif new_game_btn_screen.collidepoint(pos):
-                        self.new_game_pressed = True
-                elif event.type == pygame.MOUSEBUTTONUP and self.animation_complete:
-                    pos = event.pos
-                    # Check close button release - return to menu
-                    if self.close_pressed and close_btn_screen.collidepoint(pos):
-                        waiting = False
-                        result = 'menu'
-                    # Check new game button release - start new game
-                    elif self.new_game_pressed and new_game_btn_screen.collidepoint(pos):
-                        waiting = False
-                        result = 'new_game'
-                    # Reset pressed states
-                    self.close_pressed = False
-                    self.new_game_pressed = False
-                elif event.type == pygame.KEYDOWN and self.animation_complete:
-                    if event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                        waiting = False
-                        result = 'new_game'
-
-            pygame.time.delay(16)  # ~60 FPS
-
-        return result
+        self.close_btn_screen = close_btn_rect.move(self.window_x, self.window_y)
+        perf_hud.mark('draw_window')
+
+        if self.confetti_started:
+            self.confetti.draw(self.screen)
+            perf_hud.mark('confetti')
+
+    def _on_async_result(self, event):
+        """Show the world position once the submitted score is in the leaderboard."""
+        if not self.score_sent:
+            return
+        if event.kind == 'score_submitted' and event.success:
+            leaderboard.refresh(force=True)
+        elif event.kind == 'leaderboard_updated':
+            player = (leaderboard.get_cached() or {}).get('player')
+            # Обновление, начатое до отправки, ещё не знает нового результата
+            if player and player.get('score', 0) >= self.total_score:
+                self.world_position = player['position']
+
+    def handle_event(self, event):
+        """Buttons work once the animation is complete."""
+        if event.type == main_thread.ASYNC_RESULT_EVENT:
+            self._on_async_result(event)
+            return True
+        if not self.animation_complete:
+            return True
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            pos = event.pos
+            # Check close button
+            if self.close_btn_screen.collidepoint(pos):
+                self.close_pressed = True
+            # Check new game button
+            elif self.new_game_btn_screen.collidepoint(pos):
+                self.new_game_pressed = True
+        elif event.type == pygame.MOUSEBUTTONUP:
+            pos = event.pos
+            # Check close button release - return to menu
+            if self.close_pressed and self.close_btn_screen.collidepoint(pos):
+                self.finish('menu')
+            # Check new game button release - start new game
+            elif self.new_game_pressed and self.new_game_btn_screen.collidepoint(pos):
+                self.finish('new_game')
+            # Reset pressed states
+            self.close_pressed = False
+            self.new_game_pressed = False
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
+                self.finish('new_game')
+        return True
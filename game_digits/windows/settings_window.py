@@ -1,22 +1,62 @@
 """Settings window for game configuration."""
 import pygame
 
-from game_digits import get_font_path
+from game_digits import fonts
 from game_digits import ui_components as ui
 from game_digits import settings
 from game_digits import scale
+from game_digits import scenes
 
 
-class SettingsWindow:
+class SettingsWindow(scenes.Overlay):
     """Modal window for game settings.
 
+    Finishes with 'apply' if the size changed (the app rescales in place)
+    or 'close' if closed without changes or only the speed changed.
+
     Args:
         screen: Pygame screen surface
         screen_size: Tuple (width, height) of the screen
-        redraw_callback: Function to call to redraw background
+        background: Frame to show under the window (None - the scene below)
+        redraw_background: Draws that frame again after the window was resized
+            (None - a still frame of the scene below)
     """
 
-    def __init__(self, screen, screen_size, redraw_callback):
+    name = 'settings'
+
+    def __init__(self, screen, screen_size, background=None, redraw_background=None):
+        self.background = background
+        self.redraw_background = redraw_background
+        self._init_layout(screen, screen_size)
+
+        # State - size arrows
+        self.close_pressed = False
+        self.size_left_pressed = False
+        self.size_right_pressed = False
+        # State - speed arrows
+        self.speed_left_pressed = False
+        self.speed_right_pressed = False
+        self.apply_pressed = False
+
+        # Track if settings changed
+        self.original_size_preset = settings.get_current_preset()
+        self.original_speed_preset = settings.get_current_speed_preset()
+        self.size_changed = False
+        self.speed_changed = False
+
+        # Name input state
+        self.name_text = settings.get_player_name()
+        self.name_focused = False
+        self.name_cursor_visible = True
+        self.name_cursor_timer = 0
+        self.NAME_CURSOR_BLINK = 500  # ms
+        self.NAME_MAX_LENGTH = 20
+
+        # Animation state
+        self.animation_start_time = 0
+        self.FADE_IN_DURATION = 200  # ms
+
+    def _init_layout(self, screen, screen_size):
         # Window dimensions - computed at runtime (сохраняем при создании, чтобы не менялись при смене пресета)
         self.WINDOW_WIDTH = scale.scaled(380)
         self.WINDOW_HEIGHT = scale.scaled(420)  # Увеличено для поля имени
@@ -40,51 +80,22 @@ class SettingsWindow:
 
         self.screen = screen
         self.screen_width, self.screen_height = screen_size
-        self.redraw_callback = redraw_callback
 
         # Window position (centered)
         self.window_x = (self.screen_width - self.WINDOW_WIDTH) // 2
         self.window_y = (self.screen_height - self.WINDOW_HEIGHT) // 2
 
         # Load fonts
-        bold_font_path = get_font_path("2204.ttf")
-        self.title_font = pygame.font.Font(bold_font_path, scale.scaled(28))
-        self.label_font = pygame.font.Font(bold_font_path, scale.scaled(20))
-        self.value_font = pygame.font.Font(bold_font_path, scale.scaled(18))
-        self.button_font = pygame.font.Font(bold_font_path, scale.scaled(24))
+        self.title_font = fonts.get_font(fonts.BOLD_FONT, scale.scaled(28))
+        self.label_font = fonts.get_font(fonts.BOLD_FONT, scale.scaled(20))
+        self.value_font = fonts.get_font(fonts.BOLD_FONT, scale.scaled(18))
+        self.button_font = fonts.get_font(fonts.BOLD_FONT, scale.scaled(24))
 
         # Button dimensions
         self.arrow_btn_size = scale.scaled(36)
         self.apply_btn_width = self.WINDOW_WIDTH - 2 * self.PADDING
         self.apply_btn_height = scale.scaled(60)
 
-        # State - size arrows
-        self.close_pressed = False
-        self.size_left_pressed = False
-        self.size_right_pressed = False
-        # State - speed arrows
-        self.speed_left_pressed = False
-        self.speed_right_pressed = False
-        self.apply_pressed = False
-
-        # Track if settings changed
-        self.original_size_preset = settings.get_current_preset()
-        self.original_speed_preset = settings.get_current_speed_preset()
-        self.size_changed = False
-        self.speed_changed = False
-
-        # Name input state
-        self.name_text = settings.get_player_name()
-        self.name_focused = False
-        self.name_cursor_visible = True
-        self.name_cursor_timer = 0
-        self.NAME_CURSOR_BLINK = 500  # ms
-        self.NAME_MAX_LENGTH = 20
-
-        # Animation state
-        self.animation_start_time = 0
-        self.FADE_IN_DURATION = 200  # ms
-
     def _get_close_button_rect(self):
         """Get the close button rectangle."""
         return pygame.Rect(
@@ -306,10 +317,14 @@ class SettingsWindow:
         )
 
         # === Size setting row ===
+        size_name = settings.get_preset_name()
+        if settings.has_custom_scale() and not self.size_changed:
+            # Масштаб подобран под растянутое окно
+            size_name = f"{round(settings.get_scale() * 100)}%"
         self._draw_setting_row(
             window_surface,
             "Размер:",
-            settings.get_preset_name(),
+            size_name,
             self._get_size_row_y(),
             self.size_left_pressed,
             self.size_right_pressed
@@ -338,138 +353,130 @@ class SettingsWindow:
 
         return window_surface
 
-    def show(self):
-        """Show the settings window and handle events.
-
-        Returns:
-            'apply' if size changed and should restart
-            'close' if closed without changes or only speed changed
-            None if window was closed by X
-        """
-        clock = pygame.time.Clock()
-        running = True
+    def enter(self, manager):
+        super().enter(manager)
         self.animation_start_time = pygame.time.get_ticks()
+        self.fade_progress = 0.0
+
+    def relayout(self):
+        """Window of the new scale centered in the resized window."""
+        screen = pygame.display.get_surface()
+        self._init_layout(screen, screen.get_size())
+        if self.redraw_background is None:
+            super().relayout()
+            return
+        self.redraw_background()
+        self.background = screen.copy()
+        self._dimmed = None
+
+    def update(self, now):
+        """Fade-in and cursor blink."""
+        elapsed = now - self.animation_start_time
+        self.fade_progress = min(1.0, elapsed / self.FADE_IN_DURATION)
 
-        while running:
-            current_time = pygame.time.get_ticks()
-
-            # Calculate fade-in progress
-            elapsed = current_time - self.animation_start_time
-            fade_progress = min(1.0, elapsed / self.FADE_IN_DURATION)
-
-            # Cursor blink
-            if self.name_focused:
-                if current_time - self.name_cursor_timer > self.NAME_CURSOR_BLINK:
-                    self.name_cursor_visible = not self.name_cursor_visible
-                    self.name_cursor_timer = current_time
-
-            # Redraw background
-            self.redraw_callback()
-
-            # Draw semi-transparent overlay with fade-in
-            overlay_alpha = int(100 * fade_progress)
-            overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, overlay_alpha))
-            self.screen.blit(overlay, (0, 0))
-
-            # Draw window with fade-in
-            window_surface = self._draw_window_surface()
-            if fade_progress < 1.0:
-                window_surface.set_alpha(int(255 * fade_progress))
-            self.screen.blit(window_surface, (self.window_x, self.window_y))
-
-            pygame.display.flip()
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return None
-
-                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    pos = pygame.mouse.get_pos()
-
-                    # Check name input field click
-                    if self._get_name_input_rect().collidepoint(pos):
-                        self.name_focused = True
-                        self.name_cursor_visible = True
-                        self.name_cursor_timer = current_time
-                    else:
-                        self.name_focused = False
-
-                    # Check close button
-                    if self._get_close_button_rect().collidepoint(pos):
-                        self.close_pressed = True
-
-                    # Check size arrows
-                    elif self._get_size_left_rect().collidepoint(pos):
-                        self.size_left_pressed = True
-                        settings.prev_preset()
-                        self.size_changed = (settings.get_current_preset() != self.original_size_preset)
-
-                    elif self._get_size_right_rect().collidepoint(pos):
-                        self.size_right_pressed = True
-                        settings.next_preset()
-                        self.size_changed = (settings.get_current_preset() != self.original_size_preset)
-
-                    # Check speed arrows
-                    elif self._get_speed_left_rect().collidepoint(pos):
-                        self.speed_left_pressed = True
-                        settings.prev_speed()
-                        self.speed_changed = (settings.get_current_speed_preset() != self.original_speed_preset)
-
-                    elif self._get_speed_right_rect().collidepoint(pos):
-                        self.speed_right_pressed = True
-                        settings.next_speed()
-                        self.speed_changed = (settings.get_current_speed_preset() != self.original_speed_preset)
-
-                    # Check apply button
-                    elif self._get_apply_button_rect().collidepoint(pos):
-                        self.apply_pressed = True
-
-                elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-                    pos = pygame.mouse.get_pos()
-
-                    # Check close button release
-                    if self.close_pressed and self._get_close_button_rect().collidepoint(pos):
-                        # Restore original presets if changed but not applied
-                        if self.size_changed:
-                            settings.set_preset(self.original_size_preset)
-                        if self.speed_changed:
-                            settings.set_speed_preset(self.original_speed_preset)
-                        return 'close'
-
-                    # Check apply button release
-                    if self.apply_pressed and self._get_apply_button_rect().collidepoint(pos):
-                        # Save player name
-                        settings.set_player_name(self.name_text)
-                        # Size change requires restart, speed change doesn't
-                        if self.size_changed:
-                            return 'apply'
-                        else:
-                            return 'close'
-
-                    # Reset button states
-                    self.close_pressed = False
-                    self.size_left_pressed = False
-                    self.size_right_pressed = False
-                    self.speed_left_pressed = False
-                    self.speed_right_pressed = False
-                    self.apply_pressed = False
-
-                elif event.type == pygame.KEYDOWN and self.name_focused:
-                    if event.key == pygame.K_BACKSPACE:
-                        self.name_text = self.name_text[:-1]
-                    elif event.key == pygame.K_RETURN:
-                        self.name_focused = False
-                    elif event.key == pygame.K_ESCAPE:
-                        self.name_focused = False
-                    elif len(self.name_text) < self.NAME_MAX_LENGTH:
-                        # Add character if printable
-                        if event.unicode and event.unicode.isprintable():
-                            self.name_text += event.unicode
-                    # Reset cursor to visible on any keypress
-                    self.name_cursor_visible = True
-                    self.name_cursor_timer = current_time
-
-            clock.tick(60)
-
-        return 'close'
+        if self.name_focused:
+            if now - self.name_cursor_timer > self.NAME_CURSOR_BLINK:
+                self.name_cursor_visible = not self.name_cursor_visible
+                self.name_cursor_timer = now
+
+    def draw(self, screen):
+        # Semi-transparent overlay with fade-in over the still background
+        self.draw_background(screen, dim=int(100 * self.fade_progress))
+
+        # Draw window with fade-in
+        window_surface = self._draw_window_surface()
+        if self.fade_progress < 1.0:
+            window_surface.set_alpha(int(255 * self.fade_progress))
+        screen.blit(window_surface, (self.window_x, self.window_y))
+
+    def handle_event(self, event):
+        current_time = pygame.time.get_ticks()
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            pos = event.pos
+
+            # Check name input field click
+            if self._get_name_input_rect().collidepoint(pos):
+                self.name_focused = True
+                self.name_cursor_visible = True
+                self.name_cursor_timer = current_time
+            else:
+                self.name_focused = False
+
+            # Check close button
+            if self._get_close_button_rect().collidepoint(pos):
+                self.close_pressed = True
+
+            # Check size arrows
+            elif self._get_size_left_rect().collidepoint(pos):
+                self.size_left_pressed = True
+                settings.prev_preset()
+                self.size_changed = (settings.get_current_preset() != self.original_size_preset
+                                     or settings.has_custom_scale())
+
+            elif self._get_size_right_rect().collidepoint(pos):
+                self.size_right_pressed = True
+                settings.next_preset()
+                self.size_changed = (settings.get_current_preset() != self.original_size_preset
+                                     or settings.has_custom_scale())
+
+            # Check speed arrows
+            elif self._get_speed_left_rect().collidepoint(pos):
+                self.speed_left_pressed = True
+                settings.prev_speed()
+                self.speed_changed = (settings.get_current_speed_preset() != self.original_speed_preset)
+
+            elif self._get_speed_right_rect().collidepoint(pos):
+                self.speed_right_pressed = True
+                settings.next_speed()
+                self.speed_changed = (settings.get_current_speed_preset() != self.original_speed_preset)
+
+            # Check apply button
+            elif self._get_apply_button_rect().collidepoint(pos):
+                self.apply_pressed = True
+
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            pos = event.pos
+
+            # Check close button release
+            if self.close_pressed and self._get_close_button_rect().collidepoint(pos):
+                # Restore original presets if changed but not applied
+                if self.size_changed:
+                    settings.set_preset(self.original_size_preset)
+                if self.speed_changed:
+                    settings.set_speed_preset(self.original_speed_preset)
+                self.finish('close')
+                return True
+
+            # Check apply button release
+            if self.apply_pressed and self._get_apply_button_rect().collidepoint(pos):
+                # Save player name
+                settings.set_player_name(self.name_text)
+                # Size change needs a layout rebuild, speed change doesn't
+                self.finish('apply' if self.size_changed else 'close')
+                return True
+
+            # Reset button states
+            self.close_pressed = False
+            self.size_left_pressed = False
+            self.size_right_pressed = False
+            self.speed_left_pressed = False
+            self.speed_right_pressed = False
+            self.apply_pressed = False
+
+        elif event.type == pygame.KEYDOWN and self.name_focused:
+            if event.key == pygame.K_BACKSPACE:
+                self.name_text = self.name_text[:-1]
+            elif event.key == pygame.K_RETURN:
+                self.name_focused = False
+            elif event.key == pygame.K_ESCAPE:
+                self.name_focused = False
+            elif len(self.name_text) < self.NAME_MAX_LENGTH:
+                # Add character if printable
+                if event.unicode and event.unicode.isprintable():
+                    self.name_text += event.unicode
+            # Reset cursor to visible on any keypress
+            self.name_cursor_visible = True
+            self.name_cursor_timer = current_time
+
+        return True
@@ -1,15 +1,17 @@
 """Start menu for the game."""
-import sys
 import math
 import pygame
 
-from game_digits import get_font_path
+from game_digits import asset_cache
+from game_digits import scenes
+from game_digits import fonts
 from game_digits import scale
+from game_digits import settings
 from game_digits.constants import COLORS, TILE_BORDER_COLOR
 from game_digits import ui_components as ui
-from game_digits import records
+from game_digits import leaderboard
+from game_digits import main_thread
 from game_digits import ranks
-from game_digits.windows.settings_window import SettingsWindow
 
 
 class MenuTile:
@@ -28,9 +30,14 @@ class MenuTile:
         self.y_offset = 0  # For wave animation
         self.brightness = 0  # For hover effect (-1 to 1)
 
-        # Create tile surface
-        self.base_surface = pygame.Surface((scale.TILE_SIZE, scale.TILE_SIZE))
-        self._draw_tile(self.base_surface, self.color)
+        # Create tile surface (shared through the asset cache)
+        params = (self.letter, tuple(self.color), scale.TILE_SIZE, scale.TILE_FONT_SIZE)
+        self.base_surface = asset_cache.get_surface('menu_tile', params, self._render)
+
+    def _render(self):
+        surface = pygame.Surface((scale.TILE_SIZE, scale.TILE_SIZE))
+        self._draw_tile(surface, self.color)
+        return surface
 
     def _draw_tile(self, surface, color):
         """Draw the tile with letter."""
@@ -52,7 +59,7 @@ class MenuTile:
         pygame.draw.rect(surface, TILE_BORDER_COLOR, surface.get_rect(), 1)
 
         # Letter
-        font = pygame.font.Font(get_font_path("OpenSans-VariableFont_wdth,wght.ttf"), scale.TILE_FONT_SIZE)
+        font = fonts.get_font(fonts.TILE_FONT, scale.TILE_FONT_SIZE)
         text = font.render(self.letter, True, (0, 0, 0))
         text_rect = text.get_rect(center=(w // 2, h // 2))
         surface.blit(text, text_rect)
@@ -78,8 +85,14 @@ class MenuTile:
         surface.blit(self.get_surface(), (int(self.x), draw_y))
 
 
-class StartMenu:
-    """Start menu with animated title tiles."""
+class StartMenu(scenes.Scene):
+    """Start menu with animated title tiles.
+
+    Finishes with True when the game should start and 'settings_changed'
+    after a new size preset was applied.
+    """
+
+    name = 'menu'
 
     # Animation constants
     TILE_DELAY = 120  # ms between each tile animation start (slower)
@@ -100,10 +113,48 @@ class StartMenu:
     RECORDS_SLIDE_DURATION_CLOSE = 200  # ms for closing (faster)
 
     def __init__(self, screen, screen_size, redraw_background, test_mode=False):
-        self.screen = screen
-        self.screen_width, self.screen_height = screen_size
         self.redraw_background = redraw_background
         self.test_mode = test_mode
+        self.set_layout(screen, screen_size)
+
+        # State
+        self.state = 'entering'  # 'entering', 'idle', 'exiting'
+        self.animation_start_time = 0
+        self.button_pressed = False
+        self.records_button_pressed = False
+        self.settings_button_pressed = False
+        self.button_opacity = 0
+        self.tiles_arrived = [False] * len(self.tiles)
+
+        # Wave animation state
+        self.last_wave_time = 0
+        self.wave_active = False
+        self.wave_start_time = 0
+
+        # Hover state
+        self.button_hovered = False
+        self.records_button_hovered = False
+        self.settings_button_hovered = False
+
+        # Settings changed flag
+        self.settings_changed = False
+
+        # Records display state
+        self.show_records = False
+        self.records_slide_progress = 0  # 0 = hidden, 1 = fully visible
+        self.records_slide_start_time = 0
+        self.records_sliding = False
+        self.records_slide_direction = 1  # 1 = showing, -1 = hiding
+        self.cached_records = []
+
+        # Загружаем мировой рейтинг заранее, чтобы панель рекордов открылась с данными
+        if not self.test_mode:
+            leaderboard.refresh()
+
+    def set_layout(self, screen, screen_size):
+        """Fonts, title tiles and buttons for the current scale and window size."""
+        self.screen = screen
+        self.screen_width, self.screen_height = screen_size
 
         # Динамические размеры панели
         self.PANEL_WIDTH = scale.PANEL_WIDTH
@@ -111,20 +162,19 @@ class StartMenu:
         self.PANEL_HEIGHT = self.screen_height
 
         # Load fonts
-        bold_font_path = get_font_path("2204.ttf")
-        self.button_font = pygame.font.Font(bold_font_path, scale.FONT_MENU_BUTTON)
-        self.records_title_font = pygame.font.Font(bold_font_path, scale.FONT_MENU_RECORDS_TITLE)
-        self.records_font = pygame.font.Font(bold_font_path, scale.FONT_MENU_RECORDS)
-        self.records_small_font = pygame.font.Font(bold_font_path, scale.FONT_MENU_RECORDS_SMALL)
+        self.button_font = fonts.get_font(fonts.BOLD_FONT, scale.FONT_MENU_BUTTON)
+        self.records_title_font = fonts.get_font(fonts.BOLD_FONT, scale.FONT_MENU_RECORDS_TITLE)
+        self.records_font = fonts.get_font(fonts.BOLD_FONT, scale.FONT_MENU_RECORDS)
+        self.records_small_font = fonts.get_font(fonts.BOLD_FONT, scale.FONT_MENU_RECORDS_SMALL)
 
         # Fonts for records table (cached to avoid creating on every frame)
-        self.table_title_font = pygame.font.Font(bold_font_path, scale.scaled(32))
-        self.table_header_font = pygame.font.Font(bold_font_path, scale.scaled(16))
-        self.table_data_font = pygame.font.Font(bold_font_path, scale.scaled(20))
-        self.table_bold_font = pygame.font.Font(bold_font_path, scale.scaled(21))
-        self.table_date_font = pygame.font.Font(bold_font_path, scale.scaled(16))
-        self.table_pos_font = pygame.font.Font(bold_font_path, scale.scaled(16))
-        self.table_pos_font_large = pygame.font.Font(bold_font_path, scale.scaled(18))
+        self.table_title_font = fonts.get_font(fonts.BOLD_FONT, scale.scaled(32))
+        self.table_header_font = fonts.get_font(fonts.BOLD_FONT, scale.scaled(16))
+        self.table_data_font = fonts.get_font(fonts.BOLD_FONT, scale.scaled(20))
+        self.table_bold_font = fonts.get_font(fonts.BOLD_FONT, scale.scaled(21))
+        self.table_date_font = fonts.get_font(fonts.BOLD_FONT, scale.scaled(16))
+        self.table_pos_font = fonts.get_font(fonts.BOLD_FONT, scale.scaled(16))
+        self.table_pos_font_large = fonts.get_font(fonts.BOLD_FONT, scale.scaled(18))
 
         # Title letters and colors (using game tile colors)
         letters = ['Ц', 'И', 'Ф', 'Р', 'Ы']
@@ -180,36 +230,6 @@ class StartMenu:
             scale.RECORDS_BTN_HEIGHT
         )
 
-        # State
-        self.state = 'entering'  # 'entering', 'idle', 'exiting'
-        self.animation_start_time = 0
-        self.button_pressed = False
-        self.records_button_pressed = False
-        self.settings_button_pressed = False
-        self.button_opacity = 0
-        self.tiles_arrived = [False] * len(self.tiles)
-
-        # Wave animation state
-        self.last_wave_time = 0
-        self.wave_active = False
-        self.wave_start_time = 0
-
-        # Hover state
-        self.button_hovered = False
-        self.records_button_hovered = False
-        self.settings_button_hovered = False
-
-        # Settings changed flag
-        self.settings_changed = False
-
-        # Records display state
-        self.show_records = False
-        self.records_slide_progress = 0  # 0 = hidden, 1 = fully visible
-        self.records_slide_start_time = 0
-        self.records_sliding = False
-        self.records_slide_direction = 1  # 1 = showing, -1 = hiding
-        self.cached_records = []
-
     def _spring_physics(self, tile, index):
         """Apply spring physics to move tile to target position."""
         # Calculate spring force
@@ -470,7 +490,7 @@ class StartMenu:
         ])
 
         # Number in center
-        font = pygame.font.Font(get_font_path("2204.ttf"), size // 2)
+        font = fonts.get_font(fonts.BOLD_FONT, size // 2)
         num_text = font.render(str(number), True, (255, 255, 255))
         num_rect = num_text.get_rect(center=(center_x, center_y + 1))
         surface.blit(num_text, num_rect)
@@ -516,10 +536,14 @@ class StartMenu:
                         (scale.scaled(40), line_y),
                         (panel_width - scale.scaled(40), line_y), 2)
 
+        # Global standings footer (only from the cached leaderboard)
+        global_text = None if self.test_mode else self._global_standing_text()
+        footer_height = scale.scaled(30) if global_text else 0
+
         # Table area dimensions (for solid card background)
         padding = scale.scaled(12)
         table_top = scale.scaled(85)  # Increased gap from title
-        table_height = panel_height - table_top - scale.scaled(10)
+        table_height = panel_height - table_top - scale.scaled(10) - footer_height
         content_width = panel_width - 2 * padding
 
         # Draw soft shadow for table card (multiple layers)
@@ -576,7 +600,8 @@ class StartMenu:
             no_records_rect = no_records.get_rect(center=(panel_width // 2, panel_height // 2))
             panel_surface.blit(no_records, no_records_rect)
         else:
-            row_height = scale.scaled(45)
+            # Rows shrink a little when the global standings footer is shown
+            row_height = min(scale.scaled(45), (table_height - scale.scaled(47)) // 10)
             start_y = table_top + scale.scaled(42)
             stripe_width = scale.scaled(5)
 
@@ -663,6 +688,11 @@ class StartMenu:
                                     (padding + stripe_width + scale.scaled(10), div_y),
                                     (panel_width - padding - scale.scaled(5), div_y), 1)
 
+        if global_text:
+            footer = self.table_date_font.render(global_text, True, (110, 100, 90))
+            footer_rect = footer.get_rect(center=(panel_width // 2, panel_height - footer_height // 2 - scale.scaled(4)))
+            panel_surface.blit(footer, footer_rect)
+
         # Apply fade animation
         if self.records_slide_progress < 1:
             alpha = int(255 * self.records_slide_progress)
@@ -672,7 +702,24 @@ class StartMenu:
         self.screen.blit(panel_surface, (field_x, field_y))
 
 
-    def _draw(self):
+    def _global_standing_text(self):
+        """Строка мирового рейтинга из кэша leaderboard (None если данных нет)."""
+        data = leaderboard.get_cached()
+        if not data:
+            return None
+        parts = []
+        player = data.get('player')
+        if player:
+            place = f"Ваше место в мире: {player['position']}"
+            if data.get('total_players'):
+                place += f" из {data['total_players']}"
+            parts.append(place)
+        top = data.get('top')
+        if top:
+            parts.append(f"Лидер: {top[0].get('name', '?')} ({top[0].get('score', 0)})")
+        return "   ·   ".join(parts) or None
+
+    def draw(self, screen):
         """Draw the menu."""
         # Draw background
         self.redraw_background()
@@ -712,18 +759,24 @@ class StartMenu:
         if self.show_records or self.records_sliding:
             self._draw_records_panel()
 
-        pygame.display.update()
-
     def _open_settings(self):
-        """Open settings window."""
+        """Open settings window over the menu background."""
+        from game_digits.windows.settings_window import SettingsWindow
+
+        # Окно настроек лежит на фоне без плиток и кнопок меню
+        self.redraw_background()
         settings_window = SettingsWindow(
             self.screen,
             (self.screen_width, self.screen_height),
-            self.redraw_background
+            background=self.screen.copy(),
+            redraw_background=self.redraw_background
         )
-        result = settings_window.show()
+        self.manager.push(settings_window, on_finish=self._on_settings_closed)
+
+    def _on_settings_closed(self, result):
         if result == 'apply':
             self.settings_changed = True
+            self.finish('settings_changed')
 
     def _toggle_records(self):
         """Toggle records panel visibility."""
@@ -757,7 +810,11 @@ class StartMenu:
                 # Show records
                 self.show_records = True
                 self.records_slide_direction = 1
-                self.cached_records = records.load_records(self.test_mode)
+                from game_digits import records  # Not needed for the first frame
+                self.cached_records = records.load_records(self.test_mode, settings.get_board_size())
+                if not self.test_mode:
+                    # Фоновое обновление; панель показывает кэш без ожидания сети
+                    leaderboard.refresh()
 
     def reset_for_entry(self):
         """Reset tiles for entry animation (coming from left)."""
@@ -782,69 +839,74 @@ class StartMenu:
         self.state = 'exiting'
         self.animation_start_time = pygame.time.get_ticks()
 
-    def show(self):
-        """Display the menu and wait for user interaction.
-
-        Returns:
-            bool: True if user wants to start game, False to exit
-        """
+    def _skip_entry(self):
+        """Place tiles and button at once (menu rebuilt after a rescale)."""
         self.reset_for_entry()
+        for tile in self.tiles:
+            tile.x = tile.target_x
+        self.tiles_arrived = [True] * len(self.tiles)
+        self.button_opacity = 255
+        self.state = 'idle'
+        self.last_wave_time = pygame.time.get_ticks()
+
+    def start(self, animate_entry=True):
+        """Prepare the menu before it is pushed.
 
-        running = True
-        start_game = False
-
-        while running:
-            current_time = pygame.time.get_ticks()
-            mouse_pos = pygame.mouse.get_pos()
-
-            # Update animation
-            if self.state == 'entering':
-                self._update_entering(current_time)
-            elif self.state == 'idle':
-                self._update_wave_animation(current_time)
-                self._update_hover_effect(mouse_pos)
-                self._update_records_slide(current_time)
-            elif self.state == 'exiting':
-                if self._update_exiting(current_time):
-                    running = False
-                    start_game = True
-
-            # Draw
-            self._draw()
-
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.MOUSEBUTTONDOWN and self.state == 'idle':
-                    # Block start button when records are shown, but allow settings
-                    if self.button_rect.collidepoint(event.pos) and not self.show_records:
-                        self.button_pressed = True
-                    elif self.records_button_rect.collidepoint(event.pos):
-                        self.records_button_pressed = True
-                    elif self.settings_button_rect.collidepoint(event.pos):
-                        self.settings_button_pressed = True
-                elif event.type == pygame.MOUSEBUTTONUP:
-                    if self.button_pressed and self.button_rect.collidepoint(event.pos) and not self.show_records:
-                        self.start_exit_animation()
-                    elif self.records_button_pressed and self.records_button_rect.collidepoint(event.pos):
-                        self._toggle_records()
-                    elif self.settings_button_pressed and self.settings_button_rect.collidepoint(event.pos):
-                        self._open_settings()
-                        if self.settings_changed:
-                            return 'settings_changed'
-                    self.button_pressed = False
-                    self.records_button_pressed = False
-                    self.settings_button_pressed = False
-                elif event.type == pygame.KEYDOWN and self.state == 'idle':
-                    if event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                        if not self.show_records:
-                            self.start_exit_animation()
-                    elif event.key == pygame.K_ESCAPE and self.show_records:
-                        self._toggle_records()
-
-            pygame.time.delay(16)  # ~60 FPS
-
-        return start_game
+        Args:
+            animate_entry: Slide the title tiles in (False after a rescale)
+        """
+        if animate_entry:
+            self.reset_for_entry()
+        else:
+            self._skip_entry()
+
+    def relayout(self):
+        """Title tiles of the new layout (set_layout() by the app) stand in place."""
+        self._skip_entry()
+
+    def update(self, now):
+        """Advance the entry, wave, hover, records and exit animations."""
+        if self.state == 'entering':
+            self._update_entering(now)
+        elif self.state == 'idle':
+            self._update_wave_animation(now)
+            self._update_hover_effect(pygame.mouse.get_pos())
+            self._update_records_slide(now)
+        elif self.state == 'exiting':
+            if self._update_exiting(now):
+                self.finish(True)
+                return
+
+    def handle_event(self, event):
+        """Buttons of the menu and the records panel."""
+        if event.type == main_thread.ASYNC_RESULT_EVENT:
+            # Результат дошёл до сервера уже в меню: место в мире изменилось
+            if event.kind == 'score_submitted' and event.success and not self.test_mode:
+                leaderboard.refresh(force=True)
+        elif event.type == pygame.MOUSEBUTTONDOWN and self.state == 'idle':
+            # Block start button when records are shown, but allow settings
+            if self.button_rect.collidepoint(event.pos) and not self.show_records:
+                self.button_pressed = True
+            elif self.records_button_rect.collidepoint(event.pos):
+                self.records_button_pressed = True
+            elif self.settings_button_rect.collidepoint(event.pos):
+                self.settings_button_pressed = True
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if self.button_pressed and self.button_rect.collidepoint(event.pos) and not self.show_records:
+                self.start_exit_animation()
+            elif self.records_button_pressed and self.records_button_rect.collidepoint(event.pos):
+                self._toggle_records()
+            elif self.settings_button_pressed and self.settings_button_rect.collidepoint(event.pos):
+                self._open_settings()
+            self.button_pressed = False
+            self.records_button_pressed = False
+            self.settings_button_pressed = False
+        elif event.type == pygame.KEYDOWN and self.state == 'idle':
+            if event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
+                if not self.show_records:
+                    self.start_exit_animation()
+            elif event.key == pygame.K_ESCAPE and self.show_records:
+                self._toggle_records()
+        else:
+            return False
+        return True
@@ -2,34 +2,85 @@
 """Точка входа для игры 'Игра цифры'."""
 
 import sys
-import pygame
+
+
+def _get_board_size_arg():
+    """Размер поля из аргумента --board N (или --board=N), иначе None."""
+    for i, arg in enumerate(sys.argv):
+        if arg.startswith("--board="):
+            return arg.split("=", 1)[1]
+        if arg == "--board" and i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+    return None
+
+
+def _get_instrument_arg():
+    """Путь отчёта из --instrument=PATH ('' для --instrument), иначе None."""
+    for arg in sys.argv:
+        if arg == "--instrument":
+            return ""
+        if arg.startswith("--instrument="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+def _preload():
+    """Фоновая подгрузка того, что не нужно для первого кадра меню."""
+    import game_digits.windows.result_window  # noqa: F401 (SQLite, HTTP-клиент)
+    import game_digits.windows.settings_window  # noqa: F401
+    from game_digits import api_client
+    # Досылаем результаты, не отправленные в прошлых запусках
+    api_client.start()
 
 
 def main():
+    # Первым делом: от импорта startup отсчитывается --startup-trace
+    from game_digits import startup
+    if "--startup-trace" in sys.argv:
+        startup.enable_trace()
+
+    # Таймеры instrument подключаются декораторами при импорте модулей игры,
+    # поэтому включаем его до первого такого импорта
+    instrument_path = _get_instrument_arg()
+    if instrument_path is not None:
+        from game_digits import instrument
+        instrument.enable(instrument_path or None)
+
     # Check for test mode flag
     test_mode = "--test" in sys.argv or "-t" in sys.argv
 
-    while True:
-        if test_mode:
-            from game_digits.test_app import TestGameApp
-            app = TestGameApp()
-        else:
-            from game_digits.app import GameApp
-            app = GameApp()
-
-        result = app.run()
-
-        if result == 'restart':
-            # Settings changed - reinitialize
-            pygame.quit()
-            # Recalculate scaled values
-            from game_digits import scale
-            scale.recalculate()
-            # Reimport constants that depend on scale
-            from game_digits import constants
-            constants.recalculate()
-        else:
-            break
+    # Board size: 8, 10, 12, 16 or "marathon" boards 24, 32
+    board_size = _get_board_size_arg()
+    if board_size is not None:
+        from game_digits import settings
+        if not settings.set_board_size(board_size):
+            sizes = ", ".join(str(size) for size in settings.get_all_board_sizes())
+            print(f"Invalid board size: {board_size} (expected one of {sizes})")
+
+    startup.import_pygame()
+    startup.defer(_preload)
+
+    try:
+        _run_loop(test_mode)
+    finally:
+        # Дописываем очередь фоновых записей (рекорды, настройки, отправка)
+        from game_digits import io_executor, log
+        io_executor.shutdown(timeout=2.0)
+        log.flush()
+
+
+def _run_loop(test_mode):
+    # Смена масштаба в настройках применяется внутри приложения (apply_scale),
+    # поэтому приложение создаётся один раз
+    from game_digits import startup
+    if test_mode:
+        from game_digits.test_app import TestGameApp as App
+    else:
+        from game_digits.app import GameApp as App
+    startup.mark('import app')
+    app = App()
+    startup.mark('app init')
+    app.run()
 
 
 if __name__ == "__main__":
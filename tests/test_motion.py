@@ -0,0 +1,97 @@
+"""Tests for the analytic slide scheduler (game_digits.motion)."""
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+import pytest  # noqa: E402
+
+from game_digits import scale  # noqa: E402
+from game_digits.constants import grid_to_pixel  # noqa: E402
+from game_digits.motion import ARRIVAL, COLLISION, MotionScheduler  # noqa: E402
+
+BOARD_SIZE = 10
+SPEED = 0.5  # px/ms
+
+
+class FakeTile:
+    def __init__(self, cell):
+        self.position = cell
+        self.rect = pygame.Rect(grid_to_pixel(*cell), (scale.TILE_SIZE, scale.TILE_SIZE))
+
+    def __repr__(self):
+        return f"T{self.position}"
+
+
+def _board(tiles):
+    board = [[None] * BOARD_SIZE for _ in range(BOARD_SIZE)]
+    for tile in tiles:
+        row, col = tile.position
+        board[row][col] = tile
+    return board
+
+
+def _run(scheduler, board, frames):
+    events = []
+    for now in frames:
+        for event in scheduler.due_events(now, board):
+            events.append((event.kind, event.tile, event.time))
+        scheduler.interpolate(now)
+    return events
+
+
+def test_long_frame_keeps_collision_after_earlier_arrival():
+    short = FakeTile((0, 0))
+    left = FakeTile((5, 0))
+    right = FakeTile((5, BOARD_SIZE - 1))
+    board = _board([short, left, right])
+    scheduler = MotionScheduler()
+    scheduler.start(short, 'right', (0, 1), SPEED, 0)
+    scheduler.start(left, 'right', (5, BOARD_SIZE - 1), SPEED, 0)
+    scheduler.start(right, 'left', (5, 0), SPEED, 0)
+
+    step = grid_to_pixel(0, 1)[0] - grid_to_pixel(0, 0)[0]
+    arrival_time = step / SPEED
+    distance = grid_to_pixel(5, BOARD_SIZE - 1)[0] - grid_to_pixel(5, 0)[0] - scale.TILE_SIZE
+    collision_time = distance / (2 * SPEED)
+    assert arrival_time < collision_time
+
+    # Один длинный кадр содержит и прибытие, и более позднее столкновение
+    events = _run(scheduler, board, [16, 2000])
+
+    assert [(kind, tile) for kind, tile, _ in events] == [(ARRIVAL, short), (COLLISION, left)]
+    assert events[0][2] == pytest.approx(arrival_time)
+    assert events[1][2] == pytest.approx(collision_time)
+    assert len(scheduler) == 0
+
+
+def test_arrival_is_stamped_with_its_own_time():
+    tile = FakeTile((0, 0))
+    board = _board([tile])
+    scheduler = MotionScheduler()
+    scheduler.start(tile, 'down', (3, 0), SPEED, 100)
+
+    events = _run(scheduler, board, [5000])
+
+    end_time = 100 + (grid_to_pixel(3, 0)[1] - grid_to_pixel(0, 0)[1]) / SPEED
+    assert events == [(ARRIVAL, tile, pytest.approx(end_time))]
+    assert tile.rect.topleft == grid_to_pixel(3, 0)
+
+
+def test_spawn_on_passed_cell_does_not_collide_in_the_past():
+    tile = FakeTile((5, 0))
+    board = _board([tile])
+    scheduler = MotionScheduler()
+    scheduler.start(tile, 'right', (5, BOARD_SIZE - 1), SPEED, 0)
+
+    assert _run(scheduler, board, [16, 300, 600]) == []
+    x_before = tile.rect.x
+
+    # Плитка появилась на клетке, которую движущаяся уже прошла
+    board[5][1] = FakeTile((5, 1))
+    scheduler.invalidate()
+    events = _run(scheduler, board, [616, 5000])
+
+    end_time = (grid_to_pixel(5, BOARD_SIZE - 1)[0] - grid_to_pixel(5, 0)[0]) / SPEED
+    assert x_before > grid_to_pixel(5, 1)[0] + scale.TILE_SIZE
+    assert events == [(ARRIVAL, tile, pytest.approx(end_time))]